@@ -0,0 +1,15 @@
+"""
+ASGI entry point.
+
+Serve with an ASGI worker, e.g.
+  gunicorn Online_Course.asgi:application -k uvicorn.workers.UvicornWorker
+(`ASGI_ENABLED=true ./start.sh` does this).
+"""
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Online_Course.settings')
+# Route the poll endpoints to core/async_views.py (see settings.ASGI_ENABLED)
+os.environ.setdefault('ASGI_ENABLED', 'true')
+
+application = get_asgi_application()
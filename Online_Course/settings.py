@@ -83,6 +83,11 @@ DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
 if 'runserver' in sys.argv or 'runserver_plus' in sys.argv:
     DEBUG = True
 
+# Set by Online_Course/asgi.py. Under ASGI the poll-heavy JSON endpoints
+# (exam timer, completion and eligibility checks) are routed to the native
+# async views in core/async_views.py instead of holding a worker thread each.
+ASGI_ENABLED = os.environ.get('ASGI_ENABLED', 'false').lower() == 'true'
+
 # Parse ALLOWED_HOSTS from environment variable or use defaults
 ALLOWED_HOSTS_STR = os.environ.get('ALLOWED_HOSTS', '')
 if ALLOWED_HOSTS_STR:
@@ -127,7 +132,9 @@ except Exception:
 # Build middleware list. In development (DEBUG=True) we avoid inserting
 # SecurityMiddleware so that local runserver never enforces HTTPS or HSTS.
 _middleware = [
-    'whitenoise.middleware.WhiteNoiseMiddleware',  # Add WhiteNoise middleware
+    'core.middleware.RequestMetricsMiddleware',  # Per-view timings for /metrics/
+    'core.middleware.WhiteNoiseMiddleware',  # WhiteNoise, async-capable so ASGI requests stay on the event loop
+    'core.db_routing.ReplicaPinningMiddleware',  # Read-your-writes for replica reads
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -185,7 +192,9 @@ if DATABASE_URL:
     DATABASES = {
         'default': dj_database_url.config(
             default=DATABASE_URL,
-            conn_max_age=600,
+            # Persistent connections are per thread; under ASGI each request's
+            # sync work may run on a different thread, so they would leak
+            conn_max_age=0 if ASGI_ENABLED else 600,
             conn_health_checks=True,
         )
     }
@@ -193,10 +202,125 @@ else:
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
+            # SQLITE_PATH: e.g. a file on a persistent disk
+            'NAME': os.environ.get('SQLITE_PATH') or BASE_DIR / 'db.sqlite3',
         }
     }
 
+
+
+def _database_from_url(url):
+    """DATABASES entry for a URL; sqlite:///path works without dj_database_url."""
+    if url.startswith('sqlite:///'):
+        return {'ENGINE': 'django.db.backends.sqlite3', 'NAME': url[len('sqlite:///'):]}
+    import dj_database_url
+    return dj_database_url.parse(url, conn_max_age=0 if ASGI_ENABLED else 600, conn_health_checks=True)
+
+
+# Read replicas (comma-separated URLs, e.g. a second SQLite file locally).
+# Only views marked @read_only / code under use_replica() read from them; see
+# core/db_routing.py. REPLICA_PIN_SECONDS keeps a client on the primary after
+# it writes and should exceed the replication lag.
+DATABASE_REPLICAS = []
+for _n, _url in enumerate(u.strip() for u in os.environ.get('DATABASE_REPLICA_URLS', '').split(',')):
+    if _url:
+        DATABASES[f'replica{_n + 1}'] = {**_database_from_url(_url), 'TEST': {'MIRROR': 'default'}}
+        DATABASE_REPLICAS.append(f'replica{_n + 1}')
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', '5'))
+
+# Analytics database: with ANALYTICS_DATABASE_URL set (e.g.
+# sqlite:///analytics.sqlite3), the append-heavy event tables in
+# ANALYTICS_MODELS move off the primary; see core/db_routing.py.
+ANALYTICS_MODELS = [
+    label.strip().lower()
+    for label in os.environ.get(
+        'ANALYTICS_MODELS', 'core.videoplay,core.brochuredownload,core.examviolation,core.examanswer'
+    ).split(',')
+    if label.strip()
+]
+ANALYTICS_DATABASE = None
+if os.environ.get('ANALYTICS_DATABASE_URL'):
+    ANALYTICS_DATABASE = 'analytics'
+    DATABASES[ANALYTICS_DATABASE] = _database_from_url(os.environ['ANALYTICS_DATABASE_URL'])
+
+DATABASE_ROUTERS = ['core.db_routing.AnalyticsRouter', 'core.db_routing.ReplicaRouter']
+
+# SQLite with several workers: WAL, pragmas and BEGIN IMMEDIATE for writes
+# (core/db_backends/sqlite3). SQLITE_TUNED=false falls back to Django's stock
+# backend.
+if os.environ.get('SQLITE_TUNED', 'true').lower() == 'true':
+    for _db in DATABASES.values():
+        if _db['ENGINE'] == 'django.db.backends.sqlite3':
+            _db['ENGINE'] = 'core.db_backends.sqlite3'
+            _db.setdefault('OPTIONS', {})
+            _db['OPTIONS'].setdefault('transaction_mode', 'IMMEDIATE')
+
+# Shared cache, visible to every worker on the host. Defaults to files on local
+# disk (no extra services). For multiple hosts set CACHE_URL to
+# redis://host:6379/0 (needs the `redis` package) or memcached://host:11211
+# (needs `pymemcache`).
+CACHE_URL = os.environ.get('CACHE_URL', '')
+if CACHE_URL.startswith(('redis://', 'rediss://', 'unix://')):
+    _cache_backend = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_URL,
+    }
+elif CACHE_URL.startswith('memcached://'):
+    _cache_backend = {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': CACHE_URL[len('memcached://'):],
+    }
+else:
+    _cache_backend = {
+        # Django's file backend with an atomic add(), used for per-key locks
+        'BACKEND': 'core.cache.FileBasedCache',
+        'LOCATION': os.environ.get('CACHE_DIR', os.path.join(BASE_DIR, '.cache', 'django')),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+CACHES = {
+    'default': {
+        **_cache_backend,
+        'TIMEOUT': 300,
+        'KEY_PREFIX': 'vts',
+    }
+}
+
+# Session storage. Every authenticated request reads the session, so:
+# - 'cached_db' (default): read through the shared cache above, with the
+#   database as the durable copy. On several hosts this needs CACHE_URL
+#   pointing at Redis/Memcached, or a logout on one host isn't seen by others.
+# - 'signed_cookies': no server-side storage at all. Sessions must stay small
+#   (checkout details live on the pending CoursePayment, not in the session).
+#   Logging out cannot revoke a copied cookie before it expires.
+# - 'db': Django's default database sessions.
+SESSION_MODE = os.environ.get('SESSION_MODE', 'cached_db').lower()
+_SESSION_ENGINES = {
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+    'db': 'django.contrib.sessions.backends.db',
+}
+if SESSION_MODE not in _SESSION_ENGINES:
+    from django.core.exceptions import ImproperlyConfigured
+    raise ImproperlyConfigured(
+        f'SESSION_MODE must be one of {", ".join(_SESSION_ENGINES)}; got {SESSION_MODE!r}'
+    )
+SESSION_ENGINE = _SESSION_ENGINES[SESSION_MODE]
+
+# How long the first response to an Idempotency-Key is replayed for retries
+# (core/idempotency.py). Stored in the shared cache above.
+IDEMPOTENCY_KEY_TTL = int(os.environ.get('IDEMPOTENCY_KEY_TTL', 24 * 60 * 60))
+
+# Retention (manage.py archive_expired / restore_archive, core/retention.py).
+# RETENTION_DAYS overrides a policy's age per model, e.g.
+# "core.examanswer=180,core.videoplay=0" (0 disables that policy).
+ARCHIVE_DIR = os.environ.get('ARCHIVE_DIR') or BASE_DIR / 'archive'
+RETENTION_DAYS = {
+    label.strip().lower(): int(days)
+    for label, _, days in (
+        item.partition('=') for item in os.environ.get('RETENTION_DAYS', '').split(',') if item.strip()
+    )
+}
+
 # Security Settings - Production only (disabled in DEBUG mode for local dev)
 SECURE_SSL_REDIRECT = not DEBUG
 SECURE_HSTS_SECONDS = 31536000 if not DEBUG else 0  # 1 year in production
@@ -283,13 +407,12 @@ LOGIN_URL = 'login'
 LOGIN_REDIRECT_URL = 'home'
 LOGOUT_REDIRECT_URL = 'home'
 
-# First check if razorpay is available
-try:
-    import razorpay  # noqa: F401
-    RAZORPAY_PACKAGE_AVAILABLE = True
-except ImportError:
+# First check if razorpay is available. find_spec only locates the package;
+# importing it (and requests) is left to the payment views.
+import importlib.util
+RAZORPAY_PACKAGE_AVAILABLE = importlib.util.find_spec('razorpay') is not None
+if not RAZORPAY_PACKAGE_AVAILABLE:
     print('Warning: razorpay package not installed. Install it with: pip install razorpay')
-    RAZORPAY_PACKAGE_AVAILABLE = False
 
 # Razorpay Configuration
 RAZORPAY_SETTINGS = {
@@ -305,6 +428,13 @@ RAZORPAY_KEY_ID = RAZORPAY_SETTINGS['KEY_ID']
 RAZORPAY_KEY_SECRET = RAZORPAY_SETTINGS['KEY_SECRET']
 RAZORPAY_CURRENCY = RAZORPAY_SETTINGS['CURRENCY']
 
+# Request metrics exposed at /metrics/ in Prometheus text format.
+# Staff users can always read them; scrapers authenticate with
+# `Authorization: Bearer <METRICS_TOKEN>`. Leaving METRICS_TOKEN unset
+# restricts the endpoint to staff sessions.
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
 # Logging configuration
 LOGGING = {
     'version': 1,
@@ -2,7 +2,7 @@ from django import forms
 from django.contrib import admin
 from django.contrib import messages
 from django.db import transaction
-from django.db.models import Max
+from django.db.models import Max, Q
 from django.http import HttpResponseRedirect, HttpResponse
 from django.utils.html import format_html
 from django.urls import path
@@ -19,6 +19,9 @@ from .models import (
 )
 from .models_brochure import BrochureDownload
 from .admin_brochure import BrochureDownloadAdmin
+from .db_routing import pk_values, same_database, use_replica
+from . import item_analysis
+from .signals import deferred_question_invalidation
 from django.urls import path, reverse
 from django.shortcuts import render
 from django.forms import formset_factory
@@ -724,7 +727,7 @@ class CourseScheduleItemAdmin(admin.ModelAdmin):
 class ExamQuestionInline(admin.TabularInline):
     model = ExamQuestion
     extra = 0
-    fields = ('order', 'question_text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_answer', 'is_active')
+    fields = ('order', 'question_text', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_answer', 'topic', 'is_active')
     ordering = ['order']
 
 
@@ -768,11 +771,16 @@ class CourseExamAdmin(admin.ModelAdmin):
                 extra_context['bulk_questions_upload_url'] = bulk_url
             except Exception:
                 pass
+            exam = self.get_object(request, object_id)
+            if exam is not None and request.method == 'GET':
+                # Folds in only the attempts graded since the last view
+                stats = item_analysis.refresh(exam)
+                extra_context['item_analysis'] = item_analysis.report(stats, list(exam.questions.order_by('order', 'id')))
         return super().changeform_view(request, object_id, form_url, extra_context=extra_context)
 
     def bulk_questions_upload_view(self, request, object_id):
         """Bulk Q&A upload view: accepts CSV with columns:
-        order, question_text, option_a, option_b, option_c, option_d, correct_answer, explanation, is_active
+        order, question_text, option_a, option_b, option_c, option_d, correct_answer, explanation, topic, is_active
         """
         exam = get_object_or_404(CourseExam, pk=object_id)
 
@@ -790,14 +798,15 @@ class CourseExamAdmin(admin.ModelAdmin):
                 if not expected_fields.issubset(set(reader.fieldnames or [])):
                     self.message_user(
                         request,
-                        f'CSV must have columns: order, question_text, option_a, option_b, option_c, option_d, correct_answer, and optionally explanation, is_active.',
+                        f'CSV must have columns: order, question_text, option_a, option_b, option_c, option_d, correct_answer, and optionally explanation, topic, is_active.',
                         level=messages.ERROR
                     )
                     return HttpResponseRedirect(reverse('admin:core_courseexam_change', args=(exam.pk,)))
 
                 created = 0
                 errors = []
-                with transaction.atomic():
+                # One cache invalidation for the import, after it commits
+                with deferred_question_invalidation(), transaction.atomic():
                     for row_idx, row in enumerate(reader, start=2):  # start at 2 because header is row 1
                         try:
                             if not row.get('question_text', '').strip():
@@ -827,6 +836,7 @@ class CourseExamAdmin(admin.ModelAdmin):
                                 option_d=row.get('option_d', '').strip(),
                                 correct_answer=correct,
                                 explanation=row.get('explanation', '').strip() or '',
+                                topic=(row.get('topic') or '').strip()[:100],
                                 is_active=is_active
                             )
                             created += 1
@@ -855,8 +865,8 @@ class CourseExamAdmin(admin.ModelAdmin):
 
 @admin.register(ExamQuestion)
 class ExamQuestionAdmin(admin.ModelAdmin):
-    list_display = ('order', 'exam', 'question_text_short', 'correct_answer', 'is_active')
-    list_filter = ('exam__course', 'exam', 'is_active')
+    list_display = ('order', 'exam', 'question_text_short', 'correct_answer', 'topic', 'is_active')
+    list_filter = ('exam__course', 'exam', 'topic', 'is_active')
     search_fields = ('exam__course__name', 'question_text')
     list_editable = ('is_active',)
     fieldsets = (
@@ -870,7 +880,7 @@ class ExamQuestionAdmin(admin.ModelAdmin):
             'classes': ('wide',)
         }),
         ('Additional Info', {
-            'fields': ('explanation', 'is_active'),
+            'fields': ('explanation', 'topic', 'is_active'),
             'classes': ('collapse',)
         }),
     )
@@ -902,15 +912,15 @@ class ExamViolationInline(admin.TabularInline):
 
 @admin.register(ExamAttempt)
 class ExamAttemptAdmin(admin.ModelAdmin):
-    list_display = ('course_access', 'attempt_number', 'is_submitted', 'score_percentage', 'is_passed', 'has_violations_display', 'submitted_at')
-    list_filter = ('is_submitted', 'is_passed', 'has_violations', 'submitted_at')
+    list_display = ('course_access', 'attempt_number', 'state', 'is_submitted', 'score_percentage', 'is_passed', 'has_violations_display', 'submitted_at')
+    list_filter = ('state', 'is_submitted', 'is_passed', 'has_violations', 'submitted_at')
     search_fields = ('course_access__user__email', 'course_access__course__name')
-    readonly_fields = ('started_at', 'submitted_at', 'time_taken_seconds', 'score_percentage', 'correct_answers', 'has_violations', 'violation_count')
+    readonly_fields = ('state', 'question_ids', 'answer_vector', 'started_at', 'submitted_at', 'time_taken_seconds', 'score_percentage', 'correct_answers', 'has_violations', 'violation_count')
     inlines = [ExamAnswerInline, ExamViolationInline]
     fieldsets = (
         (None, {'fields': ('course_access', 'attempt_number')}),
         ('Timing', {'fields': ('started_at', 'submitted_at', 'time_taken_seconds')}),
-        ('Results', {'fields': ('is_submitted', 'score_percentage', 'correct_answers', 'total_questions', 'is_passed')}),
+        ('Results', {'fields': ('state', 'is_submitted', 'score_percentage', 'correct_answers', 'total_questions', 'is_passed', 'question_ids', 'answer_vector')}),
         ('Security', {'fields': ('has_violations', 'violation_count')}),
     )
 
@@ -933,6 +943,22 @@ class ExamViolationAdmin(admin.ModelAdmin):
     list_filter = ('violation_type', 'auto_submitted', 'recorded_at')
     search_fields = ('attempt__course_access__user__email', 'attempt__course_access__course__name', 'description')
     readonly_fields = ('attempt', 'violation_type', 'violation_count', 'description', 'recorded_at', 'auto_submitted')
+
+    def get_search_fields(self, request):
+        if same_database(ExamViolation, ExamAttempt):
+            return self.search_fields
+        return ('description',)
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term and not same_database(ExamViolation, ExamAttempt):
+            # Student and course names are on the primary database
+            attempts = ExamAttempt.objects.filter(
+                Q(course_access__user__email__icontains=search_term)
+                | Q(course_access__course__name__icontains=search_term)
+            )
+            results |= queryset.filter(attempt__in=pk_values(attempts, ExamViolation))
+        return results, may_have_duplicates
     
     def has_add_permission(self, request):
         return False
@@ -1230,7 +1256,9 @@ class ExamCertificateAdmin(admin.ModelAdmin):
                 status=500
             )
         
-        # Prepare data for Excel
+        # Prepare data for Excel (an export can read from a replica)
+        with use_replica():
+            certificates = list(certificates)
         data = []
         for cert in certificates:
             violations = cert.get_violation_list()
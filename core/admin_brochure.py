@@ -3,6 +3,8 @@ from django.core.exceptions import PermissionDenied
 from django.http import HttpResponse
 import csv
 from datetime import datetime
+from .db_routing import same_database
+from .models import Course
 from .models_brochure import BrochureDownload
 
 @admin.register(BrochureDownload)
@@ -15,6 +17,18 @@ class BrochureDownloadAdmin(admin.ModelAdmin):
     actions = ['export_as_csv']
     list_per_page = 50  # Number of records per page
     list_select_related = ('course', 'brochure')  # Optimize queries
+
+    def get_list_select_related(self, request):
+        # No joins across databases when downloads live on the analytics one
+        if same_database(BrochureDownload, Course):
+            return self.list_select_related
+        return ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if same_database(BrochureDownload, Course):
+            return queryset
+        return queryset.prefetch_related('course', 'brochure')
     
     def get_actions(self, request):
         actions = super().get_actions(request)
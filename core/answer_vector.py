@@ -0,0 +1,92 @@
+"""
+Compact answer storage for exam attempts.
+
+An attempt's answers live in `ExamAttempt.answer_vector`: one character
+per question of the attempt, in the attempt's question order, holding the
+selected option ('A'-'D') or UNANSWERED. For a 150-question exam that is a
+150-character string on the attempt row instead of 150 `ExamAnswer` rows:
+
+- saving an answer is one UPDATE that splices a character into the string
+  in SQL, so concurrent saves of different questions don't overwrite each
+  other;
+- grading compares the string with the answer key, character by character.
+
+Positions refer to `ExamAttempt.question_ids`, the attempt's questions as
+drawn when it started. That list never changes afterwards, so adding,
+reordering or deactivating questions mid-exam can't move a saved answer
+onto another question. Attempts from before the list existed fall back to
+drawing it from the current pool.
+
+`ExamAnswer` rows are still written once, when the attempt is graded, so
+the admin inlines, retention and reporting keep reading them. Attempts
+started before the vector existed have rows but an empty vector;
+`load_vector` rebuilds it from the rows.
+"""
+
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
+
+from .attempt_state import OPEN_STATES
+from .models import ExamAnswer, ExamAttempt
+from .question_pool import attempt_pool, question_pool, sample
+
+UNANSWERED = '-'
+OPTIONS = 'ABCD'
+
+
+def draw_questions(exam, count, seed):
+    """Ids of the questions a new attempt gets, in its question order (see core/question_pool.py)."""
+    return [qid for qid, _, _ in sample(question_pool(exam), count, seed)]
+
+
+def attempt_questions(attempt, exam):
+    """Ids of `attempt`'s questions, in the attempt's question order."""
+    if attempt.question_ids:
+        return list(attempt.question_ids)
+    return [qid for qid, _, _ in attempt_pool(attempt, exam)]
+
+
+def empty_vector(length):
+    return UNANSWERED * length
+
+
+def vector_from_rows(attempt, question_ids):
+    """Answer vector built from the attempt's `ExamAnswer` rows."""
+    selected = dict(ExamAnswer.objects.filter(attempt=attempt).values_list('question_id', 'selected_answer'))
+    return ''.join(selected.get(qid) or UNANSWERED for qid in question_ids)
+
+
+def load_vector(attempt, question_ids):
+    """The attempt's answer vector, padded or cut to `question_ids`."""
+    vector = attempt.answer_vector or vector_from_rows(attempt, question_ids)
+    return vector[:len(question_ids)].ljust(len(question_ids), UNANSWERED)
+
+
+def answers_by_question(vector, question_ids):
+    """{question id: selected option or ''} for a vector."""
+    return {qid: (option if option != UNANSWERED else '') for qid, option in zip(question_ids, vector)}
+
+
+def save_answer(attempt, question_ids, question_id, option):
+    """Store `option` ('' clears it) for `question_id`.
+
+    `question_id` must be one of `question_ids`. Returns False if the
+    attempt has been graded since it was loaded: the UPDATE only applies to
+    open attempts, so a late save can't change a graded vector.
+    """
+    position = question_ids.index(question_id)
+    open_attempt = ExamAttempt.objects.filter(pk=attempt.pk, state__in=OPEN_STATES)
+    if not attempt.answer_vector:
+        # Attempt from before the vector: move its answers over first
+        attempt.answer_vector = load_vector(attempt, question_ids)
+        open_attempt.filter(answer_vector='').update(answer_vector=attempt.answer_vector)
+    return bool(open_attempt.update(answer_vector=Concat(
+        Substr(F('answer_vector'), 1, position),
+        Value(option or UNANSWERED),
+        Substr(F('answer_vector'), position + 2),
+    )))
+
+
+def grade_vector(vector, key):
+    """Per-question correctness of `vector` against the answer key."""
+    return [option != UNANSWERED and option == correct for option, correct in zip(vector, key)]
@@ -0,0 +1,196 @@
+"""
+Async versions of the poll-heavy JSON endpoints.
+
+The exam portal polls `exam_time_left` every few seconds and the course page
+polls the completion and eligibility checks; each call is a few short queries.
+Under WSGI every poll holds a worker thread while it waits on the database.
+When the app is served through `Online_Course/asgi.py` (settings.ASGI_ENABLED)
+`core/urls.py` routes these URLs here instead, so one process can keep
+thousands of exam clients waiting on the event loop.
+
+The responses match the sync views in `views.py` and `exam_views.py`.
+"""
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.http import Http404, HttpResponseNotAllowed, JsonResponse
+from django.utils import timezone
+
+from .attempt_state import finalize
+from .exam_views import _exam_question_meta, _remaining_seconds
+from .models import (
+    Course, CourseAccess, CourseExam, CourseProgress, CourseScheduleItem, ExamAttempt, VideoPlay,
+)
+
+
+def _async_login_required(methods=None):
+    """`login_required` (+ `require_http_methods`) for async views.
+
+    Django 4.2's decorators only wrap sync views, and `request.user` is a
+    lazy object that loads the session and user synchronously, so it is
+    resolved in a thread before the view runs.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if methods and request.method not in methods:
+                return HttpResponseNotAllowed(methods)
+            is_authenticated = await sync_to_async(lambda: request.user.is_authenticated)()
+            if not is_authenticated:
+                return redirect_to_login(request.get_full_path())
+            return await view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def _aget_object_or_404(queryset, **kwargs):
+    try:
+        return await queryset.aget(**kwargs)
+    except queryset.model.DoesNotExist:
+        raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+
+
+@_async_login_required(methods=['GET'])
+async def exam_time_left(request, attempt_id):
+    """Async `exam_views.exam_time_left`."""
+    attempt = await _aget_object_or_404(
+        ExamAttempt.objects.select_related('course_access__course__exam'),
+        id=attempt_id, course_access__user=request.user,
+    )
+    exam = attempt.course_access.course.exam
+
+    if not attempt.is_submitted:
+        remaining = _remaining_seconds(attempt, timezone.now())
+        if remaining <= 0:
+            # Time is up: grade server-side (rare, so a thread is fine)
+            await sync_to_async(finalize)(attempt)
+            return JsonResponse({'remaining_seconds': 0, 'is_submitted': True})
+    else:
+        remaining = 0
+
+    # Shared-cache hit on nearly every poll; the cache backends are sync
+    qmeta = await sync_to_async(_exam_question_meta)(exam)
+    meta = {
+        'exam_active': exam.is_active,
+        'exam_updated_at': (exam.updated_at.isoformat() if exam.updated_at else None),
+        'questions_updated_at': qmeta['updated_at'],
+        'questions_count': int(attempt.total_questions or qmeta['total']),
+        'duration_minutes': attempt.duration_minutes or exam.duration_minutes,
+    }
+    return JsonResponse({'remaining_seconds': remaining, 'is_submitted': attempt.is_submitted, **meta})
+
+
+@_async_login_required()
+async def exam_check_eligibility(request, course_id):
+    """Async `exam_views.exam_check_eligibility`."""
+    course = await _aget_object_or_404(Course.objects.select_related('exam'), pk=course_id)
+    access = await _aget_object_or_404(
+        CourseAccess.objects.select_related('_progress'),
+        user=request.user, course=course, is_active=True,
+    )
+
+    progress = access._progress if hasattr(access, '_progress') else None
+    course_item_ids = {
+        item_id async for item_id in CourseScheduleItem.objects.filter(
+            day__course=course, is_active=True,
+        ).order_by().values_list('id', flat=True)
+    }
+    try:
+        watched_set = set(int(x) for x in (progress.completed_lessons if progress else []))
+    except Exception:
+        watched_set = set()
+    total_items = len(course_item_ids)
+    watched_items = len(course_item_ids.intersection(watched_set))
+    all_watched = watched_items >= total_items and total_items > 0
+
+    exam = course.exam if hasattr(course, 'exam') else None
+    exam_eligible = all_watched and exam and exam.is_active
+
+    submitted_count = await ExamAttempt.objects.filter(course_access=access, is_submitted=True).acount()
+    passed = await ExamAttempt.objects.filter(course_access=access, is_passed=True).aexists()
+    remaining_attempts = (exam.max_attempts - submitted_count) if exam else 0
+
+    return JsonResponse({
+        'eligible': exam_eligible and not passed and remaining_attempts > 0,
+        'all_watched': all_watched,
+        'exam_active': exam and exam.is_active,
+        'remaining_attempts': max(0, remaining_attempts),
+        'already_passed': passed,
+        'attempts_used': submitted_count,
+        'attempts_allowed': exam.max_attempts if exam else 0,
+    })
+
+
+@_async_login_required()
+async def check_course_completion(request, course_id):
+    """Async `views.check_course_completion`."""
+    try:
+        course = await _aget_object_or_404(Course.objects.all(), id=int(course_id), is_active=True)
+        # Only used as sets/counts: drop the default ordering and its joins
+        items = CourseScheduleItem.objects.filter(day__course=course, is_active=True).order_by()
+
+        course_access = await CourseAccess.objects.filter(
+            user=request.user, course=course, is_active=True,
+        ).afirst()
+        if not course_access:
+            return JsonResponse({
+                'success': True,
+                'completed': 0,
+                'total': await items.acount(),
+                'progress_percentage': 0.0,
+                'all_watched': False,
+                'exam_eligible': False,
+                'ready_for_exam': False,
+            })
+
+        progress, _ = await CourseProgress.objects.aget_or_create(course_access=course_access)
+
+        course_video_set = {item_id async for item_id in items.values_list('id', flat=True)}
+        watched_set = {
+            int(item_id) async for item_id in VideoPlay.objects.filter(
+                user=request.user, course_item__in=course_video_set,
+            ).values_list('course_item', flat=True)
+        }
+
+        completed_count = len(course_video_set.intersection(watched_set))
+        total_items = len(course_video_set)
+        all_watched = (total_items > 0) and (completed_count == total_items)
+        progress_percentage = (completed_count / total_items * 100) if total_items > 0 else 0
+
+        if all_watched and not progress.ready_for_exam:
+            progress.ready_for_exam = True
+            progress.ready_for_exam_date = timezone.now()
+            await progress.asave()
+
+        exam = None
+        exam_eligible = False
+        passed = False
+        attempts = 0
+        attempts_remaining = 0
+        if all_watched:
+            exam = await CourseExam.objects.filter(course=course, is_active=True).afirst()
+        if exam:
+            passed = await ExamAttempt.objects.filter(course_access=course_access, is_passed=True).aexists()
+            attempts = await ExamAttempt.objects.filter(course_access=course_access, is_submitted=True).acount()
+            attempts_remaining = max(0, exam.max_attempts - attempts)
+            exam_eligible = not passed and attempts_remaining > 0
+
+        return JsonResponse({
+            'success': True,
+            'completed': completed_count,
+            'total': total_items,
+            'progress_percentage': round(progress_percentage, 2),
+            'all_watched': all_watched,
+            'exam_eligible': exam_eligible,
+            'ready_for_exam': bool(progress.ready_for_exam),
+            'attempts_used': attempts if all_watched and exam else 0,
+            'attempts_allowed': exam.max_attempts if exam else 0,
+            'attempts_remaining': attempts_remaining if all_watched and exam else (exam.max_attempts if exam else 0),
+            'passed_exam': passed if all_watched and exam else False,
+            'total_questions': await exam.questions.filter(is_active=True).acount() if exam else 0,
+            'exam_duration_minutes': exam.duration_minutes if exam else 120,
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
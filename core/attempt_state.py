@@ -0,0 +1,93 @@
+"""
+Lifecycle of an `ExamAttempt`: created -> in_progress -> graded.
+
+`exam_start` creates the attempt, the portal's first question load moves it
+to in_progress, and whichever of `exam_submit`, the `exam_time_left`
+auto-finalize or a violation auto-submit gets there first grades it.
+
+Every transition is a conditional UPDATE (`... WHERE id = %s AND state IN
+(...)`). The database applies it to at most one of several concurrent
+requests; the others update no rows and back off, so two tabs or a submit
+racing the timer never grade the same attempt twice. On PostgreSQL the
+losing UPDATE waits on the winner's row lock and then re-checks the state;
+SQLite serializes the writes with BEGIN IMMEDIATE.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import ExamAttempt
+
+CREATED = ExamAttempt.STATE_CREATED
+IN_PROGRESS = ExamAttempt.STATE_IN_PROGRESS
+GRADED = ExamAttempt.STATE_GRADED
+
+# Attempts that can still be graded
+OPEN_STATES = (CREATED, IN_PROGRESS)
+
+CREATE_RETRIES = 3
+
+
+def transition(attempt, sources, target, **changes):
+    """Move `attempt` from any of `sources` to `target`; return whether this call did.
+
+    `changes` are written in the same UPDATE and, like the new state, copied
+    onto `attempt` only when the row was updated.
+    """
+    changes['updated_at'] = timezone.now()
+    updated = ExamAttempt.objects.filter(pk=attempt.pk, state__in=sources).update(state=target, **changes)
+    if updated:
+        attempt.state = target
+        for field, value in changes.items():
+            setattr(attempt, field, value)
+    return bool(updated)
+
+
+def mark_in_progress(attempt):
+    """created -> in_progress, when the portal first loads the questions."""
+    if attempt.state != CREATED:
+        return False
+    return transition(attempt, [CREATED], IN_PROGRESS)
+
+
+def finalize(attempt):
+    """Grade `attempt` unless another request already has; return the grading result or None.
+
+    The claim and the grading share a transaction, so a failed grading
+    leaves the attempt open. When the claim is lost, `attempt` is refreshed
+    with the winner's results.
+
+    Answers are graded as they are once the claim is made: `attempt` was
+    loaded before it, so the vector is read again, and saves arriving
+    after the claim find the attempt graded and are refused
+    (`answer_vector.save_answer`).
+    """
+    from .exam_views import _finalize_and_grade_attempt
+
+    with transaction.atomic():
+        if not transition(attempt, OPEN_STATES, GRADED, is_submitted=True, submitted_at=timezone.now()):
+            attempt.refresh_from_db()
+            return None
+        attempt.answer_vector = ExamAttempt.objects.values_list('answer_vector', flat=True).get(pk=attempt.pk)
+        return _finalize_and_grade_attempt(attempt)
+
+
+def create_attempt(access, **fields):
+    """Create the next attempt of `access`; return (attempt, created).
+
+    Two tabs starting the exam at once pick the same attempt_number; the
+    loser's INSERT hits the unique constraint and gets the winner's open
+    attempt instead.
+    """
+    attempts = ExamAttempt.objects.filter(course_access=access)
+    for _ in range(CREATE_RETRIES):
+        last = attempts.aggregate(last=Max('attempt_number'))['last'] or 0
+        try:
+            with transaction.atomic():
+                return ExamAttempt.objects.create(course_access=access, attempt_number=last + 1, **fields), True
+        except IntegrityError:
+            existing = attempts.filter(state__in=OPEN_STATES).order_by('-attempt_number').first()
+            if existing:
+                return existing, False
+    raise IntegrityError(f'Could not allocate an attempt number for course access {access.pk}')
@@ -0,0 +1,199 @@
+"""
+Database backups for `manage.py backup_db` / `manage.py restore_db`.
+
+SQLite is copied with the online backup API a few hundred pages at a time,
+so writers only wait for one step rather than the whole copy, and the copy
+is a consistent snapshot (a plain file copy of a live database can be torn
+mid-transaction). The snapshot is integrity-checked, then gzipped as a
+stream into `db_backup_<timestamp>.sqlite3.gz` with a `.sha256` sidecar.
+
+Postgres is backed up by streaming `pg_dump --format=custom` straight to
+`db_backup_<timestamp>.dump`, which `pg_restore` reads back.
+"""
+
+import gzip
+import hashlib
+import os
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+SQLITE_SUFFIX = '.sqlite3.gz'
+POSTGRES_SUFFIX = '.dump'
+BACKUP_PREFIX = 'db_backup_'
+
+
+class BackupError(Exception):
+    pass
+
+
+def backup_name(suffix, now=None):
+    return f'{BACKUP_PREFIX}{(now or datetime.now()).strftime("%Y%m%d_%H%M%S")}{suffix}'
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_checksum(path):
+    Path(f'{path}.sha256').write_text(f'{_sha256(path)}  {Path(path).name}\n')
+
+
+def verify_checksum(path):
+    """Compare a backup with its `.sha256` sidecar; True when there is none."""
+    sidecar = Path(f'{path}.sha256')
+    if not sidecar.exists():
+        return True
+    return sidecar.read_text().split()[0] == _sha256(path)
+
+
+def integrity_check(path):
+    """Run `PRAGMA integrity_check` on a SQLite file; raise BackupError unless it is ok."""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        result = [row[0] for row in conn.execute('PRAGMA integrity_check')]
+    finally:
+        conn.close()
+    if result != ['ok']:
+        raise BackupError(f'Integrity check failed for {path}: {"; ".join(result[:5])}')
+
+
+def backup_sqlite(source, output_dir, pages=256, sleep=0.005, progress=None):
+    """Snapshot the SQLite database at `source` into `output_dir`; return the backup path.
+
+    `pages` is copied per step and `sleep` seconds pass between steps, when
+    the source is unlocked and writers can commit.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    target = output_dir / backup_name(SQLITE_SUFFIX)
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as tmp:
+        snapshot = Path(tmp) / 'snapshot.sqlite3'
+        src = sqlite3.connect(source)
+        dst = sqlite3.connect(snapshot)
+        try:
+            src.backup(dst, pages=pages, sleep=sleep, progress=progress)
+        finally:
+            dst.close()
+            src.close()
+        integrity_check(snapshot)
+
+        partial = Path(tmp) / target.name
+        with open(snapshot, 'rb') as raw, gzip.open(partial, 'wb', compresslevel=6) as packed:
+            shutil.copyfileobj(raw, packed, CHUNK_SIZE)
+        os.replace(partial, target)
+    _write_checksum(target)
+    return target
+
+
+def restore_sqlite(backup, target, pages=256, sleep=0.005):
+    """Replace the contents of the SQLite database at `target` with `backup`.
+
+    Accepts `.sqlite3.gz` backups and plain `.sqlite3` copies. The backup is
+    checksummed and integrity-checked before anything is written, and the
+    copy goes through the backup API, so connections that hold the target
+    open see the restored data instead of an unlinked file.
+    """
+    backup = Path(backup)
+    if not verify_checksum(backup):
+        raise BackupError(f'Checksum mismatch for {backup}')
+
+    with tempfile.TemporaryDirectory(dir=Path(target).parent) as tmp:
+        if backup.suffix == '.gz':
+            source = Path(tmp) / 'restore.sqlite3'
+            with gzip.open(backup, 'rb') as packed, open(source, 'wb') as raw:
+                shutil.copyfileobj(packed, raw, CHUNK_SIZE)
+        else:
+            source = backup
+        integrity_check(source)
+
+        src = sqlite3.connect(source)
+        dst = sqlite3.connect(target)
+        try:
+            src.backup(dst, pages=pages, sleep=sleep)
+        finally:
+            dst.close()
+            src.close()
+
+
+def _pg_env(settings_dict):
+    env = dict(os.environ)
+    if settings_dict.get('PASSWORD'):
+        env['PGPASSWORD'] = settings_dict['PASSWORD']
+    return env
+
+
+def _pg_args(settings_dict):
+    args = []
+    for flag, key in (('--host', 'HOST'), ('--port', 'PORT'), ('--username', 'USER')):
+        if settings_dict.get(key):
+            args += [flag, str(settings_dict[key])]
+    return args
+
+
+def backup_postgres(settings_dict, output_dir):
+    """Stream `pg_dump` of the database into `output_dir`; return the backup path."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    target = output_dir / backup_name(POSTGRES_SUFFIX)
+    partial = target.with_name(target.name + '.partial')
+
+    command = ['pg_dump', '--format=custom', '--no-owner', *_pg_args(settings_dict), settings_dict['NAME']]
+    try:
+        with open(partial, 'wb') as out:
+            proc = subprocess.run(command, stdout=out, stderr=subprocess.PIPE, env=_pg_env(settings_dict))
+    except FileNotFoundError:
+        partial.unlink(missing_ok=True)
+        raise BackupError('pg_dump not found; install the PostgreSQL client tools')
+    if proc.returncode:
+        partial.unlink(missing_ok=True)
+        raise BackupError(f'pg_dump failed: {proc.stderr.decode(errors="replace").strip()}')
+
+    # A dump whose table of contents can't be listed is unusable
+    check = subprocess.run(['pg_restore', '--list', str(partial)], capture_output=True)
+    if check.returncode:
+        partial.unlink(missing_ok=True)
+        raise BackupError(f'pg_restore could not read the dump: {check.stderr.decode(errors="replace").strip()}')
+    os.replace(partial, target)
+    _write_checksum(target)
+    return target
+
+
+def restore_postgres(backup, settings_dict):
+    if not verify_checksum(backup):
+        raise BackupError(f'Checksum mismatch for {backup}')
+    command = ['pg_restore', '--clean', '--if-exists', '--no-owner', '--single-transaction',
+               *_pg_args(settings_dict), '--dbname', settings_dict['NAME'], str(backup)]
+    try:
+        proc = subprocess.run(command, capture_output=True, env=_pg_env(settings_dict))
+    except FileNotFoundError:
+        raise BackupError('pg_restore not found; install the PostgreSQL client tools')
+    if proc.returncode:
+        raise BackupError(f'pg_restore failed: {proc.stderr.decode(errors="replace").strip()}')
+
+
+def list_backups(output_dir, suffix):
+    """Backups written by this module in `output_dir`, newest first."""
+    output_dir = Path(output_dir)
+    if not output_dir.is_dir():
+        return []
+    return sorted(output_dir.glob(f'{BACKUP_PREFIX}*{suffix}'), reverse=True)
+
+
+def prune_backups(output_dir, suffix, keep):
+    """Delete all but the newest `keep` backups (and their sidecars); return the removed paths."""
+    removed = []
+    for path in list_backups(output_dir, suffix)[keep:]:
+        path.unlink()
+        Path(f'{path}.sha256').unlink(missing_ok=True)
+        removed.append(path)
+    return removed
@@ -0,0 +1,287 @@
+"""
+Deterministic synthetic data for benchmarking.
+
+`BenchmarkDataGenerator` fills the database with production-shaped data using
+`bulk_create` only: users, courses with schedule days and items, exams with
+question banks, enrollments with progress, `VideoPlay` history, submitted
+exam attempts with answers, and certificates for passing attempts.
+
+The same seed always produces the same rows (timestamps excepted, since
+`auto_now_add` fields are set at insert time). Users are processed in chunks
+so memory stays flat no matter how many rows are generated.
+
+Used by `manage.py generate_benchmark_data` and the benchmark suite.
+"""
+
+import random
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .models import (
+    Course, CourseAccess, CourseExam, CoursePayment, CourseProgress,
+    CourseScheduleDay, CourseScheduleItem, ExamAnswer, ExamAttempt,
+    ExamCertificate, ExamQuestion, VideoPlay,
+)
+
+COURSE_SLUG_PREFIX = 'bench-course-'
+OPTIONS = 'ABCD'
+
+
+@dataclass
+class BenchmarkConfig:
+    users: int = 1000
+    courses: int = 3
+    days: int = 90
+    items_per_day: int = 3
+    questions: int = 150
+    question_count: int = 0
+    enrollments_per_user: int = 2
+    watch_fraction: float = 0.6
+    attempts_per_enrollment: int = 1
+    pass_rate: float = 0.5
+    violation_rate: float = 0.1
+    seed: int = 42
+    batch_size: int = 2000
+    chunk_users: int = 500
+    user_template: str = 'bench{n}@example.com'
+    password: str = 'bench-password'
+
+
+class BenchmarkDataGenerator:
+    """Create benchmark rows for a `BenchmarkConfig`.
+
+    `generate()` returns a dict of row counts per model.
+    """
+
+    def __init__(self, config, stdout=None):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.stdout = stdout
+        self.counts = {}
+        self.now = timezone.now()
+
+    # ------------------------------------------------------------------ utils
+
+    def _log(self, message):
+        if self.stdout is not None:
+            self.stdout.write(message)
+
+    def _bulk(self, model, objs):
+        if not objs:
+            return objs
+        created = model.objects.bulk_create(objs, batch_size=self.config.batch_size)
+        self.counts[model.__name__] = self.counts.get(model.__name__, 0) + len(created)
+        return created
+
+    # ---------------------------------------------------------------- catalog
+
+    def create_catalog(self):
+        """Create courses, schedules, exams and question banks."""
+        cfg = self.config
+        courses = self._bulk(Course, [
+            Course(
+                name=f'Benchmark Course {c + 1}',
+                slug=f'{COURSE_SLUG_PREFIX}{c + 1}',
+                description='Synthetic course for benchmarking',
+                original_price=Decimal('9999.00'),
+                discounted_price=Decimal('4999.00'),
+                order=1000 + c,
+            )
+            for c in range(cfg.courses)
+        ])
+        days = self._bulk(CourseScheduleDay, [
+            CourseScheduleDay(course=course, title=f'Day {d:02d}', order=d)
+            for course in courses
+            for d in range(1, cfg.days + 1)
+        ])
+        self._bulk(CourseScheduleItem, [
+            CourseScheduleItem(day=day, title=f'{day.title} - Lesson {i}', order=i,
+                               video_url='https://example.com/video', duration='12:00')
+            for day in days
+            for i in range(1, cfg.items_per_day + 1)
+        ])
+        exams = self._bulk(CourseExam, [
+            CourseExam(course=course, title=f'{course.name} Final Exam',
+                       question_count=cfg.question_count)
+            for course in courses
+        ])
+        self._bulk(ExamQuestion, [
+            ExamQuestion(
+                exam=exam,
+                question_text=f'{exam.course.name}: question {n}?',
+                option_a=f'Option A{n}', option_b=f'Option B{n}',
+                option_c=f'Option C{n}', option_d=f'Option D{n}',
+                correct_answer=self.rng.choice(OPTIONS),
+                explanation=f'Explanation for question {n}.',
+                order=n,
+            )
+            for exam in exams
+            for n in range(1, cfg.questions + 1)
+        ])
+
+        self.catalog = []
+        for course, exam in zip(courses, exams):
+            item_ids = list(CourseScheduleItem.objects.filter(day__course=course)
+                            .order_by('day__order', 'order').values_list('id', flat=True))
+            questions = list(exam.questions.order_by('order').values_list('id', 'correct_answer'))
+            if exam.question_count:
+                questions = questions[:exam.question_count]
+            self.catalog.append((course, exam, item_ids, questions))
+        self._log(f'Catalog: {len(courses)} courses, {len(days)} days, '
+                  f'{self.counts.get("CourseScheduleItem", 0)} items, '
+                  f'{self.counts.get("ExamQuestion", 0)} questions')
+
+    # ------------------------------------------------------------------ users
+
+    def create_users(self):
+        cfg = self.config
+        password = make_password(cfg.password)  # hash once, reuse for every user
+        for start in range(0, cfg.users, cfg.chunk_users):
+            stop = min(cfg.users, start + cfg.chunk_users)
+            with transaction.atomic():
+                self._create_user_chunk(range(start, stop), password)
+            self._log(f'Users {stop}/{cfg.users}')
+
+    def _create_user_chunk(self, indexes, password):
+        cfg = self.config
+        users = self._bulk(User, [
+            User(username=cfg.user_template.format(n=n), email=cfg.user_template.format(n=n),
+                 first_name=f'Bench {n}', password=password)
+            for n in indexes
+        ])
+
+        enrollments = []
+        for user in users:
+            picks = self.rng.sample(self.catalog, min(cfg.enrollments_per_user, len(self.catalog)))
+            enrollments.extend((user, entry) for entry in picks)
+
+        payments = self._bulk(CoursePayment, [
+            CoursePayment(
+                user=user, course=course, order_id=f'order_bench_{user.pk}_{course.pk}',
+                payment_id=f'pay_bench_{user.pk}_{course.pk}', amount=course.discounted_price,
+                first_name=user.first_name, last_name='Student', email=user.email,
+                phone='9000000000', address='Benchmark Street', city='Chennai',
+                state='TN', zip_code='600001', status='successful',
+            )
+            for user, (course, _, _, _) in enrollments
+        ])
+        accesses = self._bulk(CourseAccess, [
+            CourseAccess(user=user, course=course, payment=payment)
+            for (user, (course, _, _, _)), payment in zip(enrollments, payments)
+        ])
+
+        progresses = []
+        plays = []
+        for access, (user, (_, _, item_ids, _)) in zip(accesses, enrollments):
+            watched_count = int(len(item_ids) * cfg.watch_fraction)
+            watched = item_ids[:watched_count]
+            all_watched = bool(item_ids) and watched_count == len(item_ids)
+            progresses.append(CourseProgress(
+                course_access=access,
+                completed_lessons=watched,
+                progress_percentage=Decimal(round(watched_count * 100 / len(item_ids), 2)) if item_ids else 0,
+                ready_for_exam=all_watched,
+                ready_for_exam_date=self.now if all_watched else None,
+            ))
+            plays.extend(VideoPlay(user=user, course_item_id=item_id) for item_id in watched)
+        self._bulk(CourseProgress, progresses)
+        self._bulk(VideoPlay, plays)
+
+        self._create_attempts(accesses, enrollments)
+
+    # --------------------------------------------------------------- attempts
+
+    def _create_attempts(self, accesses, enrollments):
+        cfg = self.config
+        attempts = []
+        graded = []  # (attempt, [(question_id, selected, is_correct)])
+        for access, (user, (course, exam, _, questions)) in zip(accesses, enrollments):
+            for number in range(1, cfg.attempts_per_enrollment + 1):
+                passing = self.rng.random() < cfg.pass_rate
+                # Passing attempts answer ~90% correctly, failing ones ~50%
+                accuracy = 0.9 if passing else 0.5
+                answers = []
+                correct = 0
+                for question_id, key in questions:
+                    if self.rng.random() < accuracy:
+                        selected = key
+                    else:
+                        selected = self.rng.choice([o for o in OPTIONS if o != key])
+                    is_correct = selected == key
+                    correct += is_correct
+                    answers.append((question_id, selected, is_correct))
+                total = len(questions)
+                score = Decimal(correct * 100 / total).quantize(Decimal('0.01')) if total else Decimal('0')
+                taken = self.rng.randint(20 * 60, exam.duration_minutes * 60)
+                violations = self.rng.random() < cfg.violation_rate
+                attempt = ExamAttempt(
+                    course_access=access,
+                    attempt_number=number,
+                    state=ExamAttempt.STATE_GRADED,
+                    submitted_at=self.now,
+                    time_taken_seconds=taken,
+                    is_submitted=True,
+                    is_passed=score >= exam.passing_score,
+                    score_percentage=score,
+                    correct_answers=correct,
+                    total_questions=total,
+                    question_ids=[question_id for question_id, _ in questions],
+                    answer_vector=''.join(selected for _, selected, _ in answers),
+                    has_violations=violations,
+                    violation_count=1 if violations else 0,
+                    duration_minutes=exam.duration_minutes,
+                )
+                attempts.append(attempt)
+                graded.append((attempt, answers, user, course, access))
+
+        self._bulk(ExamAttempt, attempts)
+        self._bulk(ExamAnswer, [
+            ExamAnswer(attempt=attempt, question_id=question_id, selected_answer=selected, is_correct=is_correct)
+            for attempt, answers, _, _, _ in graded
+            for question_id, selected, is_correct in answers
+        ])
+        self._bulk(ExamCertificate, [
+            ExamCertificate(
+                exam_attempt=attempt,
+                student_name=user.first_name,
+                student_email=user.email,
+                course_name=course.name,
+                course_duration_days=cfg.days,
+                course_duration_months=Decimal(cfg.days / 30).quantize(Decimal('0.01')),
+                purchased_date=self.now,
+                joined_date=self.now,
+                exam_score_percentage=attempt.score_percentage,
+                correct_answers=attempt.correct_answers,
+                total_questions=attempt.total_questions,
+                exam_duration_taken_minutes=attempt.time_taken_seconds // 60,
+                exam_submitted_date=attempt.submitted_at,
+                has_violations=attempt.has_violations,
+                violation_count=attempt.violation_count,
+            )
+            for attempt, _, user, course, _ in graded
+            # Mirrors the post_save signal, which bulk_create does not fire
+            if attempt.score_percentage >= 80
+        ])
+
+    # ------------------------------------------------------------------- main
+
+    def generate(self):
+        self.create_catalog()
+        self.create_users()
+        return dict(self.counts)
+
+
+def delete_benchmark_data(user_template=BenchmarkConfig.user_template):
+    """Remove rows created by a previous run (matched by course slug and username)."""
+    prefix, _, suffix = user_template.partition('{n}')
+    users = User.objects.filter(username__startswith=prefix, username__endswith=suffix)
+    courses = Course.objects.filter(slug__startswith=COURSE_SLUG_PREFIX)
+    with transaction.atomic():
+        deleted_users, _ = users.delete()
+        deleted_courses, _ = courses.delete()
+    return deleted_users + deleted_courses
@@ -0,0 +1,144 @@
+"""
+Micro-benchmarks for the CPU-heavy paths of the core app.
+
+Each case is registered with `@benchmark(name)` and receives a
+`BenchmarkEnvironment` (seeded data from `core.benchmark_data`). A case
+function does its per-round setup and returns the callable to time; every
+round runs inside a transaction that is rolled back afterwards, so cases that
+write (grading, CSV import) start from the same state each time.
+
+Results are summarised per case (min/median/mean in milliseconds) and can be
+saved as a JSON baseline or compared against one. See
+`manage.py run_benchmarks --help`.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import django
+from django.db import connection, transaction
+from django.utils import timezone
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+# Baselines are machine-specific; refresh with --save when hardware changes
+DEFAULT_TOLERANCE = 0.5
+
+_registry = {}
+
+
+def benchmark(name, rounds=None):
+    """Register a benchmark case; `rounds` overrides the runner default."""
+    def decorator(func):
+        _registry[name] = (func, rounds)
+        return func
+    return decorator
+
+
+def registered_cases():
+    # Importing the cases module populates the registry
+    from . import cases  # noqa: F401
+    return dict(_registry)
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _time_round(case, env):
+    """Run one round of `case` in a rolled-back transaction and return seconds."""
+    elapsed = None
+    try:
+        with transaction.atomic():
+            run = case(env)
+            # Like timeit: keep collector pauses out of the measurement
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+            finally:
+                gc.enable()
+            raise _Rollback
+    except _Rollback:
+        pass
+    return elapsed
+
+
+def run_benchmarks(env, names=None, rounds=20, warmup=1, stdout=None):
+    """Time the selected cases and return a results dict keyed by case name."""
+    cases = registered_cases()
+    unknown = set(names or ()) - set(cases)
+    if unknown:
+        raise KeyError(f'Unknown benchmark(s): {", ".join(sorted(unknown))}')
+
+    results = {}
+    for name, (case, case_rounds) in cases.items():
+        if names and name not in names:
+            continue
+        for _ in range(warmup):
+            _time_round(case, env)
+        samples = [_time_round(case, env) for _ in range(case_rounds or rounds)]
+        results[name] = {
+            'rounds': len(samples),
+            'min_ms': round(min(samples) * 1000, 3),
+            'median_ms': round(statistics.median(samples) * 1000, 3),
+            'mean_ms': round(statistics.fmean(samples) * 1000, 3),
+        }
+        if stdout is not None:
+            stdout.write(f'{name:<32}{results[name]["min_ms"]:>12.3f} ms  (median {results[name]["median_ms"]:.3f})')
+    return results
+
+
+def environment_info(env):
+    return {
+        'created': timezone.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': f'{connection.vendor} {connection.Database.sqlite_version}'
+        if connection.vendor == 'sqlite' else connection.vendor,
+        'machine': platform.machine(),
+        'dataset': asdict(env.config),
+    }
+
+
+def save_baseline(path, results, env):
+    payload = {'environment': environment_info(env), 'results': results}
+    Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+
+def load_baseline(path):
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Compare best-of-N timings against a baseline.
+
+    The minimum is used rather than the median: it is the least sensitive to
+    scheduler noise, which matters for cases that run in a millisecond.
+    Returns a list of `(name, baseline_ms, current_ms, ratio, status)` rows
+    where status is 'regression' when the time grew by more than
+    `tolerance` (0.5 = 50%), 'improvement' when it shrank by as much,
+    'new' for cases missing from the baseline and 'ok' otherwise.
+    """
+    rows = []
+    base_results = baseline.get('results', {})
+    for name, current in results.items():
+        base = base_results.get(name)
+        if base is None:
+            rows.append((name, None, current['min_ms'], None, 'new'))
+            continue
+        ratio = current['min_ms'] / base['min_ms'] if base['min_ms'] else float('inf')
+        if ratio > 1 + tolerance:
+            status = 'regression'
+        elif ratio < 1 - tolerance:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append((name, base['min_ms'], current['min_ms'], ratio, status))
+    return rows
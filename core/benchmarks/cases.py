@@ -0,0 +1,73 @@
+"""
+Benchmark cases.
+
+Each case returns the callable to time; anything before the `return` is
+setup and is not measured.
+"""
+
+from django.contrib import admin
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory
+from django.urls import reverse
+
+from ..certificate_utils import export_certificates_to_excel
+from ..exam_views import _finalize_and_grade_attempt
+from ..models import CourseExam, CourseProgress, ExamCertificate
+from ..views import mark_video_watched
+from . import benchmark
+
+_factory = RequestFactory()
+
+
+@benchmark('grade_attempt')
+def grade_attempt(env):
+    """`_finalize_and_grade_attempt` on a fully answered 150-question attempt."""
+    attempt = env.new_attempt()
+    return lambda: _finalize_and_grade_attempt(attempt)
+
+
+@benchmark('mark_video_watched')
+def mark_video_watched_progress(env):
+    """Progress recomputation when a student finishes the next unwatched video."""
+    progress = CourseProgress.objects.get(course_access=env.access)
+    item_id = next(i for i in env.item_ids if i not in set(progress.completed_lessons))
+    request = _factory.post(reverse('mark_video_watched', args=[env.course.id, item_id]))
+    request.user = env.user
+    return lambda: mark_video_watched(request, env.course.id, item_id)
+
+
+@benchmark('update_progress')
+def update_progress(env):
+    """`CourseProgress.update_progress` for one newly completed lesson."""
+    progress = CourseProgress.objects.select_related('course_access__course').get(course_access=env.access)
+    item_id = next(i for i in env.item_ids if i not in set(progress.completed_lessons))
+    return lambda: progress.update_progress(item_id)
+
+
+@benchmark('export_certificates_to_excel')
+def export_certificate_rows(env):
+    """`certificate_utils.export_certificates_to_excel` over every certificate."""
+    certificates = ExamCertificate.objects.filter(is_active=True).order_by('-exam_submitted_date')
+    return lambda: export_certificates_to_excel(certificates)
+
+
+@benchmark('admin_certificate_excel', rounds=5)
+def admin_certificate_excel(env):
+    """ExamCertificateAdmin bulk Excel download (pandas + openpyxl)."""
+    model_admin = admin.site._registry[ExamCertificate]
+    certificates = ExamCertificate.objects.filter(is_active=True).order_by('-exam_submitted_date')
+    return lambda: model_admin._generate_excel_response(certificates, 'benchmark.xlsx')
+
+
+@benchmark('admin_questions_csv_import', rounds=5)
+def admin_questions_csv_import(env):
+    """CourseExamAdmin bulk question upload of a 500-row CSV."""
+    model_admin = admin.site._registry[CourseExam]
+    payload = env.questions_csv(500)
+    request = _factory.post('/admin/', {
+        'csv_file': SimpleUploadedFile('questions.csv', payload, content_type='text/csv'),
+    })
+    request.user = env.staff
+    request._messages = CookieStorage(request)
+    return lambda: model_admin.bulk_questions_upload_view(request, env.exam.pk)
@@ -0,0 +1,70 @@
+"""
+Seeded dataset shared by the benchmark cases.
+"""
+
+import csv
+import io
+import random
+
+from django.contrib.auth.models import User
+
+from ..benchmark_data import BenchmarkConfig, BenchmarkDataGenerator
+from ..models import CourseAccess, CourseScheduleItem, ExamAttempt
+
+# Big enough that per-row costs dominate, small enough to build in seconds
+# in the in-memory test database
+DEFAULT_DATASET = BenchmarkConfig(
+    users=300,
+    courses=2,
+    days=90,
+    items_per_day=3,
+    questions=150,
+    enrollments_per_user=1,
+    watch_fraction=0.6,
+    attempts_per_enrollment=1,
+    pass_rate=0.7,
+    seed=30,
+)
+
+
+class BenchmarkEnvironment:
+    """Generate the dataset once and hand out fixtures to benchmark cases."""
+
+    def __init__(self, config=DEFAULT_DATASET, stdout=None):
+        self.config = config
+        self.counts = BenchmarkDataGenerator(config, stdout=stdout).generate()
+        self.rng = random.Random(config.seed)
+
+        self.access = (CourseAccess.objects.select_related('user', 'course', 'course__exam', '_progress')
+                       .order_by('id').first())
+        self.user = self.access.user
+        self.course = self.access.course
+        self.exam = self.course.exam
+        self.item_ids = list(CourseScheduleItem.objects.filter(day__course=self.course)
+                             .order_by('day__order', 'order').values_list('id', flat=True))
+        self.questions = list(self.exam.questions.filter(is_active=True).order_by('order'))
+        self.staff = User.objects.create_user('bench-admin', 'bench-admin@example.com', config.password,
+                                              is_staff=True, is_superuser=True)
+
+    def new_attempt(self, answered=None):
+        """Create an in-progress attempt on `self.access` with random answers."""
+        questions = self.questions if answered is None else self.questions[:answered]
+        vector = ''.join(self.rng.choice('ABCD') for _ in questions)
+        return ExamAttempt.objects.create(
+            course_access=self.access,
+            attempt_number=ExamAttempt.objects.filter(course_access=self.access).count() + 1,
+            total_questions=len(self.questions),
+            duration_minutes=self.exam.duration_minutes,
+            answer_vector=vector.ljust(len(self.questions), '-'),
+        )
+
+    def questions_csv(self, rows=500):
+        """CSV in the format accepted by the admin bulk question upload."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['order', 'question_text', 'option_a', 'option_b', 'option_c', 'option_d',
+                         'correct_answer', 'explanation', 'is_active'])
+        for n in range(1, rows + 1):
+            writer.writerow([n, f'Imported question {n}?', f'A{n}', f'B{n}', f'C{n}', f'D{n}',
+                             'ABCD'[n % 4], f'Because {n}.', 'true'])
+        return buffer.getvalue().encode('utf-8')
@@ -0,0 +1,168 @@
+"""
+Shared cache helpers.
+
+`settings.CACHES` points at a cache every gunicorn worker can see: files on
+local disk by default, Redis or Memcached when CACHE_URL is set. This module
+provides:
+
+- `FileBasedCache`: Django's file backend with an atomic `add()`, so it can
+  act as a cross-process lock like the Redis and Memcached backends.
+- `get_or_compute()`: read-through caching that keeps a popular key expiring
+  mid-exam from sending every waiting request to the database at once.
+- `update_cached()`: change a value cached by `get_or_compute()` in place
+  instead of dropping it.
+
+A computation can read the database before a change and finish after it.
+So that it doesn't then cache what it read, `update_cached()` and
+`invalidate()` also replace the key's generation marker, and a
+computation only stores its value if the marker is the one it saw before
+it started.
+"""
+
+import math
+import os
+import random
+import tempfile
+import time
+
+from django.core.cache import cache as default_cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache as _FileBasedCache
+
+
+class FileBasedCache(_FileBasedCache):
+    """File-based cache whose `add()` is atomic across processes.
+
+    The stock `add()` checks `has_key()` and then writes, so two workers can
+    both "win". Here the entry is written to a temp file and hard-linked into
+    place; `os.link` fails if the target exists, so only one caller succeeds.
+    """
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._createdir()
+        fname = self._key_to_file(key, version)
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir)
+        try:
+            with open(fd, 'wb') as f:
+                self._write_content(f, timeout, value)
+            for _ in range(2):
+                try:
+                    os.link(tmp_path, fname)
+                    return True
+                except FileExistsError:
+                    if self.has_key(key, version):
+                        return False
+                    # An expired entry is still on disk: remove it and retry once
+                    self._delete(fname)
+            return False
+        finally:
+            os.remove(tmp_path)
+
+
+def _lock_key(key):
+    return f'{key}:lock'
+
+
+def _generation_key(key):
+    return f'{key}:generation'
+
+
+def _mark_changed(cache, keys):
+    cache.set_many({_generation_key(key): random.getrandbits(64) for key in keys}, None)
+
+
+def _store(cache, key, compute, timeout, locked=True):
+    try:
+        generation = cache.get(_generation_key(key))
+        start = time.monotonic()
+        value = compute()
+        delta = time.monotonic() - start
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = cache.default_timeout
+        expires_at = None if timeout is None else time.time() + timeout
+        # Changed while computing: the value may predate the change, so
+        # return it but leave the entry to the next read
+        if cache.get(_generation_key(key)) == generation:
+            cache.set(key, (value, delta, expires_at), timeout)
+        return value
+    finally:
+        if locked:
+            cache.delete(_lock_key(key))
+
+
+def get_or_compute(key, compute, timeout=DEFAULT_TIMEOUT, *, beta=1.0, lock_timeout=10,
+                   poll_interval=0.05, cache=None):
+    """Return the cached value for `key`, computing and storing it if needed.
+
+    Two mechanisms keep concurrent callers from recomputing the same value:
+
+    - Early recomputation ("XFetch"): each read may decide to refresh the
+      entry shortly before it expires, with a probability that grows as
+      expiry nears and with how long `compute` took (`beta` scales this).
+      Only the caller holding the per-key lock refreshes; the rest keep
+      serving the current value, so the entry rarely expires at all.
+    - Per-key lock on a miss: one caller computes while the others poll
+      the cache for up to `lock_timeout` seconds. If the holder dies or is too
+      slow, waiters compute the value themselves.
+
+    `compute` takes no arguments; its result (including None) is cached for
+    `timeout` seconds.
+    """
+    cache = cache or default_cache
+    entry = cache.get(key)
+    if entry is not None:
+        value, delta, expires_at = entry
+        if expires_at is None:
+            return value
+        # 1 - random() is in (0, 1], so log() is finite and <= 0
+        if time.time() - delta * beta * math.log(1.0 - random.random()) < expires_at:
+            return value
+        if not cache.add(_lock_key(key), 1, lock_timeout):
+            return value
+        return _store(cache, key, compute, timeout)
+
+    if cache.add(_lock_key(key), 1, lock_timeout):
+        return _store(cache, key, compute, timeout)
+
+    deadline = time.monotonic() + lock_timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+    # Don't release a lock this caller never held
+    return _store(cache, key, compute, timeout, locked=False)
+
+
+def update_cached(key, update, cache=None):
+    """Replace the value `get_or_compute` cached for `key` with `update(value)`.
+
+    Keeps the entry's expiry. Does nothing if nothing is cached. Updates
+    hold the key's lock so concurrent ones don't overwrite each other; if
+    it is taken (another update, or a recompute that may have read the
+    old data) the entry is dropped instead and recomputed on the next read.
+    Either way a computation still running won't store its value.
+    """
+    cache = cache or default_cache
+    _mark_changed(cache, [key])
+    if not cache.add(_lock_key(key), 1, 10):
+        cache.delete(key)
+        return
+    try:
+        entry = cache.get(key)
+        if entry is None:
+            return
+        value, delta, expires_at = entry
+        timeout = None if expires_at is None else expires_at - time.time()
+        if timeout is not None and timeout <= 0:
+            return
+        cache.set(key, (update(value), delta, expires_at), timeout)
+    finally:
+        cache.delete(_lock_key(key))
+
+
+def invalidate(*keys, cache=None):
+    """Drop cached values so the next `get_or_compute` recomputes them."""
+    cache = cache or default_cache
+    _mark_changed(cache, keys)
+    cache.delete_many(keys)
@@ -180,14 +180,16 @@ def get_certificate_stats():
     Returns:
         Dictionary with certificate statistics
     """
-    total = ExamCertificate.objects.count()
-    with_file = ExamCertificate.objects.exclude(certificate_file='').count()
-    without_file = total - with_file
-    with_violations = ExamCertificate.objects.filter(has_violations=True).count()
-    
-    # Average score
     from django.db.models import Avg
-    avg_score = ExamCertificate.objects.aggregate(Avg('exam_score_percentage'))['exam_score_percentage__avg'] or 0
+    from .db_routing import use_replica
+
+    # Reporting only; a replica's slight lag doesn't matter here
+    with use_replica():
+        total = ExamCertificate.objects.count()
+        with_file = ExamCertificate.objects.exclude(certificate_file='').count()
+        with_violations = ExamCertificate.objects.filter(has_violations=True).count()
+        avg_score = ExamCertificate.objects.aggregate(Avg('exam_score_percentage'))['exam_score_percentage__avg'] or 0
+    without_file = total - with_file
     
     return {
         'total_certificates': total,
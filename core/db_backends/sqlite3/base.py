@@ -0,0 +1,63 @@
+"""
+SQLite backend tuned for several gunicorn workers writing at once.
+
+Used instead of `django.db.backends.sqlite3` whenever the database is SQLite
+(see `Online_Course/settings.py`). It adds, per new connection:
+
+- WAL journaling, so readers never block the writer and vice versa;
+- `synchronous=NORMAL` (durable across app crashes; WAL makes it safe);
+- a `busy_timeout`, so a writer waits for the lock instead of failing;
+- a memory-mapped read path and a larger page cache.
+
+and starts every `atomic()` block with `BEGIN IMMEDIATE`. A deferred `BEGIN`
+takes the write lock only at the first write; if another connection wrote
+in between, SQLite fails the upgrade with "database is locked" at once, no
+matter the busy timeout. That is the read-then-write shape of
+`item_analysis.refresh()` (get_or_create, then update the stats row),
+`update_or_create()` of certificates in `certificate_utils`, and the
+admin bulk imports. Taking the lock up front makes writers queue on the
+busy timeout instead (`manage.py stress_sqlite` shows the difference).
+
+The OPTIONS keys `init_command` and `transaction_mode` match the ones
+Django 5.1 adds to its own backend, so on upgrade this module can go and
+the settings stay.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+DEFAULT_INIT_COMMAND = ';'.join([
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA mmap_size=268435456',  # 256 MB
+    'PRAGMA cache_size=-20000',  # 20 MB
+    'PRAGMA temp_store=MEMORY',
+])
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    def get_connection_params(self):
+        kwargs = super().get_connection_params()
+        # Ours, not sqlite3.connect()'s
+        kwargs.pop('init_command', None)
+        mode = kwargs.pop('transaction_mode', 'IMMEDIATE')
+        if mode not in (None, 'DEFERRED', 'IMMEDIATE', 'EXCLUSIVE'):
+            raise ImproperlyConfigured(
+                f"settings.DATABASES['{self.alias}']['OPTIONS']['transaction_mode'] must be "
+                f"DEFERRED, IMMEDIATE, EXCLUSIVE or None, not {mode!r}"
+            )
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        options = self.settings_dict['OPTIONS']
+        for statement in options.get('init_command', DEFAULT_INIT_COMMAND).split(';'):
+            if statement.strip():
+                conn.execute(statement)
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        mode = self.settings_dict['OPTIONS'].get('transaction_mode', 'IMMEDIATE')
+        self.cursor().execute(f'BEGIN {mode}' if mode else 'BEGIN')
@@ -0,0 +1,233 @@
+"""
+Read-replica routing.
+
+Reads go to `default` unless code has opted in: a view decorated with
+`@read_only`, or a block under `with use_replica():`. Inside those, the
+`ReplicaRouter` sends reads to one of `settings.DATABASE_REPLICAS` (picked at
+random per query) while writes always go to `default`.
+
+Replicas lag behind the primary, so a user who just changed something must
+not read the old value back. After any unsafe request (POST, PUT, PATCH,
+DELETE) `ReplicaPinningMiddleware` sets a short-lived cookie; while it is
+present, that user's requests read from `default` even in read-only views.
+Reads inside a transaction also stay on `default`.
+
+With no replicas configured every method returns `None`, i.e. Django's
+default routing.
+
+Separately, `AnalyticsRouter` keeps the append-heavy event tables
+(`settings.ANALYTICS_MODELS`) on `settings.ANALYTICS_DATABASE` when one is
+configured. SQL can't join across databases, so code that relates event rows
+to primary tables goes through `select_or_prefetch()` and `pk_values()`,
+which join or subquery when both sides share a database and fall back to a
+second query otherwise.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = 'db_pin'
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_pinned = ContextVar('pinned_to_primary', default=False)
+
+
+def replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+@contextmanager
+def use_replica():
+    """Let reads in this block go to a replica (unless the request is pinned)."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Force reads in this block to `default`, e.g. right after a write."""
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def read_only(view):
+    """Mark a view whose reads may be served by a replica.
+
+    Only for views that don't read-modify-write: any write still goes to
+    `default`, but it would have been computed from possibly stale rows.
+    """
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            with use_replica():
+                return await view(request, *args, **kwargs)
+    else:
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            with use_replica():
+                return view(request, *args, **kwargs)
+    return wrapper
+
+
+def analytics_database():
+    return getattr(settings, 'ANALYTICS_DATABASE', None)
+
+
+def is_analytics_model(model):
+    return bool(analytics_database()) and model._meta.label_lower in getattr(settings, 'ANALYTICS_MODELS', ())
+
+
+def same_database(model, other):
+    return is_analytics_model(model) == is_analytics_model(other)
+
+
+def select_or_prefetch(queryset, *fields):
+    """`select_related()` each forward FK in `fields` when its model shares the
+    queryset's database, `prefetch_related()` it otherwise."""
+    for name in fields:
+        if same_database(queryset.model, queryset.model._meta.get_field(name).related_model):
+            queryset = queryset.select_related(name)
+        else:
+            queryset = queryset.prefetch_related(name)
+    return queryset
+
+
+def pk_values(queryset, model):
+    """Primary keys of `queryset` for a `<fk>__in=` filter on `model`.
+
+    A subquery when both are on the same database, else an evaluated list.
+    """
+    if same_database(queryset.model, model):
+        return queryset.values('pk')
+    return list(queryset.values_list('pk', flat=True))
+
+
+class AnalyticsRouter:
+    """Event models live on the analytics database; everything else is left
+    to the next router."""
+
+    def _route(self, model, **hints):
+        alias = analytics_database()
+        if not alias:
+            return None
+        if is_analytics_model(model):
+            return alias
+        # e.g. answer.question: Django would otherwise follow the instance
+        # to the analytics database
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db == alias:
+            return DEFAULT_DB_ALIAS
+        return None
+
+    db_for_read = _route
+    db_for_write = _route
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Instances carry _meta too; type() would miss it on request.user's SimpleLazyObject
+        if is_analytics_model(obj1) or is_analytics_model(obj2):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        alias = analytics_database()
+        if not alias:
+            return None
+        is_event = f'{app_label}.{model_name}' in getattr(settings, 'ANALYTICS_MODELS', ())
+        if db == alias:
+            return is_event
+        return False if is_event else None
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        aliases = replicas()
+        if not aliases or not _replica_reads.get() or _pinned.get():
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return random.choice(aliases)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS if replicas() else None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as default
+        pool = {DEFAULT_DB_ALIAS, *replicas()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema through replication
+        if db in replicas():
+            return False
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """Read-your-writes: pin a client to `default` for a while after it writes.
+
+    The pin lasts `settings.REPLICA_PIN_SECONDS`, which should exceed the
+    usual replication lag.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    UNSAFE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.pin_seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _is_pinned(self, request):
+        try:
+            return float(request.COOKIES.get(PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def _pin(self, request, response):
+        if request.method in self.UNSAFE_METHODS and response.status_code < 500:
+            response.set_cookie(
+                PIN_COOKIE, f'{time.time() + self.pin_seconds:.0f}', max_age=self.pin_seconds,
+                httponly=True, samesite='Lax', secure=request.is_secure(),
+            )
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not replicas():
+            return self.get_response(request)
+        token = _pinned.set(self._is_pinned(request) or request.method in self.UNSAFE_METHODS)
+        try:
+            response = self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._pin(request, response)
+
+    async def __acall__(self, request):
+        if not replicas():
+            return await self.get_response(request)
+        token = _pinned.set(self._is_pinned(request) or request.method in self.UNSAFE_METHODS)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._pin(request, response)
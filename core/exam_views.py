@@ -2,13 +2,22 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods
-from django.db import transaction
-from django.db.models import Count, Max
+from django.db import IntegrityError, router, transaction
+from django.db.models import Count, F, Max
 from django.utils import timezone
 from datetime import timedelta
 import json
 from .models import Course, CourseAccess, CourseProgress, CourseExam, ExamAttempt, ExamAnswer, ExamQuestion, ExamViolation, Certificate, CourseScheduleItem
 from django.conf import settings
+from .answer_vector import (
+    OPTIONS, UNANSWERED, answers_by_question, attempt_questions, draw_questions, empty_vector, grade_vector,
+    load_vector, save_answer,
+)
+from .attempt_state import create_attempt, finalize, mark_in_progress
+from .cache import get_or_compute
+from .idempotency import idempotent
+from .question_pool import new_seed, question_pool
+from . import results_snapshot, score_distribution
 
 
 @login_required
@@ -120,12 +129,8 @@ def exam_start(request, course_id):
     if submitted_count >= exam.max_attempts:
         return JsonResponse({'error': 'No attempts remaining'}, status=400)
     
-    # Create new attempt
-    # attempt_number should be last attempt_number + 1
-    last_attempt = attempts.order_by('-attempt_number').first()
-    attempt_number = (last_attempt.attempt_number + 1) if last_attempt else 1
     # Determine how many questions should be included in this attempt.
-    active_q_count = exam.questions.filter(is_active=True).count()
+    active_q_count = len(question_pool(exam))
     # If exam.question_count is 0, it means use all active questions. Otherwise use the configured count.
     configured_count = (exam.question_count or 0)
     if configured_count and configured_count > 0:
@@ -133,11 +138,17 @@ def exam_start(request, course_id):
     else:
         use_count = active_q_count
 
-    attempt = ExamAttempt.objects.create(
-        course_access=access,
-        attempt_number=attempt_number,
+    # Create new attempt; a concurrent start from another tab gets the same one.
+    # When the exam uses fewer questions than it has, each attempt draws its own.
+    # The drawn ids are stored, so later edits to the exam don't change them.
+    seed = new_seed() if use_count < active_q_count else None
+    attempt, _ = create_attempt(
+        access,
+        question_seed=seed,
+        question_ids=draw_questions(exam, use_count, seed),
         total_questions=use_count,
-        duration_minutes=exam.duration_minutes  # Capture exam duration at time of attempt creation
+        duration_minutes=exam.duration_minutes,  # Capture exam duration at time of attempt creation
+        answer_vector=empty_vector(use_count),
     )
     
     return redirect('exam_portal', attempt_id=attempt.id)
@@ -145,29 +156,69 @@ def exam_start(request, course_id):
 
 @login_required
 def exam_portal(request, attempt_id):
-    """Full-screen exam portal."""
+    """Full-screen exam portal.
+
+    The page embeds everything it needs to start (questions, saved answers
+    and the server's remaining time) as one JSON bootstrap, so opening or
+    resuming an exam is a single request. The page polls `exam_time_left`
+    afterwards.
+    """
     attempt = get_object_or_404(ExamAttempt, id=attempt_id, course_access__user=request.user)
     exam = attempt.course_access.course.exam
     course = attempt.course_access.course
     
     if attempt.is_submitted:
         return redirect('exam_results', attempt_id=attempt.id)
-    
-    # Limit the questions returned to the attempt's total_questions (snapshot at creation time)
-    questions = exam.questions.filter(is_active=True).order_by('order')[:attempt.total_questions]
+
+    now = timezone.now()
+    remaining = _remaining_seconds(attempt, now)
+    if remaining <= 0:
+        # Resumed after the time ran out: grade it instead of opening the exam
+        finalize(attempt)
+        return redirect('exam_results', attempt_id=attempt.id)
+
+    mark_in_progress(attempt)
+    questions = _attempt_questions(attempt, exam)
 
     context = {
         'attempt': attempt,
         'exam': exam,
         'course': course,
-        'questions': questions,
         'total_questions': attempt.total_questions,
         'duration_minutes': exam.duration_minutes,
+        'bootstrap': {
+            'questions': questions,
+            'server_time': now.isoformat(),
+            'remaining_seconds': remaining,
+        },
     }
     
     return render(request, 'exam_portal.html', context)
 
 
+def _attempt_questions(attempt, exam):
+    """The attempt's questions as JSON-ready dicts, with the saved answers."""
+    # The attempt's questions that are still active
+    question_ids = attempt_questions(attempt, exam)
+    details = {
+        question['id']: question
+        for question in exam.questions.filter(id__in=question_ids, is_active=True).order_by().values(
+            'id', 'order', 'question_text', 'option_a', 'option_b', 'option_c', 'option_d',
+        )
+    }
+    selected = answers_by_question(load_vector(attempt, question_ids), question_ids)
+    return [
+        {**details[qid], 'selected_answer': selected[qid]}
+        for qid in question_ids if qid in details
+    ]
+
+
+def _remaining_seconds(attempt, now):
+    """Seconds left on `attempt`, from the duration captured when it was created."""
+    elapsed = int((now - attempt.started_at).total_seconds())
+    return max(0, (attempt.duration_minutes or 150) * 60 - elapsed)
+
+
 @require_http_methods(['GET'])
 @login_required
 def exam_get_questions(request, attempt_id):
@@ -177,30 +228,33 @@ def exam_get_questions(request, attempt_id):
     
     if attempt.is_submitted:
         return JsonResponse({'error': 'Exam already submitted'}, status=400)
-    
-    # Return only the subset of active questions assigned to this attempt
-    questions = exam.questions.filter(is_active=True).order_by('order')[:attempt.total_questions]
-    
-    # Fetch user's answers
-    answers = ExamAnswer.objects.filter(attempt=attempt)
-    answer_map = {a.question_id: a.selected_answer for a in answers}
-    
-    data = []
-    for q in questions:
-        data.append({
-            'id': q.id,
-            'order': q.order,
-            'question_text': q.question_text,
-            'option_a': q.option_a,
-            'option_b': q.option_b,
-            'option_c': q.option_c,
-            'option_d': q.option_d,
-            'selected_answer': answer_map.get(q.id, ''),
-        })
+
+    mark_in_progress(attempt)
+    data = _attempt_questions(attempt, exam)
     
     return JsonResponse({'questions': data, 'total': len(data)})
 
 
+def exam_question_meta_key(exam_id):
+    return f'exam:{exam_id}:question_meta'
+
+
+def _exam_question_meta(exam):
+    """Latest question update time and question count for `exam`.
+
+    Every open exam portal polls `exam_time_left`, and this aggregate is
+    identical for everyone sitting the exam, so it is cached and shared across
+    workers. `core.signals` invalidates it when questions change.
+    """
+    def compute():
+        qagg = exam.questions.aggregate(updated_at=Max('updated_at'), total=Count('id'))
+        return {
+            'updated_at': qagg['updated_at'].isoformat() if qagg['updated_at'] else None,
+            'total': qagg['total'] or 0,
+        }
+    return get_or_compute(exam_question_meta_key(exam.id), compute, timeout=300)
+
+
 @require_http_methods(['GET'])
 @login_required
 def exam_time_left(request, attempt_id):
@@ -224,39 +278,35 @@ def exam_time_left(request, attempt_id):
             'exam_active': exam.is_active,
             'exam_updated_at': (exam.updated_at.isoformat() if exam.updated_at else None),
         }
-        qagg = exam.questions.aggregate(updated_at=Max('updated_at'), total=Count('id'))
-        meta['questions_updated_at'] = (qagg.get('updated_at').isoformat() if qagg.get('updated_at') else None)
-        meta['questions_count'] = int(attempt.total_questions or (qagg.get('total') or 0))
+        qmeta = _exam_question_meta(exam)
+        meta['questions_updated_at'] = qmeta['updated_at']
+        meta['questions_count'] = int(attempt.total_questions or qmeta['total'])
         meta['duration_minutes'] = attempt.duration_minutes or exam.duration_minutes
         return JsonResponse({'remaining_seconds': 0, 'is_submitted': True, **meta})
 
-    # Compute elapsed seconds since attempt started
-    now = timezone.now()
-    elapsed = int((now - attempt.started_at).total_seconds())
     # Use the attempt's stored duration (captured at creation time), not the current exam duration
-    total_seconds = (attempt.duration_minutes or 150) * 60
-    remaining = max(0, total_seconds - elapsed)
+    remaining = _remaining_seconds(attempt, timezone.now())
 
     # If remaining time is 0 and attempt not submitted, finalize server-side
     if remaining <= 0 and not attempt.is_submitted:
-        # mark as submitted and grade
-        with transaction.atomic():
-            _finalize_and_grade_attempt(attempt)
+        # mark as submitted and grade (no-op if a submit got there first)
+        finalize(attempt)
         return JsonResponse({'remaining_seconds': 0, 'is_submitted': True})
 
     meta = {
         'exam_active': exam.is_active,
         'exam_updated_at': (exam.updated_at.isoformat() if exam.updated_at else None),
     }
-    qagg = exam.questions.aggregate(updated_at=Max('updated_at'), total=Count('id'))
-    meta['questions_updated_at'] = (qagg.get('updated_at').isoformat() if qagg.get('updated_at') else None)
-    meta['questions_count'] = int(attempt.total_questions or (qagg.get('total') or 0))
+    qmeta = _exam_question_meta(exam)
+    meta['questions_updated_at'] = qmeta['updated_at']
+    meta['questions_count'] = int(attempt.total_questions or qmeta['total'])
     meta['duration_minutes'] = attempt.duration_minutes or exam.duration_minutes
     return JsonResponse({'remaining_seconds': remaining, 'is_submitted': False, **meta})
 
 
 @require_http_methods(['POST'])
 @login_required
+@idempotent
 def exam_save_answer(request, attempt_id):
     """API: Save user's answer to a question."""
     attempt = get_object_or_404(ExamAttempt, id=attempt_id, course_access__user=request.user)
@@ -265,22 +315,28 @@ def exam_save_answer(request, attempt_id):
         return JsonResponse({'error': 'Exam already submitted'}, status=400)
     
     data = json.loads(request.body)
-    question_id = data.get('question_id')
-    selected_answer = data.get('selected_answer', '')
-    
-    question = get_object_or_404(ExamQuestion, id=question_id, exam=attempt.course_access.course.exam)
-    
-    answer, created = ExamAnswer.objects.update_or_create(
-        attempt=attempt,
-        question=question,
-        defaults={'selected_answer': selected_answer}
-    )
+    selected_answer = data.get('selected_answer') or ''
+    try:
+        question_id = int(data.get('question_id'))
+        if len(selected_answer) > 1 or selected_answer not in OPTIONS:
+            raise ValueError(selected_answer)
+    except (TypeError, ValueError):
+        return JsonResponse({'error': 'Invalid answer'}, status=400)
+    
+    # One UPDATE of the attempt's answer vector (core/answer_vector.py)
+    question_ids = attempt_questions(attempt, attempt.course_access.course.exam)
+    if question_id not in question_ids:
+        return JsonResponse({'error': 'Question is not part of this attempt'}, status=404)
+    if not save_answer(attempt, question_ids, question_id, selected_answer):
+        # Graded since the attempt was read above
+        return JsonResponse({'error': 'Exam already submitted'}, status=400)
     
     return JsonResponse({'success': True})
 
 
 @require_http_methods(['POST'])
 @login_required
+@idempotent
 def exam_submit(request, attempt_id):
     """API: Submit exam and auto-grade."""
     attempt = get_object_or_404(ExamAttempt, id=attempt_id, course_access__user=request.user)
@@ -289,16 +345,17 @@ def exam_submit(request, attempt_id):
     if attempt.is_submitted:
         return JsonResponse({'error': 'Already submitted'}, status=400)
     
-    with transaction.atomic():
-        # Finalize grading via helper (keeps logic in one place)
-        result = _finalize_and_grade_attempt(attempt)
+    # Finalize grading via helper (keeps logic in one place). If the timer or
+    # a violation auto-submit graded the attempt meanwhile, report its result.
+    result = finalize(attempt)
+    total_questions = result['total_questions'] if result else attempt.total_questions
     
     return JsonResponse({
         'success': True,
-        'score_percentage': float(attempt.score_percentage),
+        'score_percentage': float(attempt.score_percentage or 0),
         'is_passed': attempt.is_passed,
         'correct_answers': attempt.correct_answers,
-        'total_questions': result.get('total_questions', 0),
+        'total_questions': total_questions,
     })
 
 
@@ -323,23 +380,28 @@ def _generate_certificate_if_not_exists(course_access):
 def _finalize_and_grade_attempt(attempt):
     """Internal helper to grade and finalize an ExamAttempt.
 
-    Returns a dict with grading results and total questions count.
+    Views go through `attempt_state.finalize`, which claims the attempt
+    first so it is graded only once. Returns a dict with grading results and total questions count.
     """
     exam = attempt.course_access.course.exam
-    answers = ExamAnswer.objects.filter(attempt=attempt).select_related('question')
-
-    # Only grade the subset of questions that were assigned to the attempt
-    questions = exam.questions.filter(is_active=True).order_by('order')[:attempt.total_questions]
-
-    correct_count = 0
-    for answer in answers:
-        is_correct = answer.selected_answer == answer.question.correct_answer
-        answer.is_correct = is_correct
-        answer.save()
-        if is_correct:
-            correct_count += 1
 
-    total = attempt.total_questions or questions.count()
+    # Only grade the questions assigned to the attempt, comparing the answer
+    # vector with their current key in one pass
+    question_ids = attempt_questions(attempt, exam)
+    questions = {
+        question['id']: question
+        for question in exam.questions.filter(id__in=question_ids).order_by().values(
+            'id', 'order', 'question_text', 'correct_answer', 'explanation',
+        )
+    }
+    key = ''.join(questions[qid]['correct_answer'] or UNANSWERED if qid in questions else UNANSWERED
+                  for qid in question_ids)
+    vector = load_vector(attempt, question_ids)
+    outcomes = grade_vector(vector, key)
+    correct_count = sum(outcomes)
+    _write_answer_rows(attempt, question_ids, vector, outcomes, questions)
+
+    total = attempt.total_questions or len(question_ids)
     score_percentage = (correct_count / total * 100) if total > 0 else 0
     is_passed = score_percentage >= exam.passing_score
 
@@ -349,7 +411,18 @@ def _finalize_and_grade_attempt(attempt):
     attempt.correct_answers = correct_count
     attempt.score_percentage = score_percentage
     attempt.is_passed = is_passed
-    attempt.save()
+    attempt.answer_vector = vector
+    attempt.results_snapshot = results_snapshot.encode(
+        results_snapshot.build(attempt, exam, graded=(question_ids, vector, outcomes, questions))
+    )
+    # Only the grading fields: violations recorded meanwhile are F() increments
+    # this in-memory attempt hasn't seen
+    attempt.save(update_fields=[
+        'submitted_at', 'time_taken_seconds', 'is_submitted', 'correct_answers', 'score_percentage',
+        'is_passed', 'answer_vector', 'results_snapshot', 'updated_at',
+    ])
+    # Stored with 2 decimals; add the same value the distribution rebuild would read
+    transaction.on_commit(lambda: score_distribution.record(exam.id, round(score_percentage, 2)))
 
     if is_passed:
         _generate_certificate_if_not_exists(attempt.course_access)
@@ -362,8 +435,96 @@ def _finalize_and_grade_attempt(attempt):
     }
 
 
+def _write_answer_rows(attempt, question_ids, vector, outcomes, questions):
+    """Replace the attempt's ExamAnswer rows with its graded answers.
+
+    The rows are what the admin and reports read; during
+    the exam only the vector is written. Questions deleted since the
+    attempt started have no row.
+    """
+    ExamAnswer.objects.filter(attempt=attempt).delete()
+    ExamAnswer.objects.bulk_create([
+        ExamAnswer(attempt=attempt, question_id=qid, selected_answer=option, is_correct=is_correct)
+        for qid, option, is_correct in zip(question_ids, vector, outcomes)
+        if option in OPTIONS and qid in questions
+    ], batch_size=500)
+
+
+# Events accepted per batch request; a flapping window focus can produce
+# dozens a second, which the portal coalesces before sending
+MAX_VIOLATION_EVENTS = 100
+MAX_VIOLATION_COUNT = 1000
+
+
+def _coalesce_violation_events(events):
+    """Merge raw events into {violation_type: [count, description, auto_submit]}.
+
+    Counts add up, the latest description wins and auto-submit sticks once set.
+    """
+    max_type_length = ExamViolation._meta.get_field('violation_type').max_length
+    merged = {}
+    for event in events:
+        if not isinstance(event, dict):
+            raise ValueError('each event must be an object')
+        violation_type = str(event.get('violation_type') or 'other')[:max_type_length]
+        count = min(max(int(event.get('count', 1)), 1), MAX_VIOLATION_COUNT)
+        entry = merged.setdefault(violation_type, [0, '', False])
+        entry[0] += count
+        entry[1] = str(event.get('description', '') or entry[1])
+        entry[2] = entry[2] or bool(event.get('auto_submit', False))
+    return merged
+
+
+def _record_violations(attempt, merged):
+    """Upsert one ExamViolation row per type and bump the attempt's summary.
+
+    Each row is incremented with a single UPDATE ... SET violation_count =
+    violation_count + n, so concurrent requests can't lose counts; only the
+    first event of a type inserts. Returns the number of events recorded.
+    """
+    total = 0
+    for violation_type, (count, description, auto_submit) in merged.items():
+        changes = {'violation_count': F('violation_count') + count, 'description': description}
+        if auto_submit:
+            changes['auto_submitted'] = True
+        rows = ExamViolation.objects.filter(attempt=attempt, violation_type=violation_type)
+        if not rows.update(**changes):
+            try:
+                with transaction.atomic(using=router.db_for_write(ExamViolation)):
+                    ExamViolation.objects.create(
+                        attempt=attempt, violation_type=violation_type, violation_count=count,
+                        description=description, auto_submitted=auto_submit,
+                    )
+            except IntegrityError:
+                # Another request inserted this type first
+                rows.update(**changes)
+        total += count
+
+    attempt.has_violations = True
+    attempt.violation_count = F('violation_count') + total
+    attempt.save(update_fields=['has_violations', 'violation_count', 'updated_at'])
+    return total
+
+
+def _violation_response(attempt, merged, extra):
+    _record_violations(attempt, merged)
+
+    # If auto-submit is requested, finalize the exam
+    if any(auto_submit for _, _, auto_submit in merged.values()):
+        attempt.refresh_from_db(fields=['violation_count'])
+        finalize(attempt)
+        return JsonResponse({
+            'success': True,
+            'auto_submitted': True,
+            'message': 'Your exam has been auto-submitted due to a security violation.'
+        })
+
+    return JsonResponse({'success': True, **extra})
+
+
 @require_http_methods(['POST'])
 @login_required
+@idempotent
 def exam_record_violation(request, attempt_id):
     """API: Record a security violation during the exam."""
     attempt = get_object_or_404(ExamAttempt, id=attempt_id, course_access__user=request.user)
@@ -371,42 +532,41 @@ def exam_record_violation(request, attempt_id):
     if attempt.is_submitted:
         return JsonResponse({'error': 'Exam already submitted'}, status=400)
     
-    data = json.loads(request.body)
-    violation_type = data.get('violation_type', 'other')
-    description = data.get('description', '')
-    should_auto_submit = data.get('auto_submit', False)
-    
-    # Record the violation
-    violation, created = ExamViolation.objects.update_or_create(
-        attempt=attempt,
-        violation_type=violation_type,
-        defaults={
-            'description': description,
-            'auto_submitted': should_auto_submit,
-            'violation_count': (ExamViolation.objects.get(attempt=attempt, violation_type=violation_type).violation_count + 1) if not created else 1,
-        }
+    try:
+        data = json.loads(request.body)
+        merged = _coalesce_violation_events([data])
+    except (ValueError, TypeError, OverflowError):
+        return JsonResponse({'error': 'Invalid violation payload'}, status=400)
+
+    violation_type = next(iter(merged))
+    return _violation_response(attempt, merged, {'violation_recorded': True, 'violation_type': violation_type})
+
+
+@require_http_methods(['POST'])
+@login_required
+@idempotent
+def exam_record_violations(request, attempt_id):
+    """API: Record a batch of violation events, coalesced by the exam portal.
+
+    Body: {"events": [{"violation_type": ..., "description": ..., "count": n,
+    "auto_submit": bool}, ...]}, at most MAX_VIOLATION_EVENTS entries.
+    """
+    attempt = get_object_or_404(ExamAttempt, id=attempt_id, course_access__user=request.user)
+
+    if attempt.is_submitted:
+        return JsonResponse({'error': 'Exam already submitted'}, status=400)
+
+    try:
+        events = json.loads(request.body).get('events')
+        if not isinstance(events, list) or not events or len(events) > MAX_VIOLATION_EVENTS:
+            raise ValueError(f'events must be a list of 1-{MAX_VIOLATION_EVENTS} objects')
+        merged = _coalesce_violation_events(events)
+    except (ValueError, AttributeError, TypeError, OverflowError):
+        return JsonResponse({'error': 'Invalid violation payload'}, status=400)
+
+    return _violation_response(
+        attempt, merged, {'violations_recorded': sum(count for count, _, _ in merged.values())},
     )
-    
-    # Update attempt violation tracking
-    attempt.has_violations = True
-    attempt.violation_count = ExamViolation.objects.filter(attempt=attempt).aggregate(total=Count('id'))['total'] or 0
-    attempt.save()
-    
-    # If auto-submit is requested, finalize the exam
-    if should_auto_submit and not attempt.is_submitted:
-        with transaction.atomic():
-            _finalize_and_grade_attempt(attempt)
-        return JsonResponse({
-            'success': True,
-            'auto_submitted': True,
-            'message': 'Your exam has been auto-submitted due to a security violation.'
-        })
-    
-    return JsonResponse({
-        'success': True,
-        'violation_recorded': True,
-        'violation_type': violation_type,
-    })
 
 
 @login_required
@@ -415,53 +575,28 @@ def exam_results(request, attempt_id):
     
     If the current attempt has violations, display answers from the last valid attempt instead.
     This prevents users from easily accessing answers through violations.
+    Everything besides the attempt's own scores comes from the document
+    stored at grading time, see core/results_snapshot.py.
     """
     attempt = get_object_or_404(ExamAttempt, id=attempt_id, course_access__user=request.user)
     
     if not attempt.is_submitted:
         return redirect('exam_portal', attempt_id=attempt.id)
     
-    exam = attempt.course_access.course.exam
-    violations = ExamViolation.objects.filter(attempt=attempt)
-    has_violations = attempt.has_violations and violations.exists()
-    
-    # Determine which attempt to show answers from
-    display_attempt = attempt
-    if has_violations:
-        # If current attempt has violations, find the last valid (non-violated) submitted attempt
-        last_valid = ExamAttempt.objects.filter(
-            course_access=attempt.course_access,
-            is_submitted=True,
-            has_violations=False,
-            attempt_number__lt=attempt.attempt_number
-        ).order_by('-attempt_number').first()
-        
-        if last_valid:
-            display_attempt = last_valid
-    
-    # Get answers to display
-    answers = ExamAnswer.objects.filter(attempt=display_attempt).select_related('question')
-    
-    # Build answer detail
-    answer_details = []
-    for ans in answers:
-        answer_details.append({
-            'question': ans.question,
-            'selected': ans.selected_answer,
-            'correct': ans.question.correct_answer,
-            'is_correct': ans.is_correct,
-            'explanation': ans.question.explanation,
-        })
+    snapshot = results_snapshot.ensure(attempt)
+    distribution = score_distribution.scores(snapshot['exam']['id'], snapshot['course_id'])
     
     context = {
         'attempt': attempt,
-        'display_attempt': display_attempt,
-        'exam': exam,
-        'answer_details': answer_details,
+        'display_attempt': snapshot['display_attempt'],
+        'exam': snapshot['exam'],
+        'course_slug': snapshot['course_slug'],
+        'answer_details': snapshot['answers'],
         'passed': attempt.is_passed,
-        'violations': violations,
-        'has_violations': has_violations,
-        'showing_previous_attempt': display_attempt.id != attempt.id,
+        'percentile': score_distribution.percentile(distribution, attempt.score_percentage),
+        'violations': snapshot['violations'],
+        'has_violations': snapshot['has_violations'],
+        'showing_previous_attempt': snapshot['display_attempt']['id'] != attempt.id,
     }
     
     return render(request, 'exam_results.html', context)
@@ -0,0 +1,77 @@
+"""
+`Idempotency-Key` support for POST endpoints that clients retry.
+
+Mobile networks resend a POST when the response is lost, and each resend of
+`exam_submit` or `payment_callback` would run the whole view again (for the
+payment, including a gateway fetch). A client that sends
+
+    Idempotency-Key: <unique value per logical request>
+
+gets the first successful response stored in the shared cache for
+`settings.IDEMPOTENCY_KEY_TTL` seconds, keyed by user, path and key. A retry
+with the same key is answered from that entry with one cache read and
+`Idempotent-Replayed: true`; the view does not run.
+
+- Only 2xx responses are stored: errors may be transient (the gateway was
+  down, the payment was not captured yet), so a retry should run again.
+- A retry while the first request is still running gets 409 Conflict.
+- Reusing a key with a different body gets 422; the key names one request.
+
+Requests without the header are handled as before.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+
+HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+# How long a request holds its key before a retry may run the view itself
+LOCK_TIMEOUT = 60
+
+
+def _cache_key(request, key):
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f'idempotency:{request.user.pk}:{request.path}:{digest}'
+
+
+def idempotent(view):
+    """Replay the stored response for a repeated `Idempotency-Key`.
+
+    Goes below `login_required`, since entries are kept per user.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        key = request.META.get(HEADER, '').strip()
+        if not key or request.method != 'POST':
+            return view(request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return JsonResponse({'error': 'Idempotency-Key is too long'}, status=400)
+
+        cache_key = _cache_key(request, key)
+        fingerprint = hashlib.sha256(request.body).hexdigest()
+        entry = cache.get(cache_key)
+        if entry is None:
+            if not cache.add(f'{cache_key}:lock', 1, LOCK_TIMEOUT):
+                response = JsonResponse({'error': 'A request with this Idempotency-Key is in progress'}, status=409)
+                response['Retry-After'] = '1'
+                return response
+            try:
+                response = view(request, *args, **kwargs)
+                if 200 <= response.status_code < 300 and not response.streaming:
+                    entry = (fingerprint, response.status_code, response['Content-Type'], response.content)
+                    cache.set(cache_key, entry, settings.IDEMPOTENCY_KEY_TTL)
+                return response
+            finally:
+                cache.delete(f'{cache_key}:lock')
+
+        stored_fingerprint, status, content_type, content = entry
+        if stored_fingerprint != fingerprint:
+            return JsonResponse({'error': 'Idempotency-Key was used with a different request body'}, status=422)
+        response = HttpResponse(content, status=status, content_type=content_type)
+        response['Idempotent-Replayed'] = 'true'
+        return response
+    return wrapper
@@ -0,0 +1,170 @@
+"""
+Item analysis of an exam's question bank.
+
+For every question, over the graded attempts that answered it:
+
+- difficulty: the p-value, the share of those answers that were correct;
+- discrimination: the point-biserial correlation between getting the
+  question right and the attempt's score on the *other* questions
+  (item-rest correlation, so a question doesn't correlate with itself);
+- distractor rates: the share of answers choosing each option.
+
+and for the exam, KR-20 reliability.
+
+All of these come from sums that add up across attempts, so they are kept
+in `ExamItemStats` and folded forward: `refresh(exam)` only reads the
+attempts graded since the last refresh, loads their `ExamAnswer` rows in
+chunks into NumPy arrays and adds them in with `bincount`. The exam admin
+page calls it on every view, and `refresh_item_analysis` does it for all
+exams from cron. Changing a question's answer key makes its old sums
+meaningless; `refresh(exam, rebuild=True)` starts over.
+
+Per question id the sums are, in ITEM_FIELDS order: answers `n`, correct
+answers `x`, and over those answers the attempt score `t`, its square and
+its product with correctness, then counts per option A-D and of anything
+else. With the rest score r = t - x:
+
+    r_pb = (n Σxr - Σx Σr) / sqrt((n Σx - (Σx)²) (n Σr² - (Σr)²))
+
+Questions skipped in an attempt have no `ExamAnswer` row and don't count
+towards that question's statistics.
+
+NumPy is imported inside the functions: it is too heavy for worker boot
+(see core/startup_profile.py).
+"""
+
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import ExamAnswer, ExamAttempt, ExamItemStats
+
+ITEM_FIELDS = ('n', 'correct', 'score', 'score_sq', 'correct_score', 'A', 'B', 'C', 'D', 'other')
+OPTIONS = 'ABCD'
+CHUNK_ATTEMPTS = 1000
+# Attempts are folded in once their submission is this old, so one that
+# was still committing when the watermark moved past it isn't missed
+SETTLE = timedelta(seconds=60)
+# Fewer answers than this and a question's numbers are mostly noise
+MIN_ANSWERS = 20
+
+
+def _fold(stats, question_ids, attempts):
+    """Add `attempts` [(id, correct_answers, total_questions), ...] to `stats`."""
+    import numpy as np
+
+    qids = np.array(question_ids, dtype=np.int64)
+    sums = np.zeros((len(qids), len(ITEM_FIELDS)), dtype=np.int64)
+    for position, qid in enumerate(question_ids):
+        if str(qid) in stats.items:
+            sums[position] = stats.items[str(qid)]
+    option_code = np.full(256, len(OPTIONS), dtype=np.int64)
+    option_code[[ord(option) for option in OPTIONS]] = np.arange(len(OPTIONS))
+
+    for start in range(0, len(attempts), CHUNK_ATTEMPTS):
+        chunk = sorted(attempts[start:start + CHUNK_ATTEMPTS])
+        attempt_ids = np.array([row[0] for row in chunk], dtype=np.int64)
+        scores = np.array([row[1] for row in chunk], dtype=np.int64)
+        rows = list(ExamAnswer.objects.filter(attempt_id__in=attempt_ids.tolist()).values_list(
+            'attempt_id', 'question_id', 'selected_answer', 'is_correct',
+        ))
+        if not rows:
+            continue
+        row_attempts, row_questions, selected, correct = zip(*rows)
+        question = np.searchsorted(qids, np.array(row_questions, dtype=np.int64))
+        known = question < len(qids)
+        known[known] = qids[question[known]] == np.array(row_questions, dtype=np.int64)[known]
+        question = question[known]
+        x = np.array(correct, dtype=np.int64)[known]
+        t = scores[np.searchsorted(attempt_ids, np.array(row_attempts, dtype=np.int64))][known]
+        options = option_code[np.frombuffer(''.join((s or ' ')[0] for s in selected).encode('latin-1', 'replace'), dtype=np.uint8)][known]
+
+        count = len(qids)
+        sums[:, 0] += np.bincount(question, minlength=count)
+        sums[:, 1] += np.bincount(question, weights=x, minlength=count).astype(np.int64)
+        sums[:, 2] += np.bincount(question, weights=t, minlength=count).astype(np.int64)
+        sums[:, 3] += np.bincount(question, weights=t * t, minlength=count).astype(np.int64)
+        sums[:, 4] += np.bincount(question, weights=x * t, minlength=count).astype(np.int64)
+        sums[:, 5:] += np.bincount(question * 5 + options, minlength=count * 5).reshape(count, 5)
+
+    totals = np.array([row[1] for row in attempts], dtype=np.int64)
+    stats.attempts += len(attempts)
+    stats.score_sum += int(totals.sum())
+    stats.score_sq_sum += int((totals * totals).sum())
+    stats.length_sum += sum(row[2] for row in attempts)
+    stats.items = {str(qid): row for qid, row in zip(question_ids, sums.tolist()) if row[0]}
+
+
+def refresh(exam, rebuild=False):
+    """Fold attempts graded since the last refresh into the exam's statistics."""
+    cutoff = timezone.now() - SETTLE
+    with transaction.atomic():
+        stats, _ = ExamItemStats.objects.get_or_create(exam=exam)
+        stats = ExamItemStats.objects.select_for_update().get(pk=stats.pk)
+        if rebuild:
+            stats = ExamItemStats(pk=stats.pk, exam=exam)
+        attempts = ExamAttempt.objects.filter(
+            course_access__course_id=exam.course_id, is_submitted=True, submitted_at__lte=cutoff,
+        )
+        if stats.graded_through:
+            attempts = attempts.filter(submitted_at__gt=stats.graded_through)
+        attempts = list(attempts.values_list('id', 'correct_answers', 'total_questions'))
+        if attempts:
+            question_ids = sorted(exam.questions.values_list('id', flat=True))
+            _fold(stats, question_ids, attempts)
+        stats.graded_through = cutoff
+        stats.save()
+    return stats
+
+
+def report(stats, questions):
+    """Statistics per question of `questions` (ExamQuestion, in display order) and for the exam."""
+    import numpy as np
+
+    sums = np.array([stats.items.get(str(q.id), [0] * len(ITEM_FIELDS)) for q in questions], dtype=np.float64)
+    sums = sums.reshape(len(questions), len(ITEM_FIELDS))
+    n, x, t, tt, xt = sums[:, :5].T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = x / n
+        rest, rest_sq, x_rest = t - x, tt - 2 * xt + x, xt - x
+        r_pb = (n * x_rest - x * rest) / np.sqrt((n * x - x * x) * (n * rest_sq - rest * rest))
+        rates = sums[:, 5:] / n[:, None]
+
+    items = []
+    for i, question in enumerate(questions):
+        answered = int(n[i])
+        items.append({
+            'question': question,
+            'answers': answered,
+            'p_value': None if not answered else float(p[i]),
+            'discrimination': None if not np.isfinite(r_pb[i]) else float(r_pb[i]),
+            'rates': {option: None if not answered else float(rates[i, j]) for j, option in enumerate(OPTIONS)},
+            'flag': _flag(answered, p[i], r_pb[i]),
+        })
+
+    # KR-20 over forms of the mean length, with the answer-weighted mean item variance
+    kr20 = None
+    if stats.attempts > 1 and n.sum():
+        k = stats.length_sum / stats.attempts
+        mean = stats.score_sum / stats.attempts
+        variance = stats.score_sq_sum / stats.attempts - mean * mean
+        item_variance = float(np.nansum(n * p * (1 - p)) / n.sum())
+        if k > 1 and variance > 0:
+            kr20 = k / (k - 1) * (1 - k * item_variance / variance)
+
+    return {'attempts': stats.attempts, 'kr20': kr20, 'items': items, 'updated_at': stats.updated_at}
+
+
+def _flag(answers, p, r_pb):
+    if answers < MIN_ANSWERS:
+        return 'Too few answers'
+    if r_pb < 0:
+        return 'Negative discrimination: check the answer key'
+    if p >= 0.9:
+        return 'Too easy'
+    if p <= 0.2:
+        return 'Too hard'
+    if r_pb < 0.2:
+        return 'Weak discrimination'
+    return ''
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.retention import archive_dir, archive_policy, get_policies
+
+
+class Command(BaseCommand):
+    help = (
+        'Move rows past their retention policy (core/retention.py) from the live tables '
+        'to gzipped, date-partitioned JSON Lines files, in chunks.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            metavar='LABEL',
+            help='Only this model label, e.g. core.examanswer (repeatable; default: all policies)'
+        )
+        parser.add_argument('--archive-dir', help='Archive root (default: settings.ARCHIVE_DIR)')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Rows per chunk (default: 5000)')
+        parser.add_argument('--sleep', type=float, default=0.0, help='Seconds to pause between chunks')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the expired rows')
+
+    def handle(self, *args, **options):
+        policies = get_policies()
+        labels = options['models'] or list(policies)
+        unknown = [label for label in labels if label not in policies]
+        if unknown:
+            raise CommandError(f'No retention policy for: {", ".join(unknown)}. Known: {", ".join(policies)}')
+        root = options['archive_dir'] or archive_dir()
+
+        for label in labels:
+            policy = policies[label]
+            if not policy.days:
+                self.stdout.write(f'{label}: retention disabled.')
+                continue
+            if options['dry_run']:
+                self.stdout.write(f'{label}: {policy.expired().count()} row(s) older than {policy.days} days would be archived.')
+                continue
+            counts = archive_policy(policy, root, options['chunk_size'], sleep=options['sleep'], policies=policies)
+            self.stdout.write(', '.join(f'{name}: {count} archived' for name, count in counts.items()))
+
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Archive written under {root}'))
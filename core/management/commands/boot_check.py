@@ -0,0 +1,133 @@
+import hashlib
+import os
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+
+FINGERPRINT_FILE = '.static-fingerprint'
+
+
+def static_fingerprint():
+    """Hash of every static source file's path, size and mtime, plus the storage setup.
+
+    Only stats the files: far cheaper than `collectstatic`, which has to read,
+    hash and compress each one.
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{settings.STATICFILES_STORAGE}\0{settings.STATIC_URL}\0'.encode())
+    entries = []
+    for finder in finders.get_finders():
+        for path, storage in finder.list([]):
+            stat = os.stat(storage.path(path))
+            prefix = getattr(storage, 'prefix', None) or ''
+            entries.append(f'{os.path.join(prefix, path)}\0{stat.st_size}\0{stat.st_mtime_ns}')
+    for entry in sorted(entries):
+        digest.update(entry.encode())
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def _fingerprint_path():
+    return os.path.join(settings.STATIC_ROOT, FINGERPRINT_FILE)
+
+
+def stored_static_fingerprint():
+    try:
+        with open(_fingerprint_path()) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def unapplied_migrations(database=DEFAULT_DB_ALIAS):
+    """(app_label, name) pairs on disk that django_migrations has no row for.
+
+    Lists the migration files instead of loading and linking the migration
+    graph the way `migrate` does. Squashed migrations may show up here while
+    their replaced migrations are applied; `migrate` sorts those out, so a
+    false positive only costs the slow path.
+    """
+    recorder = MigrationRecorder(connections[database])
+    if not recorder.has_table():
+        return [('migrations', '(table missing)')]
+    applied = set(recorder.applied_migrations())
+
+    pending = []
+    for app_config in apps.get_app_configs():
+        module_name, _ = MigrationLoader.migrations_module(app_config.label)
+        if module_name is None:
+            continue
+        try:
+            module = __import__(module_name, fromlist=['__path__'])
+        except ImportError:
+            continue
+        for directory in getattr(module, '__path__', []):
+            for filename in os.listdir(directory):
+                name, ext = os.path.splitext(filename)
+                if ext == '.py' and not name.startswith(('_', '~')):
+                    if (app_config.label, name) not in applied:
+                        pending.append((app_config.label, name))
+    return sorted(pending)
+
+
+class Command(BaseCommand):
+    help = (
+        'Fast boot path for start.sh: run migrate only when migration files are '
+        'unapplied and collectstatic only when the static sources changed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Always run migrate and collectstatic')
+        parser.add_argument('--skip-migrate', action='store_true')
+        parser.add_argument('--skip-static', action='store_true')
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report; exit with status 1 if either step would run'
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        stale = []
+
+        databases = [options['database']]
+        # The analytics database (if any) is migrated alongside the primary
+        if options['database'] == DEFAULT_DB_ALIAS and getattr(settings, 'ANALYTICS_DATABASE', None):
+            databases.append(settings.ANALYTICS_DATABASE)
+
+        for database in databases if not options['skip_migrate'] else []:
+            pending = unapplied_migrations(database)
+            if pending or options['force']:
+                stale.append(f'migrations ({database})')
+                if pending:
+                    self.stdout.write(
+                        f'{len(pending)} unapplied migration(s) on {database}, e.g. {pending[0][0]}.{pending[0][1]}'
+                    )
+                if not options['check']:
+                    call_command('migrate', database=database, interactive=False, verbosity=options['verbosity'])
+            else:
+                self.stdout.write(f'Migrations up to date on {database}; skipping migrate.')
+
+        if not options['skip_static']:
+            fingerprint = static_fingerprint()
+            if fingerprint != stored_static_fingerprint() or options['force']:
+                stale.append('static files')
+                self.stdout.write('Static sources changed since the last collectstatic.')
+                if not options['check']:
+                    call_command('collectstatic', interactive=False, verbosity=options['verbosity'])
+                    with open(_fingerprint_path(), 'w') as f:
+                        f.write(fingerprint + '\n')
+            else:
+                self.stdout.write('Static files up to date; skipping collectstatic.')
+
+        if options['check'] and stale:
+            raise CommandError(f'Out of date: {", ".join(stale)}', returncode=1)
+        self.stdout.write(self.style.SUCCESS(f'Boot check finished in {time.perf_counter() - started:.2f}s'))
@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark_data import BenchmarkConfig, BenchmarkDataGenerator, delete_benchmark_data
+
+
+class Command(BaseCommand):
+    help = 'Generate deterministic synthetic users, courses, exams and history for benchmarking.'
+
+    def add_arguments(self, parser):
+        defaults = BenchmarkConfig()
+        parser.add_argument('--users', type=int, default=defaults.users)
+        parser.add_argument('--courses', type=int, default=defaults.courses)
+        parser.add_argument('--days', type=int, default=defaults.days, help='Schedule days per course')
+        parser.add_argument('--items-per-day', type=int, default=defaults.items_per_day)
+        parser.add_argument('--questions', type=int, default=defaults.questions, help='Question bank size per exam')
+        parser.add_argument('--question-count', type=int, default=defaults.question_count,
+                            help='Questions per attempt (0 = whole bank)')
+        parser.add_argument('--enrollments-per-user', type=int, default=defaults.enrollments_per_user)
+        parser.add_argument('--watch-fraction', type=float, default=defaults.watch_fraction,
+                            help='Fraction of each course\'s videos a student has watched')
+        parser.add_argument('--attempts', type=int, default=defaults.attempts_per_enrollment,
+                            help='Submitted exam attempts per enrollment')
+        parser.add_argument('--pass-rate', type=float, default=defaults.pass_rate)
+        parser.add_argument('--seed', type=int, default=defaults.seed)
+        parser.add_argument('--batch-size', type=int, default=defaults.batch_size, help='Rows per INSERT')
+        parser.add_argument('--chunk-users', type=int, default=defaults.chunk_users,
+                            help='Users generated per transaction')
+        parser.add_argument('--user-template', default=defaults.user_template, help='Username/email, {n} = index')
+        parser.add_argument('--password', default=defaults.password)
+        parser.add_argument('--reset', action='store_true', help='Delete data from a previous run first')
+
+    def handle(self, *args, **options):
+        if '{n}' not in options['user_template']:
+            raise CommandError('--user-template must contain {n}')
+        if not 0 <= options['watch_fraction'] <= 1:
+            raise CommandError('--watch-fraction must be between 0 and 1')
+
+        if options['reset']:
+            deleted = delete_benchmark_data(options['user_template'])
+            self.stdout.write(f'Deleted {deleted} rows from a previous run')
+
+        config = BenchmarkConfig(
+            users=options['users'],
+            courses=options['courses'],
+            days=options['days'],
+            items_per_day=options['items_per_day'],
+            questions=options['questions'],
+            question_count=options['question_count'],
+            enrollments_per_user=options['enrollments_per_user'],
+            watch_fraction=options['watch_fraction'],
+            attempts_per_enrollment=options['attempts'],
+            pass_rate=options['pass_rate'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            chunk_users=options['chunk_users'],
+            user_template=options['user_template'],
+            password=options['password'],
+        )
+
+        start = time.perf_counter()
+        try:
+            counts = BenchmarkDataGenerator(config, stdout=self.stdout).generate()
+        except Exception as exc:
+            raise CommandError(f'Generation failed ({exc}); rerun with --reset to clear partial data') from exc
+        elapsed = time.perf_counter() - start
+
+        total = sum(counts.values())
+        for model, count in counts.items():
+            self.stdout.write(f'  {model:<20} {count:>10}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {total} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)'
+        ))
@@ -0,0 +1,55 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = (
+        'Copy the event tables (settings.ANALYTICS_MODELS) from the primary database to the '
+        'analytics database in primary-key batches. Run once after setting ANALYTICS_DATABASE_URL.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per batch (default: 1000)')
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='Delete the copied rows from the primary database afterwards'
+        )
+
+    def handle(self, *args, **options):
+        target = getattr(settings, 'ANALYTICS_DATABASE', None)
+        if not target:
+            raise CommandError('No analytics database configured; set ANALYTICS_DATABASE_URL.')
+        batch_size = options['batch_size']
+        primary_tables = connections[DEFAULT_DB_ALIAS].introspection.table_names()
+
+        for label in settings.ANALYTICS_MODELS:
+            model = apps.get_model(label)
+            if model._meta.db_table not in primary_tables:
+                self.stdout.write(f'{label}: no table on the primary database; nothing to copy.')
+                continue
+            source = model._base_manager.using(DEFAULT_DB_ALIAS).order_by('pk')
+            copied, last_pk = 0, None
+            while True:
+                batch = list((source.filter(pk__gt=last_pk) if last_pk is not None else source)[:batch_size])
+                if not batch:
+                    break
+                # Re-running after an interruption skips rows already copied
+                model._base_manager.using(target).bulk_create(batch, ignore_conflicts=True)
+                copied += len(batch)
+                last_pk = batch[-1].pk
+
+            # Rows were inserted with explicit ids; move sequences past them (no-op on SQLite)
+            with connections[target].cursor() as cursor:
+                for sql in connections[target].ops.sequence_reset_sql(no_style(), [model]):
+                    cursor.execute(sql)
+
+            deleted = 0
+            if options['delete'] and last_pk is not None:
+                deleted, _ = model._base_manager.using(DEFAULT_DB_ALIAS).filter(pk__lte=last_pk).delete()
+            self.stdout.write(f'{label}: copied {copied} row(s), deleted {deleted} from the primary.')
+
+        self.stdout.write(self.style.SUCCESS(f'Event tables copied to {target}.'))
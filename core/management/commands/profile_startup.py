@@ -0,0 +1,56 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.startup_profile import STARTUP_BUDGET_MB, STARTUP_BUDGET_SECONDS, profile_startup
+
+
+class Command(BaseCommand):
+    help = (
+        'Boot Online_Course.wsgi in a fresh interpreter, as a gunicorn worker does, '
+        'and report import time and RSS per top-level package.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help='Packages to list (default: 20)')
+        parser.add_argument('--sort', choices=['import', 'rss'], default='import')
+        parser.add_argument('--json', dest='json_path', help='Also write the profile as JSON to this path')
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Fail if boot time, RSS or eagerly imported optional packages exceed the budget'
+        )
+
+    def handle(self, *args, **options):
+        profile = profile_startup()
+
+        key = 'import_ms' if options['sort'] == 'import' else 'rss_kb'
+        packages = sorted(profile['packages'], key=lambda p: -p[key])[:options['top']]
+        self.stdout.write(f"{'package':<28}{'import ms':>12}{'RSS KB':>10}")
+        self.stdout.write('-' * 50)
+        for package in packages:
+            self.stdout.write(f"{package['name']:<28}{package['import_ms']:>12.1f}{package['rss_kb']:>10}")
+        self.stdout.write('-' * 50)
+        self.stdout.write(
+            f"Worker ready in {profile['seconds']:.3f}s (budget {STARTUP_BUDGET_SECONDS}s), "
+            f"RSS {profile['rss_mb']} MB (budget {STARTUP_BUDGET_MB} MB)"
+        )
+        if profile['lazy_modules_loaded']:
+            self.stdout.write(self.style.WARNING(
+                f"Optional packages imported at boot: {', '.join(profile['lazy_modules_loaded'])}"
+            ))
+
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(profile, f, indent=2)
+
+        if options['check']:
+            problems = []
+            if profile['seconds'] > STARTUP_BUDGET_SECONDS:
+                problems.append(f"boot took {profile['seconds']:.3f}s")
+            if profile['rss_mb'] > STARTUP_BUDGET_MB:
+                problems.append(f"RSS is {profile['rss_mb']} MB")
+            if profile['lazy_modules_loaded']:
+                problems.append(f"eager imports of {', '.join(profile['lazy_modules_loaded'])}")
+            if problems:
+                raise CommandError('Startup over budget: ' + '; '.join(problems))
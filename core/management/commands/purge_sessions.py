@@ -0,0 +1,59 @@
+import time
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete expired database sessions in small batches. Unlike '
+        '`clearsessions`, which issues one DELETE over the whole table, each '
+        'batch is its own short statement so logins are not blocked behind it.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Sessions deleted per statement (default: 1000)'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0.0,
+            help='Seconds to pause between batches (default: 0)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many sessions have expired'
+        )
+
+    def handle(self, *args, **options):
+        if settings.SESSION_ENGINE.endswith('signed_cookies'):
+            self.stdout.write('SESSION_MODE=signed_cookies stores no sessions server-side; nothing to purge.')
+            return
+
+        batch_size = max(1, options['batch_size'])
+        cutoff = timezone.now()
+        expired = Session.objects.filter(expire_date__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f'{expired.count()} expired session(s) would be deleted.')
+            return
+
+        deleted = 0
+        while True:
+            keys = list(expired.order_by().values_list('session_key', flat=True)[:batch_size])
+            if not keys:
+                break
+            count, _ = Session.objects.filter(session_key__in=keys).delete()
+            deleted += count
+            self.stdout.write(f'Deleted {deleted} expired session(s)...')
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f'Purged {deleted} expired session(s).'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.item_analysis import refresh
+from core.models import CourseExam
+
+
+class Command(BaseCommand):
+    help = (
+        'Fold attempts graded since the last run into each exam\'s item analysis '
+        '(core/item_analysis.py).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--exam', type=int, action='append', dest='exams', metavar='ID',
+                            help='Only this exam id (repeatable; default: all exams)')
+        parser.add_argument('--rebuild', action='store_true',
+                            help='Start over from all graded attempts, e.g. after changing answer keys')
+
+    def handle(self, *args, **options):
+        exams = CourseExam.objects.order_by('id')
+        if options['exams']:
+            exams = exams.filter(id__in=options['exams'])
+            missing = set(options['exams']) - set(exams.values_list('id', flat=True))
+            if missing:
+                raise CommandError(f'No exam with id: {", ".join(map(str, sorted(missing)))}')
+        for exam in exams:
+            stats = refresh(exam, rebuild=options['rebuild'])
+            self.stdout.write(f'Exam {exam.id}: {stats.attempts} attempt(s) analysed.')
+        self.stdout.write(self.style.SUCCESS('Item analysis up to date.'))
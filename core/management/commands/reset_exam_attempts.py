@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from core.db_routing import pk_values
 from core.models import CourseAccess, ExamAttempt, ExamAnswer
 
 
@@ -32,7 +33,7 @@ class Command(BaseCommand):
         total_answers = 0
         for access in accesses:
             attempts = ExamAttempt.objects.filter(course_access=access)
-            answers = ExamAnswer.objects.filter(attempt__in=attempts)
+            answers = ExamAnswer.objects.filter(attempt__in=pk_values(attempts, ExamAnswer))
             count_attempts = attempts.count()
             count_answers = answers.count()
 
@@ -0,0 +1,40 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.retention import archive_dir, archived_partitions, get_policies, restore_partitions
+
+
+def _date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'Not a YYYY-MM-DD date: {value}')
+
+
+class Command(BaseCommand):
+    help = (
+        'Load archived rows back into the live tables for a date range of their '
+        'partitions. Rows that are already present are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('labels', nargs='+', metavar='LABEL', help='Model labels, e.g. core.examattempt core.examanswer')
+        parser.add_argument('--from', dest='start', help='First partition date, YYYY-MM-DD (default: oldest)')
+        parser.add_argument('--to', dest='end', help='Last partition date, YYYY-MM-DD (default: newest)')
+        parser.add_argument('--archive-dir', help='Archive root (default: settings.ARCHIVE_DIR)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per insert (default: 1000)')
+
+    def handle(self, *args, **options):
+        policies = get_policies()
+        start = _date(options['start']) if options['start'] else None
+        end = _date(options['end']) if options['end'] else None
+        root = options['archive_dir'] or archive_dir()
+
+        for label in options['labels']:
+            if label not in policies:
+                raise CommandError(f'No retention policy for {label}. Known: {", ".join(policies)}')
+            partitions = archived_partitions(label, root, start, end)
+            restored = restore_partitions(label, root, start, end, options['batch_size'])
+            self.stdout.write(f'{label}: {restored} row(s) from {len(partitions)} partition(s)')
+        self.stdout.write(self.style.SUCCESS('Restore finished.'))
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from core.backup import (
+    POSTGRES_SUFFIX, SQLITE_SUFFIX, BackupError, list_backups, restore_postgres, restore_sqlite,
+)
+
+
+class Command(BaseCommand):
+    help = 'Restore the database from a backup written by backup_db (or a plain .sqlite3 copy).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('backup', nargs='?', help='Backup file to restore')
+        parser.add_argument(
+            '--latest',
+            action='store_true',
+            help='Restore the newest backup in --output-dir'
+        )
+        parser.add_argument(
+            '--output-dir',
+            default=str(settings.BASE_DIR / 'db_backups'),
+            help='Where --latest looks for backups (default: db_backups/)'
+        )
+        parser.add_argument('--no-input', '--noinput', action='store_false', dest='interactive')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        suffix = {'sqlite': SQLITE_SUFFIX, 'postgresql': POSTGRES_SUFFIX}.get(connection.vendor)
+        if suffix is None:
+            raise CommandError(f'Restores are not supported for {connection.vendor}')
+
+        if options['latest']:
+            backups = list_backups(options['output_dir'], suffix)
+            if not backups:
+                raise CommandError(f'No {suffix} backups in {options["output_dir"]}')
+            backup = backups[0]
+        elif options['backup']:
+            backup = Path(options['backup'])
+        else:
+            raise CommandError('Give a backup file or --latest')
+        if not backup.exists():
+            raise CommandError(f'{backup} does not exist')
+
+        if options['interactive']:
+            answer = input(
+                f'This replaces all data in the "{options["database"]}" database with {backup.name}.\n'
+                "Type 'yes' to continue: "
+            )
+            if answer != 'yes':
+                self.stdout.write('Restore cancelled.')
+                return
+
+        # Don't hold our own connection open across the swap
+        connection.close()
+        try:
+            if connection.vendor == 'sqlite':
+                if connection.is_in_memory_db():
+                    raise CommandError('Cannot restore into an in-memory SQLite database')
+                restore_sqlite(backup, connection.settings_dict['NAME'])
+            else:
+                restore_postgres(backup, connection.settings_dict)
+        except BackupError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(f'Restored {backup.name}'))
@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.benchmarks import (
+    DEFAULT_BASELINE, DEFAULT_TOLERANCE, compare, load_baseline, registered_cases, run_benchmarks,
+    save_baseline,
+)
+
+
+class Command(BaseCommand):
+    help = ('Run the core micro-benchmarks against generated data in a throwaway test database, '
+            'optionally saving or comparing against a JSON baseline.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help='Only run these cases (default: all)')
+        parser.add_argument('--list', action='store_true', help='List available cases and exit')
+        parser.add_argument('--rounds', type=int, default=20, help='Timed rounds per case')
+        parser.add_argument('--warmup', type=int, default=1, help='Untimed rounds per case')
+        parser.add_argument('--save', nargs='?', const=str(DEFAULT_BASELINE), metavar='PATH',
+                            help=f'Write results as the baseline (default {DEFAULT_BASELINE.name})')
+        parser.add_argument('--compare', nargs='?', const=str(DEFAULT_BASELINE), metavar='PATH',
+                            help='Compare against a baseline and fail on regressions')
+        parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                            help='Allowed slowdown of the best round before flagging (0.5 = 50%%)')
+
+    def handle(self, *args, **options):
+        if options['list']:
+            for name, (case, _) in registered_cases().items():
+                self.stdout.write(f'{name:<32}{(case.__doc__ or "").strip()}')
+            return
+
+        baseline = None
+        if options['compare']:
+            try:
+                baseline = load_baseline(options['compare'])
+            except FileNotFoundError:
+                raise CommandError(f'Baseline {options["compare"]} not found; create it with --save')
+
+        # Never time against (or write to) the configured database
+        from core.benchmarks.environment import BenchmarkEnvironment
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self.stdout.write('Generating benchmark data...')
+            env = BenchmarkEnvironment()
+            try:
+                results = run_benchmarks(env, names=options['names'], rounds=options['rounds'],
+                                         warmup=options['warmup'], stdout=self.stdout)
+            except KeyError as exc:
+                raise CommandError(exc.args[0])
+            if options['save']:
+                save_baseline(options['save'], results, env)
+                self.stdout.write(self.style.SUCCESS(f'Baseline written to {options["save"]}'))
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        if baseline is not None:
+            self._report_comparison(compare(results, baseline, options['tolerance']), options['tolerance'])
+
+    def _report_comparison(self, rows, tolerance):
+        self.stdout.write(f'\n{"case":<32}{"baseline":>12}{"current":>12}{"change":>10}')
+        regressions = []
+        for name, base_ms, current_ms, ratio, status in rows:
+            base = f'{base_ms:.3f}' if base_ms is not None else '-'
+            change = f'{(ratio - 1) * 100:+.1f}%' if ratio is not None else 'new'
+            line = f'{name:<32}{base:>12}{current_ms:>12.3f}{change:>10}'
+            if status == 'regression':
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(line + '  REGRESSION'))
+            elif status == 'improvement':
+                self.stdout.write(self.style.SUCCESS(line + '  improved'))
+            else:
+                self.stdout.write(line)
+
+        if regressions:
+            raise CommandError(f'{len(regressions)} case(s) slower than baseline by more than '
+                               f'{tolerance:.0%}: {", ".join(regressions)}')
+        self.stdout.write(self.style.SUCCESS('No regressions.'))
@@ -1,5 +1,8 @@
 from django.core.management.base import BaseCommand
+from core.cache import invalidate
+from core.exam_views import exam_question_meta_key
 from core.models import Course, CourseExam, ExamQuestion
+from core.question_pool import question_pool_key
 
 
 class Command(BaseCommand):
@@ -132,6 +135,8 @@ class Command(BaseCommand):
         # Bulk create questions
         ExamQuestion.objects.filter(exam=course_exam).delete()
         ExamQuestion.objects.bulk_create(all_questions)
+        # bulk_create skips post_save, so the signal can't do this
+        invalidate(exam_question_meta_key(course_exam.id), question_pool_key(course_exam.id))
         
         self.stdout.write(self.style.SUCCESS(
             f'Successfully created 150 exam questions for course "{course.name}"'
@@ -0,0 +1,133 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in each worker process against the scratch database: saves answers in
+# a transaction that reads the attempt and then updates its answer vector.
+# That read-then-write shape (also item_analysis.refresh, update_or_create()
+# of certificates) is what a deferred BEGIN fails with "database is locked";
+# a lone UPDATE in autocommit just waits on the busy timeout.
+_WORKER = r'''
+import json, os, sys, time
+import django
+django.setup()
+from django.db import OperationalError, transaction
+from core.answer_vector import save_answer
+from core.models import ExamAttempt, ExamQuestion
+
+index, saves, start_at = int(sys.argv[1]), int(sys.argv[2]), float(sys.argv[3])
+attempt = ExamAttempt.objects.get(course_access__user__username=f'stress{index}')
+questions = list(ExamQuestion.objects.order_by('order').values_list('id', flat=True))
+errors = []
+while time.time() < start_at:
+    time.sleep(0.001)
+begin = time.perf_counter()
+for n in range(saves):
+    try:
+        with transaction.atomic():
+            attempt = ExamAttempt.objects.get(pk=attempt.pk)
+            save_answer(attempt, questions, questions[n % len(questions)], 'ABCD'[n % 4])
+    except OperationalError as exc:
+        errors.append(str(exc))
+print(json.dumps({'errors': errors, 'seconds': time.perf_counter() - begin}))
+'''
+
+_SETUP = r'''
+import django
+django.setup()
+from django.contrib.auth.models import User
+from core.models import Course, CourseAccess, CourseExam, ExamAttempt, ExamQuestion
+import sys
+
+workers = int(sys.argv[1])
+course = Course.objects.create(name='Stress', slug='stress', original_price=1, discounted_price=1)
+exam = CourseExam.objects.create(course=course)
+ExamQuestion.objects.bulk_create([
+    ExamQuestion(exam=exam, question_text=f'Q{n}', option_a='a', option_b='b', option_c='c',
+                 option_d='d', correct_answer='A', order=n)
+    for n in range(50)
+])
+question_ids = list(exam.questions.order_by('order').values_list('id', flat=True))
+for index in range(workers):
+    user = User.objects.create_user(username=f'stress{index}', password='x')
+    access = CourseAccess.objects.create(user=user, course=course)
+    ExamAttempt.objects.create(course_access=access, attempt_number=1, total_questions=50,
+                               question_ids=question_ids, answer_vector='-' * 50)
+'''
+
+
+class Command(BaseCommand):
+    help = (
+        'Concurrency stress test for SQLite: several processes save exam answers at once '
+        'against a scratch database and report "database is locked" errors.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Writer processes (default: 4)')
+        parser.add_argument('--saves', type=int, default=200, help='Answer saves per worker (default: 200)')
+        parser.add_argument(
+            '--stock-backend',
+            action='store_true',
+            help="Use Django's stock SQLite backend (no WAL/pragmas, deferred BEGIN) for comparison"
+        )
+        parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+
+    def handle(self, *args, **options):
+        workers, saves = options['workers'], options['saves']
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'Online_Course.settings'),
+                SQLITE_PATH=os.path.join(tmp, 'stress.sqlite3'),
+                SQLITE_TUNED='false' if options['stock_backend'] else 'true',
+                DEBUG='true',
+            )
+            env.pop('DATABASE_URL', None)
+            run = dict(cwd=settings.BASE_DIR, env=env, capture_output=True, text=True)
+
+            for command in ([sys.executable, 'manage.py', 'migrate', '--no-input'],
+                            [sys.executable, '-c', _SETUP, str(workers)]):
+                proc = subprocess.run(command, **run)
+                if proc.returncode:
+                    raise CommandError(f'Scratch database setup failed:\n{proc.stderr[-2000:]}')
+
+            # Start every worker at the same instant, after they have all booted
+            start_at = time.time() + 3.0
+            procs = [
+                subprocess.Popen([sys.executable, '-c', _WORKER, str(i), str(saves), str(start_at)],
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                 cwd=settings.BASE_DIR, env=env)
+                for i in range(workers)
+            ]
+            results = []
+            for proc in procs:
+                out, err = proc.communicate()
+                if proc.returncode:
+                    raise CommandError(f'Worker crashed:\n{err[-2000:]}')
+                results.append(json.loads(out.strip().splitlines()[-1]))
+
+        errors = [e for r in results for e in r['errors']]
+        wall = max(r['seconds'] for r in results)
+        summary = {
+            'backend': 'stock' if options['stock_backend'] else 'tuned',
+            'workers': workers,
+            'saves': workers * saves,
+            'errors': len(errors),
+            'saves_per_second': round((workers * saves - len(errors)) / wall, 1) if wall else None,
+            'sample_error': errors[0] if errors else None,
+        }
+        if options['json']:
+            self.stdout.write(json.dumps(summary))
+            return
+        self.stdout.write(
+            f"{summary['backend']} backend: {summary['saves']} saves from {workers} processes, "
+            f"{summary['errors']} error(s), {summary['saves_per_second']} saves/s"
+        )
+        if errors:
+            self.stdout.write(self.style.WARNING(f'e.g. {errors[0]}'))
@@ -0,0 +1,131 @@
+"""
+In-process request metrics with Prometheus text exposition.
+
+`RequestMetricsMiddleware` (see `core/middleware.py`) feeds one observation
+per request into the module-level `registry`. The registry keeps fixed-bucket
+histograms keyed by resolved URL name and HTTP method, so memory stays bounded
+by the number of routes rather than the number of requests.
+
+Metrics are per worker process. Every sample carries a `pid` label so series
+scraped from different gunicorn workers never overwrite each other; sum them
+in PromQL (e.g. `sum by (view) (...)`).
+"""
+
+import os
+import threading
+from bisect import bisect_left
+
+# Wall time / DB time buckets (seconds)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# DB query count buckets
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class Histogram:
+    """Cumulative-on-render histogram with fixed upper bounds."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # One slot per bucket plus the implicit +Inf bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Yield (le, cumulative_count) pairs in Prometheus order."""
+        running = 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            yield _format_bound(bound), running
+        yield '+Inf', running + self.counts[-1]
+
+
+class _ViewStats:
+    __slots__ = ('duration', 'queries', 'db_time')
+
+    def __init__(self):
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.db_time = Histogram(DURATION_BUCKETS)
+
+
+class MetricsRegistry:
+    """Thread-safe store of per-view histograms and status counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+        self._statuses = {}
+
+    def record(self, view, method, status, duration, query_count, db_time):
+        key = (view, method)
+        status_key = (view, method, str(status))
+        with self._lock:
+            stats = self._views.get(key)
+            if stats is None:
+                stats = self._views[key] = _ViewStats()
+            stats.duration.observe(duration)
+            stats.queries.observe(query_count)
+            stats.db_time.observe(db_time)
+            self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+            self._statuses.clear()
+
+    def render(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        pid = str(os.getpid())
+        with self._lock:
+            views = sorted(self._views.items())
+            statuses = sorted(self._statuses.items())
+            lines = []
+            for name, attr, help_text in (
+                ('django_request_duration_seconds', 'duration', 'Wall time per request by resolved URL name.'),
+                ('django_request_db_queries', 'queries', 'Database queries executed per request.'),
+                ('django_request_db_seconds', 'db_time', 'Time spent in database calls per request.'),
+            ):
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} histogram')
+                for (view, method), stats in views:
+                    hist = getattr(stats, attr)
+                    labels = _labels(view=view, method=method, pid=pid)
+                    for le, count in hist.cumulative():
+                        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                    lines.append(f'{name}_sum{{{labels}}} {_format_float(hist.sum)}')
+                    lines.append(f'{name}_count{{{labels}}} {hist.count}')
+
+            lines.append('# HELP django_requests_total Requests by resolved URL name, method and status code.')
+            lines.append('# TYPE django_requests_total counter')
+            for (view, method, status), count in statuses:
+                labels = _labels(view=view, method=method, status=status, pid=pid)
+                lines.append(f'django_requests_total{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(**labels):
+    return ','.join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound):
+    return _format_float(float(bound))
+
+
+def _format_float(value):
+    return repr(float(value))
+
+
+# Process-wide registry used by the middleware and the /metrics/ view
+registry = MetricsRegistry()
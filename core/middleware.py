@@ -0,0 +1,156 @@
+"""
+Custom middleware for the core application.
+"""
+
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from whitenoise.middleware import WhiteNoiseMiddleware as _WhiteNoiseMiddleware
+
+from .metrics import registry
+
+
+class _QueryTimer:
+    """Query count and DB time for one request."""
+
+    __slots__ = ('count', 'elapsed')
+
+    def __init__(self):
+        self.count = 0
+        self.elapsed = 0.0
+
+
+# The timer of the request being handled. A context variable rather than a
+# per-request `execute_wrapper`: DB connections are per thread, and under ASGI
+# the ORM runs on a sync_to_async thread the middleware never sees, while
+# context variables are carried over to it.
+_active_timer = ContextVar('request_query_timer', default=None)
+
+
+def _timed_execute(execute, sql, params, many, context):
+    timer = _active_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.elapsed += time.perf_counter() - start
+        timer.count += 1
+
+
+def _install_timer(connection, **kwargs):
+    if _timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_timed_execute)
+
+
+connection_created.connect(_install_timer)
+
+
+class RequestMetricsMiddleware:
+    """Record wall time, DB query count and DB time for every request.
+
+    Observations are keyed by the resolved URL name (falling back to the
+    route pattern for unnamed URLs) and exported by `core.views.metrics`.
+    Uses an execute wrapper rather than `connection.queries`, so it works with
+    DEBUG=False and does not retain SQL strings. Runs natively in both WSGI
+    and ASGI stacks so it never forces async views back onto a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'METRICS_ENABLED', True)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        # Connections opened before this module was imported missed the signal
+        for conn in connections.all():
+            _install_timer(conn)
+        timer = _QueryTimer()
+        token = _active_timer.set(timer)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _active_timer.reset(token)
+        self._record(request, response, time.perf_counter() - start, timer)
+        return response
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+
+        timer = _QueryTimer()
+        token = _active_timer.set(timer)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _active_timer.reset(token)
+        self._record(request, response, time.perf_counter() - start, timer)
+        return response
+
+    @staticmethod
+    def _record(request, response, duration, timer):
+        registry.record(
+            _view_label(request),
+            request.method,
+            response.status_code,
+            duration,
+            timer.count,
+            timer.elapsed,
+        )
+
+
+class WhiteNoiseMiddleware(_WhiteNoiseMiddleware):
+    """WhiteNoise middleware that can also run in an async middleware chain.
+
+    The stock middleware (6.x) is sync-only, which makes Django adapt every
+    request under ASGI to a thread. Static file lookups are a dict access, so
+    the async path only differs in awaiting the rest of the chain.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings=settings)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+def _view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        # 404s and static files: collapse into one series to bound cardinality
+        return '<unresolved>'
+    return match.url_name or match.route or match.view_name
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.9 on 2026-10-19 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_examcertificate_delete_examcertificaterecord_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='coursepayment',
+            name='order_id',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.9 on 2026-10-19 06:42
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0028_coursepayment_order_id_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='brochuredownload',
+            name='brochure',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='downloads', to='core.coursebrochure'),
+        ),
+        migrations.AlterField(
+            model_name='brochuredownload',
+            name='course',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='brochure_downloads', to='core.course'),
+        ),
+        migrations.AlterField(
+            model_name='examanswer',
+            name='attempt',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='answers', to='core.examattempt'),
+        ),
+        migrations.AlterField(
+            model_name='examanswer',
+            name='question',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, to='core.examquestion'),
+        ),
+        migrations.AlterField(
+            model_name='examviolation',
+            name='attempt',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='violations', to='core.examattempt'),
+        ),
+        migrations.AlterField(
+            model_name='videoplay',
+            name='course_item',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='plays', to='core.coursescheduleitem'),
+        ),
+        migrations.AlterField(
+            model_name='videoplay',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='video_plays', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.9 on 2026-10-19 06:51
+
+from django.db import migrations, models
+
+
+def set_states(apps, schema_editor):
+    # Existing unsubmitted attempts have been opened already
+    ExamAttempt = apps.get_model('core', 'ExamAttempt')
+    db = schema_editor.connection.alias
+    ExamAttempt.objects.using(db).filter(is_submitted=True).update(state='graded')
+    ExamAttempt.objects.using(db).filter(is_submitted=False).update(state='in_progress')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_event_tables_without_db_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examattempt',
+            name='state',
+            field=models.CharField(choices=[('created', 'Created'), ('in_progress', 'In progress'), ('graded', 'Graded')], default='created', help_text='Lifecycle state, changed only through core/attempt_state.py', max_length=12),
+        ),
+        migrations.RunPython(set_states, migrations.RunPython.noop, hints={'model_name': 'examattempt'}),
+    ]
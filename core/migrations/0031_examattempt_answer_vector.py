@@ -0,0 +1,18 @@
+# Generated by Django 4.2.9 on 2026-10-19 06:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0030_examattempt_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examattempt',
+            name='answer_vector',
+            field=models.TextField(blank=True, default='', help_text="Selected option per question in the attempt's order, - if unanswered (core/answer_vector.py)"),
+        ),
+    ]
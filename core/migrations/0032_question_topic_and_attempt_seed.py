@@ -0,0 +1,23 @@
+# Generated by Django 4.2.9 on 2026-10-19 07:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0031_examattempt_answer_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examattempt',
+            name='question_seed',
+            field=models.PositiveIntegerField(blank=True, help_text='Seed of the question sample drawn for this attempt (core/question_pool.py); empty means the first questions by order', null=True),
+        ),
+        migrations.AddField(
+            model_name='examquestion',
+            name='topic',
+            field=models.CharField(blank=True, default='', help_text='Optional tag. Sampled attempts draw from each topic in proportion to its share of the questions', max_length=100),
+        ),
+    ]
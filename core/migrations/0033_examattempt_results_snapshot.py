@@ -0,0 +1,18 @@
+# Generated by Django 4.2.9 on 2026-10-19 07:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0032_question_topic_and_attempt_seed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examattempt',
+            name='results_snapshot',
+            field=models.BinaryField(blank=True, help_text='Compressed results page document written at grading time (core/results_snapshot.py)', null=True),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.9 on 2026-10-19 07:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0033_examattempt_results_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExamItemStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('graded_through', models.DateTimeField(blank=True, help_text='Attempts submitted up to this time are included', null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('score_sum', models.BigIntegerField(default=0, help_text='Sum of correct answers over the attempts')),
+                ('score_sq_sum', models.BigIntegerField(default=0, help_text='Sum of squared correct answers over the attempts')),
+                ('length_sum', models.BigIntegerField(default=0, help_text='Sum of questions per attempt')),
+                ('items', models.JSONField(default=dict, help_text='Per-question sums keyed by question id, see core/item_analysis.py')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('exam', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='item_stats', to='core.courseexam')),
+            ],
+            options={
+                'verbose_name': 'Exam Item Statistics',
+                'verbose_name_plural': 'Exam Item Statistics',
+            },
+        ),
+    ]
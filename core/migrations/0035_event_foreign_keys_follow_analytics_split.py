@@ -0,0 +1,37 @@
+# Event foreign keys are the same on every install: no FK constraint and no
+# Django cascade (core/signals.py deletes the rows), as 0029 made them. An
+# earlier version of this migration chose the options from the analytics
+# settings, so the schema depended on the machine; it now states them.
+
+from django.conf import settings
+from django.db import migrations, models
+
+EVENT_FOREIGN_KEYS = [
+    ('brochuredownload', 'brochure', 'core.coursebrochure', 'downloads'),
+    ('brochuredownload', 'course', 'core.course', 'brochure_downloads'),
+    ('examanswer', 'attempt', 'core.examattempt', 'answers'),
+    ('examanswer', 'question', 'core.examquestion', '+'),
+    ('examviolation', 'attempt', 'core.examattempt', 'violations'),
+    ('videoplay', 'course_item', 'core.coursescheduleitem', 'plays'),
+    ('videoplay', 'user', settings.AUTH_USER_MODEL, 'video_plays'),
+]
+
+
+def _field(target, related_name):
+    options = {'to': target, 'on_delete': models.DO_NOTHING, 'db_constraint': False}
+    if related_name != '+':
+        options['related_name'] = related_name
+    return models.ForeignKey(**options)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0034_examitemstats'),
+    ]
+
+    operations = [
+        migrations.AlterField(model_name=model_name, name=field, field=_field(target, related_name))
+        for model_name, field, target, related_name in EVENT_FOREIGN_KEYS
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.9 on 2026-10-19 07:29
+
+from django.db import migrations, models
+
+from core.question_pool import sample
+
+
+def freeze_open_attempts(apps, schema_editor):
+    # Open attempts keep the questions they were showing until now
+    ExamAttempt = apps.get_model('core', 'ExamAttempt')
+    ExamQuestion = apps.get_model('core', 'ExamQuestion')
+    db = schema_editor.connection.alias
+    pools = {}
+    attempts = ExamAttempt.objects.using(db).filter(
+        is_submitted=False, course_access__course__exam__isnull=False,
+    ).select_related('course_access__course__exam')
+    for attempt in attempts:
+        exam_id = attempt.course_access.course.exam.id
+        if exam_id not in pools:
+            pools[exam_id] = list(
+                ExamQuestion.objects.using(db).filter(exam_id=exam_id, is_active=True)
+                .order_by('order', 'id').values_list('id', 'correct_answer', 'topic')
+            )
+        drawn = sample(pools[exam_id], attempt.total_questions, attempt.question_seed)
+        ExamAttempt.objects.using(db).filter(pk=attempt.pk).update(question_ids=[qid for qid, _, _ in drawn])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0035_event_foreign_keys_follow_analytics_split'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='examattempt',
+            name='question_ids',
+            field=models.JSONField(blank=True, default=list, help_text="Ids of the attempt's questions in order, fixed when it starts (core/answer_vector.py)"),
+        ),
+        migrations.AlterField(
+            model_name='examattempt',
+            name='answer_vector',
+            field=models.TextField(blank=True, default='', help_text='Selected option per question of question_ids, - if unanswered (core/answer_vector.py)'),
+        ),
+        migrations.RunPython(freeze_open_attempts, migrations.RunPython.noop, hints={'model_name': 'examattempt'}),
+    ]
@@ -506,8 +506,10 @@ class VideoPlay(models.Model):
     A single row per (user, course_item) is stored. The existence of a
     VideoPlay row indicates the user has played that specific item at least once.
     """
-    user = models.ForeignKey('auth.User', on_delete=models.CASCADE, related_name='video_plays')
-    course_item = models.ForeignKey(CourseScheduleItem, on_delete=models.CASCADE, related_name='plays')
+    # May live on the analytics database, so no FK constraint or Django cascade;
+    # core/signals.py deletes these rows along with the parent.
+    user = models.ForeignKey('auth.User', on_delete=models.DO_NOTHING, related_name='video_plays', db_constraint=False)
+    course_item = models.ForeignKey(CourseScheduleItem, on_delete=models.DO_NOTHING, related_name='plays', db_constraint=False)
     played_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -539,7 +541,8 @@ class CourseInstructor(models.Model):
 class CoursePayment(models.Model):
     user = models.ForeignKey('auth.User', on_delete=models.CASCADE)
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
-    order_id = models.CharField(max_length=100)
+    # Indexed: payment_callback looks up the pending record by gateway order id
+    order_id = models.CharField(max_length=100, db_index=True)
     payment_id = models.CharField(max_length=100, null=True, blank=True)
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     currency = models.CharField(max_length=3, default='INR')
@@ -752,6 +755,10 @@ class ExamQuestion(models.Model):
     option_d = models.CharField(max_length=500, help_text='Option D')
     correct_answer = models.CharField(max_length=1, choices=[('A', 'A'), ('B', 'B'), ('C', 'C'), ('D', 'D')])
     explanation = models.TextField(blank=True, null=True, help_text='Optional explanation shown after exam submission')
+    topic = models.CharField(
+        max_length=100, blank=True, default='',
+        help_text='Optional tag. Sampled attempts draw from each topic in proportion to its share of the questions'
+    )
     order = models.PositiveIntegerField(default=0)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -768,8 +775,38 @@ class ExamQuestion(models.Model):
 
 class ExamAttempt(models.Model):
     """Tracks user's exam attempts."""
+    STATE_CREATED = 'created'
+    STATE_IN_PROGRESS = 'in_progress'
+    STATE_GRADED = 'graded'
+    STATES = [
+        (STATE_CREATED, 'Created'),
+        (STATE_IN_PROGRESS, 'In progress'),
+        (STATE_GRADED, 'Graded'),
+    ]
+
     course_access = models.ForeignKey(CourseAccess, on_delete=models.CASCADE, related_name='exam_attempts')
     attempt_number = models.PositiveIntegerField(default=1)
+    state = models.CharField(
+        max_length=12, choices=STATES, default=STATE_CREATED,
+        help_text='Lifecycle state, changed only through core/attempt_state.py'
+    )
+    question_seed = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text='Seed of the question sample drawn for this attempt (core/question_pool.py); '
+                  'empty means the first questions by order'
+    )
+    question_ids = models.JSONField(
+        default=list, blank=True,
+        help_text='Ids of the attempt\'s questions in order, fixed when it starts (core/answer_vector.py)'
+    )
+    answer_vector = models.TextField(
+        blank=True, default='',
+        help_text='Selected option per question of question_ids, - if unanswered (core/answer_vector.py)'
+    )
+    results_snapshot = models.BinaryField(
+        null=True, blank=True, editable=False,
+        help_text='Compressed results page document written at grading time (core/results_snapshot.py)'
+    )
     started_at = models.DateTimeField(auto_now_add=True)
     submitted_at = models.DateTimeField(null=True, blank=True)
     time_taken_seconds = models.IntegerField(null=True, blank=True)
@@ -796,8 +833,10 @@ class ExamAttempt(models.Model):
 
 class ExamAnswer(models.Model):
     """User's answer to a specific question in an attempt."""
-    attempt = models.ForeignKey(ExamAttempt, on_delete=models.CASCADE, related_name='answers')
-    question = models.ForeignKey(ExamQuestion, on_delete=models.CASCADE)
+    # May live on the analytics database, so no FK constraint or Django cascade;
+    # core/signals.py deletes these rows along with the parent.
+    attempt = models.ForeignKey(ExamAttempt, on_delete=models.DO_NOTHING, related_name='answers', db_constraint=False)
+    question = models.ForeignKey(ExamQuestion, on_delete=models.DO_NOTHING, db_constraint=False)
     selected_answer = models.CharField(max_length=1, choices=[('A', 'A'), ('B', 'B'), ('C', 'C'), ('D', 'D'), ('', 'Not answered')])
     is_correct = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -823,7 +862,9 @@ class ExamViolation(models.Model):
         ('other', 'Other Violation'),
     ]
     
-    attempt = models.ForeignKey(ExamAttempt, on_delete=models.CASCADE, related_name='violations')
+    # May live on the analytics database, so no FK constraint or Django cascade;
+    # core/signals.py deletes these rows along with the parent.
+    attempt = models.ForeignKey(ExamAttempt, on_delete=models.DO_NOTHING, related_name='violations', db_constraint=False)
     violation_type = models.CharField(max_length=20, choices=VIOLATION_TYPES)
     violation_count = models.PositiveIntegerField(default=1, help_text='Number of times this violation occurred')
     description = models.TextField(blank=True, help_text='Additional details about the violation')
@@ -840,6 +881,28 @@ class ExamViolation(models.Model):
         return f'{self.attempt} - {self.get_violation_type_display()} ({self.violation_count}x)'
 
 
+class ExamItemStats(models.Model):
+    """Running item-analysis sums for an exam, folded forward by core/item_analysis.py."""
+    exam = models.OneToOneField(CourseExam, on_delete=models.CASCADE, related_name='item_stats')
+    graded_through = models.DateTimeField(
+        null=True, blank=True,
+        help_text='Attempts submitted up to this time are included'
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    score_sum = models.BigIntegerField(default=0, help_text='Sum of correct answers over the attempts')
+    score_sq_sum = models.BigIntegerField(default=0, help_text='Sum of squared correct answers over the attempts')
+    length_sum = models.BigIntegerField(default=0, help_text='Sum of questions per attempt')
+    items = models.JSONField(default=dict, help_text='Per-question sums keyed by question id, see core/item_analysis.py')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Exam Item Statistics'
+        verbose_name_plural = 'Exam Item Statistics'
+
+    def __str__(self):
+        return f'{self.exam} - {self.attempts} attempts'
+
+
 class ExamCertificate(models.Model):
     """
     Stores certificate records for students who scored 80% and above on exams.
@@ -6,8 +6,12 @@ class BrochureDownload(models.Model):
     user_name = models.CharField(max_length=200)
     email = models.EmailField()
     phone = models.CharField(max_length=20)
-    course = models.ForeignKey('Course', on_delete=models.CASCADE, related_name='brochure_downloads')
-    brochure = models.ForeignKey('CourseBrochure', on_delete=models.CASCADE, related_name='downloads')
+    # May live on the analytics database, so no FK constraint or Django cascade;
+    # core/signals.py deletes these rows along with the parent.
+    course = models.ForeignKey('Course', on_delete=models.DO_NOTHING, related_name='brochure_downloads',
+                               db_constraint=False)
+    brochure = models.ForeignKey('CourseBrochure', on_delete=models.DO_NOTHING, related_name='downloads',
+                                 db_constraint=False)
     ip_address = models.GenericIPAddressField(blank=True, null=True)
     downloaded_at = models.DateTimeField(auto_now_add=True)
 
@@ -0,0 +1,89 @@
+"""
+Per-attempt question sampling.
+
+When `CourseExam.question_count` is smaller than the pool of active
+questions, each attempt gets its own subset, drawn from a seed stored on
+the attempt (`ExamAttempt.question_seed`). The pool (id, correct answer and
+topic of every active question, by `order`) is cached per exam, so starting
+an attempt doesn't query for it.
+
+The draw ranks every question by a hash of (seed, question id) and takes
+the lowest ranks. With topics set, each topic gets a share of the attempt
+proportional to its share of the pool, so every candidate sees the same
+mix.
+
+The draw depends on the pool: a new question can rank below a drawn one,
+and a change in a topic's size shifts the quotas. So it is made once, when
+the attempt starts, and the ids are stored on the attempt
+(`ExamAttempt.question_ids`, see core/answer_vector.py); editing the exam
+mid-attempt doesn't change them. Attempts from before that fall back to
+drawing again from the current pool, and attempts without a seed get the
+first `total_questions` questions by order.
+"""
+
+import random
+from collections import defaultdict
+
+from .cache import get_or_compute
+
+POOL_TIMEOUT = 300
+_MASK = (1 << 64) - 1
+
+
+def question_pool_key(exam_id):
+    return f'exam_question_pool:{exam_id}'
+
+
+def question_pool(exam):
+    """[(id, correct_answer, topic), ...] of the exam's active questions, by order.
+
+    Shared across workers; `core.signals` invalidates it when questions change.
+    """
+    def compute():
+        return list(
+            exam.questions.filter(is_active=True).order_by('order', 'id')
+            .values_list('id', 'correct_answer', 'topic')
+        )
+    return get_or_compute(question_pool_key(exam.id), compute, timeout=POOL_TIMEOUT)
+
+
+def new_seed():
+    return random.SystemRandom().randrange(1, 2 ** 31)
+
+
+def _rank(seed, question_id):
+    # splitmix64 of (seed, id): stable across processes and Python versions
+    x = (seed * 0x9E3779B97F4A7C15 + question_id) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+def _allocate(sizes, count):
+    """Split `count` over strata of `sizes` proportionally (largest remainder)."""
+    total = sum(sizes)
+    shares = [count * size / total for size in sizes]
+    quotas = [int(share) for share in shares]
+    by_remainder = sorted(range(len(sizes)), key=lambda i: quotas[i] - shares[i])
+    for i in by_remainder[:count - sum(quotas)]:
+        quotas[i] += 1
+    return quotas
+
+
+def sample(pool, count, seed):
+    """The `count` entries of `pool` drawn for `seed`, in pool order."""
+    if seed is None or count >= len(pool):
+        return pool[:count]
+    strata = defaultdict(list)
+    for position, entry in enumerate(pool):
+        strata[entry[2]].append(position)
+    groups = list(strata.values())
+    chosen = []
+    for positions, quota in zip(groups, _allocate([len(g) for g in groups], count)):
+        chosen += sorted(positions, key=lambda p: _rank(seed, pool[p][0]))[:quota]
+    return [pool[position] for position in sorted(chosen)]
+
+
+def attempt_pool(attempt, exam):
+    """[(id, correct_answer, topic), ...] drawn for `attempt` from the current pool, in its question order."""
+    return sample(question_pool(exam), attempt.total_questions, attempt.question_seed)
@@ -0,0 +1,123 @@
+"""
+Results document written once per attempt, when it is graded.
+
+`exam_results` used to re-read the violations, look for the last attempt
+without violations and join every answer to its question on each view, and
+students reload that page a lot. Grading now stores everything the page
+shows in `ExamAttempt.results_snapshot`, zlib-compressed JSON:
+
+    {"version": 2,
+     "exam": {"id": ..., "title": ..., "passing_score": ...},
+     "course_id": ..., "course_slug": ...,
+     "has_violations": bool,
+     "violations": [{"label", "count", "description"}, ...],
+     "display_attempt": {"id", "attempt_number"},
+     "answers": [{"order", "question_text", "selected", "correct",
+                  "is_correct", "explanation"}, ...]}
+
+`answers` belong to `display_attempt`. That is the attempt itself, except
+when it has violations: then it is the last earlier attempt without any,
+so a violation can't be used to reveal the answer key.
+
+Attempts graded before snapshots existed get theirs built on first view.
+"""
+
+import json
+import zlib
+
+from .db_routing import select_or_prefetch
+from .models import ExamAnswer, ExamAttempt, ExamViolation
+
+VERSION = 2
+
+
+def encode(document):
+    return zlib.compress(json.dumps(document, separators=(',', ':')).encode(), 6)
+
+
+def load(attempt):
+    """The attempt's results document, or None if it has none (yet)."""
+    if not attempt.results_snapshot:
+        return None
+    document = json.loads(zlib.decompress(bytes(attempt.results_snapshot)))
+    return document if document.get('version') == VERSION else None
+
+
+def _answers_from_rows(attempt):
+    answers = select_or_prefetch(ExamAnswer.objects.filter(attempt=attempt).order_by('id'), 'question')
+    return [{
+        'order': answer.question.order,
+        'question_text': answer.question.question_text,
+        'selected': answer.selected_answer,
+        'correct': answer.question.correct_answer,
+        'is_correct': answer.is_correct,
+        'explanation': answer.question.explanation or '',
+    } for answer in answers]
+
+
+def _answers_of(attempt):
+    document = load(attempt)
+    if document and document['display_attempt']['id'] == attempt.id:
+        return document['answers']
+    return _answers_from_rows(attempt)
+
+
+def build(attempt, exam, graded=None):
+    """The results document of a graded `attempt`.
+
+    `graded` is (question ids, answer vector, outcomes, {id: question
+    values}) from grading; the answers are read from the ExamAnswer rows
+    without it.
+    """
+    # The page only lists violations of attempts flagged with them
+    violations = list(ExamViolation.objects.filter(attempt=attempt).order_by('id')) if attempt.has_violations else []
+    has_violations = bool(violations)
+
+    display_attempt = attempt
+    if has_violations:
+        last_valid = ExamAttempt.objects.filter(
+            course_access_id=attempt.course_access_id,
+            is_submitted=True,
+            has_violations=False,
+            attempt_number__lt=attempt.attempt_number,
+        ).order_by('-attempt_number').only('id', 'attempt_number', 'results_snapshot').first()
+        if last_valid:
+            display_attempt = last_valid
+
+    if display_attempt is attempt and graded:
+        question_ids, vector, outcomes, questions = graded
+        answers = [{
+            'order': questions[qid]['order'],
+            'question_text': questions[qid]['question_text'],
+            'selected': option,
+            'correct': questions[qid]['correct_answer'],
+            'is_correct': is_correct,
+            'explanation': questions[qid]['explanation'] or '',
+        } for qid, option, is_correct in zip(question_ids, vector, outcomes) if option in 'ABCD' and qid in questions]
+    else:
+        answers = _answers_of(display_attempt)
+
+    return {
+        'version': VERSION,
+        'exam': {'id': exam.id, 'title': exam.title, 'passing_score': exam.passing_score},
+        'course_id': exam.course_id,
+        'course_slug': exam.course.slug,
+        'has_violations': has_violations,
+        'violations': [{
+            'label': violation.get_violation_type_display(),
+            'count': violation.violation_count,
+            'description': violation.description or '',
+        } for violation in violations],
+        'display_attempt': {'id': display_attempt.id, 'attempt_number': display_attempt.attempt_number},
+        'answers': answers,
+    }
+
+
+def ensure(attempt):
+    """Load the attempt's document, building and storing it if it has none."""
+    document = load(attempt)
+    if document is None:
+        document = build(attempt, attempt.course_access.course.exam)
+        attempt.results_snapshot = encode(document)
+        ExamAttempt.objects.filter(pk=attempt.pk).update(results_snapshot=attempt.results_snapshot)
+    return document
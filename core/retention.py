@@ -0,0 +1,203 @@
+"""
+Retention policies for the high-volume tables, used by
+`manage.py archive_expired` and `manage.py restore_archive`.
+
+Each `RetentionPolicy` says when a row of one model has expired: older than
+`days` by its `date_field`, narrowed by an optional state `rule` (e.g. only
+submitted attempts). Expired rows are written to gzipped JSON Lines files,
+partitioned by that date:
+
+    <ARCHIVE_DIR>/core.examanswer/date=2024-03-05/part-20250401T020000-0001.jsonl.gz
+
+and then deleted from the live table, one chunk at a time. Rows are
+serialized with Django's `jsonl` serializer, so restoring a date range loads
+them back with their original primary keys.
+
+`settings.RETENTION_DAYS` overrides a policy's `days` per model label;
+0 disables that policy.
+"""
+
+import gzip
+import time
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.utils import timezone
+
+from .db_routing import pk_values
+
+PART_SUFFIX = '.jsonl.gz'
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    label: str
+    date_field: str
+    days: int
+    # Narrows the expired queryset to rows that are safe to archive
+    rule: Optional[Callable] = None
+    # (label, foreign key) of rows archived together with each chunk, before
+    # the chunk's deletion would cascade to them
+    dependents: tuple = ()
+
+    @property
+    def model(self):
+        return apps.get_model(self.label)
+
+    def expired(self, now=None):
+        cutoff = (now or timezone.now()) - timedelta(days=self.days)
+        queryset = self.model._base_manager.filter(**{f'{self.date_field}__lt': cutoff})
+        return self.rule(queryset) if self.rule else queryset
+
+
+def _submitted_attempts(queryset):
+    from .models import ExamAttempt
+    return queryset.filter(attempt__in=pk_values(ExamAttempt.objects.filter(is_submitted=True), queryset.model))
+
+
+def _closed_attempts(queryset):
+    # Attempts still count against max_attempts while the enrollment is
+    # active, and deleting one would delete its certificate
+    return queryset.filter(is_submitted=True, course_access__is_active=False, certificate__isnull=True)
+
+
+def _plays_of_former_students(queryset):
+    # Progress is recomputed from plays, so keep them while any access is active
+    current = User.objects.filter(courseaccess__is_active=True).distinct()
+    return queryset.exclude(user__in=pk_values(current, queryset.model))
+
+
+DEFAULT_POLICIES = [
+    RetentionPolicy('core.brochuredownload', 'downloaded_at', 365),
+    RetentionPolicy('core.examviolation', 'recorded_at', 365, rule=_submitted_attempts),
+    RetentionPolicy('core.examanswer', 'created_at', 365, rule=_submitted_attempts),
+    RetentionPolicy(
+        'core.examattempt', 'submitted_at', 730, rule=_closed_attempts,
+        dependents=(('core.examanswer', 'attempt'), ('core.examviolation', 'attempt')),
+    ),
+    RetentionPolicy('core.videoplay', 'played_at', 730, rule=_plays_of_former_students),
+]
+
+
+def get_policies():
+    """DEFAULT_POLICIES with `settings.RETENTION_DAYS` applied, keyed by label."""
+    overrides = getattr(settings, 'RETENTION_DAYS', {})
+    return {
+        policy.label: replace(policy, days=overrides.get(policy.label, policy.days))
+        for policy in DEFAULT_POLICIES
+    }
+
+
+def archive_dir():
+    return Path(getattr(settings, 'ARCHIVE_DIR', Path(settings.BASE_DIR) / 'archive'))
+
+
+def _partition(value):
+    if isinstance(value, datetime):
+        value = timezone.localtime(value) if timezone.is_aware(value) else value
+        return value.date().isoformat()
+    return value.isoformat() if value else 'undated'
+
+
+def _write_rows(policy, rows, root, run_id):
+    """Write `rows` of `policy.model` into their date partitions; return the file paths."""
+    by_date = {}
+    for row in rows:
+        by_date.setdefault(_partition(getattr(row, policy.date_field)), []).append(row)
+    paths = []
+    for day, day_rows in sorted(by_date.items()):
+        directory = Path(root) / policy.label / f'date={day}'
+        directory.mkdir(parents=True, exist_ok=True)
+        sequence = len(list(directory.glob(f'part-{run_id}-*{PART_SUFFIX}'))) + 1
+        path = directory / f'part-{run_id}-{sequence:04d}{PART_SUFFIX}'
+        partial = path.with_name(path.name + '.partial')
+        with gzip.open(partial, 'wt', encoding='utf-8') as out:
+            serializers.serialize('jsonl', day_rows, stream=out)
+        partial.rename(path)
+        paths.append(path)
+    return paths
+
+
+def archive_policy(policy, root=None, chunk_size=5000, now=None, sleep=0.0, policies=None):
+    """Archive and delete every expired row of `policy`; return {label: rows archived}.
+
+    Each chunk is written to disk before it is deleted, so an interrupted run
+    leaves at worst rows that are both archived and live; the next run archives
+    them again and `restore_archive` skips duplicates.
+    """
+    root = root or archive_dir()
+    policies = policies or get_policies()
+    now = now or timezone.now()
+    run_id = now.strftime('%Y%m%dT%H%M%S')
+    counts = {policy.label: 0, **{label: 0 for label, _ in policy.dependents}}
+    queryset = policy.expired(now).order_by('pk')
+
+    while True:
+        rows = list(queryset[:chunk_size])
+        if not rows:
+            break
+        pks = [row.pk for row in rows]
+        for label, field in policy.dependents:
+            dependent = policies[label]
+            related = list(dependent.model._base_manager.filter(**{f'{field}__in': pks}).order_by('pk'))
+            if related:
+                _write_rows(dependent, related, root, run_id)
+                dependent.model._base_manager.filter(pk__in=[row.pk for row in related]).delete()
+                counts[label] += len(related)
+        _write_rows(policy, rows, root, run_id)
+        policy.model._base_manager.filter(pk__in=pks).delete()
+        counts[policy.label] += len(rows)
+        if sleep:
+            # Let other writers in between chunks
+            time.sleep(sleep)
+    return counts
+
+
+def archived_partitions(label, root=None, start=None, end=None):
+    """Partition directories of `label` whose date is within [start, end]."""
+    base = Path(root or archive_dir()) / label
+    if not base.is_dir():
+        return []
+    selected = []
+    for directory in sorted(base.glob('date=*')):
+        day = directory.name.partition('=')[2]
+        try:
+            when = date.fromisoformat(day)
+        except ValueError:
+            when = None
+        if (start or end) and when is None:
+            continue
+        if (start and when < start) or (end and when > end):
+            continue
+        selected.append(directory)
+    return selected
+
+
+def restore_partitions(label, root=None, start=None, end=None, batch_size=1000):
+    """Load archived rows of `label` dated within [start, end] back into the live table.
+
+    Rows whose primary key (or another unique constraint) is already taken
+    are skipped, so restoring twice is harmless. Returns the rows read.
+    """
+    model = apps.get_model(label)
+    restored = 0
+    for directory in archived_partitions(label, root, start, end):
+        for path in sorted(directory.glob(f'*{PART_SUFFIX}')):
+            with gzip.open(path, 'rt', encoding='utf-8') as stream:
+                batch = []
+                for item in serializers.deserialize('jsonl', stream, ignorenonexistent=True):
+                    batch.append(item.object)
+                    if len(batch) >= batch_size:
+                        model._base_manager.bulk_create(batch, ignore_conflicts=True)
+                        restored += len(batch)
+                        batch = []
+                if batch:
+                    model._base_manager.bulk_create(batch, ignore_conflicts=True)
+                    restored += len(batch)
+    return restored
@@ -0,0 +1,53 @@
+"""
+Percentile rank of an exam score among all graded attempts at the exam.
+
+The scores of an exam's graded attempts are cached as one sorted list per
+exam, shared across workers. A percentile is then two `bisect` calls instead
+of a COUNT over `ExamAttempt` per page view. Grading adds the new score to
+the cached list with `insort` once its transaction commits. A missing or
+expired list is rebuilt from the database on the next read, which also
+drops attempts deleted in the meantime.
+
+The rank counts half of the equal scores, so a score everyone shares is at
+the 50th percentile:
+
+    percentile = 100 * (scores below + scores equal / 2) / all scores
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+from .cache import get_or_compute, update_cached
+from .models import ExamAttempt
+
+DISTRIBUTION_TIMEOUT = 3600
+
+
+def score_distribution_key(exam_id):
+    return f'exam_score_distribution:{exam_id}'
+
+
+def scores(exam_id, course_id):
+    """Sorted score percentages of the graded attempts at exam `exam_id` (of course `course_id`)."""
+    def compute():
+        return sorted(float(score) for score in ExamAttempt.objects.filter(
+            course_access__course_id=course_id, is_submitted=True, score_percentage__isnull=False,
+        ).values_list('score_percentage', flat=True))
+    return get_or_compute(score_distribution_key(exam_id), compute, timeout=DISTRIBUTION_TIMEOUT)
+
+
+def record(exam_id, score):
+    """Add a newly graded score to the cached distribution, if it is cached."""
+    def add(values):
+        insort(values, float(score))
+        return values
+    update_cached(score_distribution_key(exam_id), add)
+
+
+def percentile(distribution, score):
+    """Percentile rank (0-100) of `score` in a sorted distribution, None if it is empty."""
+    if not distribution or score is None:
+        return None
+    score = float(score)
+    below = bisect_left(distribution, score)
+    equal = bisect_right(distribution, score, lo=below) - below
+    return 100 * (below + equal / 2) / len(distribution)
@@ -4,15 +4,27 @@ Hooks into the ExamAttempt model to create certificates when:
 1. Exam attempt is submitted
 2. Score is 80% or above
 3. is_passed flag is True
+
+Also drops shared-cache entries derived from exam questions when they change,
+and deletes event rows (plays, downloads, answers, violations) along with the
+rows they reference.
 """
 
-from django.db.models.signals import post_save
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import router, transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.utils import timezone
 import json
 import logging
 
-from .models import ExamAttempt, ExamCertificate
+from .cache import invalidate
+from .exam_views import exam_question_meta_key
+from .models import ExamAnswer, ExamAttempt, ExamCertificate, ExamQuestion, ExamViolation, VideoPlay
+from .models_brochure import BrochureDownload
+from .question_pool import question_pool_key
 
 logger = logging.getLogger(__name__)
 
@@ -115,3 +127,95 @@ def certificate_file_upload_notification(sender, instance, created, update_field
                 # Example: send_certificate_ready_email(instance)
     except Exception as e:
         logger.error(f'Error in certificate upload notification: {str(e)}', exc_info=True)
+
+
+# Exam ids whose question caches a `deferred_question_invalidation` block
+# will drop when it ends, or None outside one
+_deferred_exam_ids = ContextVar('deferred_question_invalidation', default=None)
+
+
+def _question_cache_keys(exam_ids):
+    return [key for exam_id in exam_ids for key in (exam_question_meta_key(exam_id), question_pool_key(exam_id))]
+
+
+@contextmanager
+def deferred_question_invalidation():
+    """Drop the question caches of the exams edited in the block once, when it ends.
+
+    For imports that save questions one by one: otherwise every save
+    invalidates (and writes the keys' generation markers) on its own.
+    """
+    exam_ids = set()
+    token = _deferred_exam_ids.set(exam_ids)
+    try:
+        yield
+    finally:
+        _deferred_exam_ids.reset(token)
+        if exam_ids:
+            invalidate(*_question_cache_keys(sorted(exam_ids)))
+
+
+@receiver(post_save, sender=ExamQuestion)
+@receiver(post_delete, sender=ExamQuestion)
+def invalidate_exam_question_meta(sender, instance, **kwargs):
+    """Question added, edited or removed: recompute the cached exam metadata and pool."""
+    deferred = _deferred_exam_ids.get()
+    if deferred is not None:
+        deferred.add(instance.exam_id)
+        return
+    invalidate(*_question_cache_keys([instance.exam_id]))
+
+
+# (event model, foreign key) pairs without a Django cascade or FK constraint:
+# the event tables may live on the analytics database, where the collector
+# can't follow them
+EVENT_FOREIGN_KEYS = [
+    (VideoPlay, 'user'), (VideoPlay, 'course_item'),
+    (BrochureDownload, 'course'), (BrochureDownload, 'brochure'),
+    (ExamAnswer, 'attempt'), (ExamAnswer, 'question'),
+    (ExamViolation, 'attempt'),
+]
+EVENT_DELETE_BATCH = 500
+
+_deleted_parents = ContextVar('deleted_event_parents', default=None)
+
+
+def _batches(pks):
+    pks = sorted(pks)
+    for start in range(0, len(pks), EVENT_DELETE_BATCH):
+        yield pks[start:start + EVENT_DELETE_BATCH]
+
+
+def collect_deleted_parent(sender, instance, **kwargs):
+    """pre_delete: note the parent. A delete sends every pre_delete before any post_delete."""
+    pending = _deleted_parents.get()
+    if pending is None:
+        pending = {}
+        _deleted_parents.set(pending)
+    pending.setdefault(sender, set()).add(instance.pk)
+
+
+def delete_event_rows(sender, instance, using, **kwargs):
+    """post_delete: the first one of a delete takes all its parents of this model,
+    whose event rows go once the delete commits."""
+    pks = (_deleted_parents.get() or {}).pop(sender, None)
+    if pks:
+        transaction.on_commit(lambda: _delete_event_rows(sender, pks, using), using=using)
+
+
+def _delete_event_rows(parent, pks, using):
+    # Noted by a delete that failed before its post_delete: the parent is still there
+    for batch in _batches(pks):
+        pks -= set(parent._base_manager.using(using).filter(pk__in=batch).values_list('pk', flat=True))
+    for model, field in EVENT_FOREIGN_KEYS:
+        if model._meta.get_field(field).related_model is not parent:
+            continue
+        with transaction.atomic(using=router.db_for_write(model)):
+            for batch in _batches(pks):
+                model._base_manager.filter(**{f'{field}_id__in': batch}).delete()
+
+
+for _parent in {model._meta.get_field(field).related_model for model, field in EVENT_FOREIGN_KEYS}:
+    _uid = _parent._meta.label_lower
+    pre_delete.connect(collect_deleted_parent, sender=_parent, dispatch_uid=f'collect_deleted_parent_{_uid}')
+    post_delete.connect(delete_event_rows, sender=_parent, dispatch_uid=f'delete_event_rows_{_uid}')
@@ -0,0 +1,123 @@
+"""
+Import-time and memory profile of a booting worker.
+
+`profile_startup()` starts a fresh interpreter with `python -X importtime`,
+boots `Online_Course.wsgi` the way a gunicorn worker does (settings, apps,
+middleware, then the URLconf and views that the first request loads) and
+reports:
+
+- wall time and RSS once the worker is ready to serve;
+- import time per top-level package (the modules' own time from
+  `-X importtime`, not counting other packages they import);
+- RSS growth per top-level package, measured the same way.
+
+Used by `manage.py profile_startup` and the startup budget test.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Worker boot budget checked by core/tests/test_startup_budget.py and
+# `profile_startup --check`. Measured at ~0.4s / ~48MB on a 1-CPU dev box;
+# the headroom absorbs slower CI machines, not new heavy imports.
+STARTUP_BUDGET_SECONDS = 2.0
+STARTUP_BUDGET_MB = 70
+
+# Only needed by specific features; a worker must boot without importing them
+LAZY_MODULES = ('razorpay', 'pandas', 'numpy', 'openpyxl', 'reportlab')
+
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| \s*(\S+)$')
+
+# Runs in the child interpreter. Every first import of a module goes through
+# importlib's _find_and_load, whichever way it was requested; RSS growth while
+# it runs, minus that of the modules it imports in turn, is charged to the
+# module's top-level package.
+_CHILD = r'''
+import importlib._bootstrap as bootstrap
+import json, os, sys, time
+
+start = time.perf_counter()
+page = os.sysconf('SC_PAGE_SIZE')
+
+def rss_kb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * page // 1024
+
+rss = {}
+stack = []
+real_find_and_load = bootstrap._find_and_load
+
+def find_and_load(name, import_):
+    before = rss_kb()
+    stack.append(0)
+    try:
+        return real_find_and_load(name, import_)
+    finally:
+        grown = rss_kb() - before
+        nested = stack.pop()
+        top = name.partition('.')[0]
+        rss[top] = rss.get(top, 0) + grown - nested
+        if stack:
+            stack[-1] += grown
+
+bootstrap._find_and_load = find_and_load
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Online_Course.settings')
+from Online_Course.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+bootstrap._find_and_load = real_find_and_load
+
+print(json.dumps({
+    'seconds': time.perf_counter() - start,
+    'rss_kb': rss_kb(),
+    'package_rss_kb': rss,
+    'loaded': sorted({m.partition('.')[0] for m in sys.modules}),
+}))
+'''
+
+
+def _parse_importtime(stderr):
+    """Self import time in microseconds per top-level package from `-X importtime`."""
+    totals = defaultdict(int)
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            totals[match.group(3).partition('.')[0]] += int(match.group(1))
+    return dict(totals)
+
+
+def profile_startup(env=None):
+    """Boot a worker in a subprocess and return its startup profile as a dict."""
+    child_env = dict(os.environ, **(env or {}))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD],
+        cwd=BASE_DIR, env=child_env, capture_output=True, text=True, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f'Worker boot failed:\n{proc.stderr[-2000:]}')
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    import_us = _parse_importtime(proc.stderr)
+    packages = sorted(
+        set(import_us) | set(result['package_rss_kb']),
+        key=lambda name: -import_us.get(name, 0),
+    )
+    return {
+        'seconds': round(result['seconds'], 3),
+        'rss_mb': round(result['rss_kb'] / 1024, 1),
+        'packages': [
+            {
+                'name': name,
+                'import_ms': round(import_us.get(name, 0) / 1000, 1),
+                'rss_kb': result['package_rss_kb'].get(name, 0),
+            }
+            for name in packages
+        ],
+        'lazy_modules_loaded': [name for name in LAZY_MODULES if name in result['loaded']],
+    }
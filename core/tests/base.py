@@ -0,0 +1,95 @@
+"""
+Query budget assertions, and `StudentTestCase` for tests that act as the
+seed data's student.
+
+`assertQueryBudget` fails when a block runs more queries than allowed and
+prints a unified diff between the recorded query shapes for that test
+(`query_snapshots/<test>.sql`) and what actually ran, so an N+1 shows up as a
+run of added lines rather than a bare number.
+
+Refresh the snapshots after an intentional change with:
+
+    UPDATE_QUERY_SNAPSHOTS=1 python manage.py test core
+"""
+
+import difflib
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .fixtures import build_catalog
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / 'query_snapshots'
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_IN_LIST_RE = re.compile(r'IN \((?:\?, )*\?\)')
+_SAVEPOINT_RE = re.compile(r'"s\d+_x\d+"')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize_sql(sql):
+    """Replace literals so queries differing only by parameters compare equal."""
+    sql = _SAVEPOINT_RE.sub('"savepoint"', sql)
+    sql = _STRING_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('IN (...)', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    # The manifest storage needs collectstatic output; tests render templates without it
+    STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage',
+    # Keep cached values from leaking between tests (primary keys are reused)
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class QueryBudgetTestCase(TestCase):
+    """TestCase with a query budget assertion backed by SQL snapshots."""
+
+    # Event models are routed to the analytics alias when one is configured
+    databases = '__all__'
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    @contextmanager
+    def assertQueryBudget(self, budget, name=None):
+        name = name or self.id().rsplit('.', 2)[-2] + '.' + self._testMethodName
+        with CaptureQueriesContext(connection) as ctx:
+            yield ctx
+        actual = [normalize_sql(q['sql']) for q in ctx.captured_queries]
+        snapshot = SNAPSHOT_DIR / f'{name}.sql'
+
+        if os.environ.get('UPDATE_QUERY_SNAPSHOTS'):
+            SNAPSHOT_DIR.mkdir(exist_ok=True)
+            snapshot.write_text('\n'.join(actual) + '\n', encoding='utf-8')
+
+        if len(actual) > budget:
+            expected = snapshot.read_text(encoding='utf-8').splitlines() if snapshot.exists() else []
+            diff = '\n'.join(difflib.unified_diff(
+                expected, actual, fromfile=f'{snapshot.name} (recorded)', tofile='actual', lineterm='',
+            ))
+            self.fail(
+                f'{name}: {len(actual)} queries executed, budget is {budget}.\n'
+                f'{diff or chr(10).join(actual)}'
+            )
+
+
+class StudentTestCase(QueryBudgetTestCase):
+    """`self.data` is `fixtures.build_catalog()`; the client is logged in as its student."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = build_catalog()
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.data.student)
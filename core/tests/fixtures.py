@@ -0,0 +1,146 @@
+"""
+Realistic seed data shared by the core test suite.
+
+`build_catalog()` creates, with bulk inserts:
+- a 90-day flagship course (3 lessons per day) with a 150-question exam
+- two smaller courses
+- a student enrolled in all three, who has watched half of the flagship
+  course and has one submitted (failed) attempt on its exam
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from core.models import (
+    Course, CourseAccess, CourseExam, CoursePayment, CourseProgress,
+    CourseScheduleDay, CourseScheduleItem, ExamAnswer, ExamAttempt,
+    ExamQuestion, VideoPlay,
+)
+
+PASSWORD = 'test-password'
+
+
+def _make_course(name, days, items_per_day, order=0):
+    course = Course.objects.create(
+        name=name,
+        description=f'{name} description',
+        original_price=Decimal('9999.00'),
+        discounted_price=Decimal('4999.00'),
+        order=order,
+    )
+    schedule_days = CourseScheduleDay.objects.bulk_create([
+        CourseScheduleDay(course=course, title=f'Day {d:02d}', order=d)
+        for d in range(1, days + 1)
+    ])
+    CourseScheduleItem.objects.bulk_create([
+        CourseScheduleItem(day=day, title=f'{day.title} - Lesson {i}', order=i,
+                           video_url='https://example.com/video')
+        for day in schedule_days
+        for i in range(1, items_per_day + 1)
+    ])
+    return course
+
+
+def _make_exam(course, questions):
+    exam = CourseExam.objects.create(course=course, title=f'{course.name} Final Exam', duration_minutes=180)
+    ExamQuestion.objects.bulk_create([
+        ExamQuestion(
+            exam=exam,
+            question_text=f'Question {n}?',
+            option_a='Alpha', option_b='Bravo', option_c='Charlie', option_d='Delta',
+            correct_answer='ABCD'[n % 4],
+            explanation=f'Explanation {n}',
+            order=n,
+        )
+        for n in range(1, questions + 1)
+    ])
+    return exam
+
+
+def _enroll(user, course):
+    payment = CoursePayment.objects.create(
+        user=user, course=course, order_id=f'order_{user.pk}_{course.pk}',
+        amount=course.discounted_price, first_name='Test', last_name='Student',
+        email=user.email, phone='9999999999', address='1 Test Street',
+        city='Chennai', state='TN', zip_code='600001', status='successful',
+    )
+    access = CourseAccess.objects.create(user=user, course=course, payment=payment)
+    CourseProgress.objects.create(course_access=access, completed_lessons=[])
+    return access
+
+
+def build_catalog():
+    flagship = _make_course('Python Full Stack', days=90, items_per_day=3, order=1)
+    design = _make_course('UI UX Designing', days=30, items_per_day=2, order=2)
+    data = _make_course('Data Analytics', days=45, items_per_day=2, order=3)
+    exam = _make_exam(flagship, questions=150)
+
+    student = User.objects.create_user(
+        username='student@example.com', email='student@example.com',
+        password=PASSWORD, first_name='Test Student',
+    )
+    accesses = [_enroll(student, course) for course in (flagship, design, data)]
+    flagship_access = accesses[0]
+
+    items = list(CourseScheduleItem.objects.filter(day__course=flagship).order_by('day__order', 'order'))
+    watched = items[: len(items) // 2]
+    VideoPlay.objects.bulk_create([VideoPlay(user=student, course_item=item) for item in watched])
+    progress = flagship_access._progress
+    progress.completed_lessons = [item.id for item in watched]
+    progress.save()
+
+    questions = list(exam.questions.order_by('order'))
+    now = timezone.now()
+    past_attempt = ExamAttempt.objects.create(
+        course_access=flagship_access,
+        attempt_number=1,
+        total_questions=len(questions),
+        duration_minutes=exam.duration_minutes,
+    )
+    ExamAnswer.objects.bulk_create([
+        ExamAnswer(attempt=past_attempt, question=q, selected_answer='A', is_correct=(q.correct_answer == 'A'))
+        for q in questions
+    ])
+    correct = sum(1 for q in questions if q.correct_answer == 'A')
+    ExamAttempt.objects.filter(pk=past_attempt.pk).update(
+        state=ExamAttempt.STATE_GRADED,
+        is_submitted=True,
+        submitted_at=now,
+        time_taken_seconds=1800,
+        correct_answers=correct,
+        score_percentage=Decimal(correct * 100) / len(questions),
+        is_passed=False,
+    )
+    past_attempt.refresh_from_db()
+
+    return SimpleNamespace(
+        flagship=flagship,
+        design=design,
+        data=data,
+        exam=exam,
+        questions=questions,
+        items=items,
+        student=student,
+        access=flagship_access,
+        past_attempt=past_attempt,
+    )
+
+
+def start_attempt(access, exam, answered=0):
+    """Create an in-progress attempt with the first `answered` questions answered 'B'."""
+    number = (ExamAttempt.objects.filter(course_access=access).order_by('-attempt_number')
+              .values_list('attempt_number', flat=True).first() or 0) + 1
+    question_ids = list(exam.questions.filter(is_active=True).order_by('order', 'id').values_list('id', flat=True))
+    total = len(question_ids)
+    return ExamAttempt.objects.create(
+        course_access=access,
+        attempt_number=number,
+        state=ExamAttempt.STATE_IN_PROGRESS,
+        question_ids=question_ids,
+        total_questions=total,
+        duration_minutes=exam.duration_minutes,
+        answer_vector=('B' * answered).ljust(total, '-'),
+    )
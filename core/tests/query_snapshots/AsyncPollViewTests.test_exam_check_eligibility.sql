@@ -0,0 +1,5 @@
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at", "core_courseexam"."id", "core_courseexam"."course_id", "core_courseexam"."title", "core_courseexam"."description", "core_courseexam"."duration_minutes", "core_courseexam"."passing_score", "core_courseexam"."max_attempts", "core_courseexam"."question_count", "core_courseexam"."is_active", "core_courseexam"."created_at", "core_courseexam"."updated_at" FROM "core_course" LEFT OUTER JOIN "core_courseexam" ON ("core_course"."id" = "core_courseexam"."course_id") WHERE "core_course"."id" = ? LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at", "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseaccess" LEFT OUTER JOIN "core_courseprogress" ON ("core_courseaccess"."id" = "core_courseprogress"."course_access_id") WHERE ("core_courseaccess"."course_id" = ? AND "core_courseaccess"."is_active" AND "core_courseaccess"."user_id" = ?) LIMIT ?
+SELECT "core_coursescheduleitem"."id" FROM "core_coursescheduleitem" INNER JOIN "core_coursescheduleday" ON ("core_coursescheduleitem"."day_id" = "core_coursescheduleday"."id") WHERE ("core_coursescheduleday"."course_id" = ? AND "core_coursescheduleitem"."is_active")
+SELECT COUNT(*) AS "__count" FROM "core_examattempt" WHERE ("core_examattempt"."course_access_id" = ? AND "core_examattempt"."is_submitted")
+SELECT ? AS "a" FROM "core_examattempt" WHERE ("core_examattempt"."course_access_id" = ? AND "core_examattempt"."is_passed") LIMIT ?
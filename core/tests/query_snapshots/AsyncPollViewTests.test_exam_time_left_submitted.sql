@@ -0,0 +1,2 @@
+SELECT "core_examattempt"."id", "core_examattempt"."course_access_id", "core_examattempt"."attempt_number", "core_examattempt"."state", "core_examattempt"."question_seed", "core_examattempt"."answer_vector", "core_examattempt"."results_snapshot", "core_examattempt"."started_at", "core_examattempt"."submitted_at", "core_examattempt"."time_taken_seconds", "core_examattempt"."is_submitted", "core_examattempt"."is_passed", "core_examattempt"."score_percentage", "core_examattempt"."correct_answers", "core_examattempt"."total_questions", "core_examattempt"."has_violations", "core_examattempt"."violation_count", "core_examattempt"."duration_minutes", "core_examattempt"."created_at", "core_examattempt"."updated_at", "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at", "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at", "core_courseexam"."id", "core_courseexam"."course_id", "core_courseexam"."title", "core_courseexam"."description", "core_courseexam"."duration_minutes", "core_courseexam"."passing_score", "core_courseexam"."max_attempts", "core_courseexam"."question_count", "core_courseexam"."is_active", "core_courseexam"."created_at", "core_courseexam"."updated_at" FROM "core_examattempt" INNER JOIN "core_courseaccess" ON ("core_examattempt"."course_access_id" = "core_courseaccess"."id") INNER JOIN "core_course" ON ("core_courseaccess"."course_id" = "core_course"."id") LEFT OUTER JOIN "core_courseexam" ON ("core_course"."id" = "core_courseexam"."course_id") WHERE ("core_courseaccess"."user_id" = ? AND "core_examattempt"."id" = ?) LIMIT ?
+SELECT MAX("core_examquestion"."updated_at") AS "updated_at", COUNT("core_examquestion"."id") AS "total" FROM "core_examquestion" WHERE "core_examquestion"."exam_id" = ?
@@ -0,0 +1,6 @@
+SELECT "auth_user"."id", "auth_user"."password", "auth_user"."last_login", "auth_user"."is_superuser", "auth_user"."username", "auth_user"."first_name", "auth_user"."last_name", "auth_user"."email", "auth_user"."is_staff", "auth_user"."is_active", "auth_user"."date_joined" FROM "auth_user" WHERE "auth_user"."id" = ? LIMIT ?
+SELECT "core_examattempt"."id", "core_examattempt"."course_access_id", "core_examattempt"."attempt_number", "core_examattempt"."state", "core_examattempt"."question_seed", "core_examattempt"."question_ids", "core_examattempt"."answer_vector", "core_examattempt"."results_snapshot", "core_examattempt"."started_at", "core_examattempt"."submitted_at", "core_examattempt"."time_taken_seconds", "core_examattempt"."is_submitted", "core_examattempt"."is_passed", "core_examattempt"."score_percentage", "core_examattempt"."correct_answers", "core_examattempt"."total_questions", "core_examattempt"."has_violations", "core_examattempt"."violation_count", "core_examattempt"."duration_minutes", "core_examattempt"."created_at", "core_examattempt"."updated_at" FROM "core_examattempt" INNER JOIN "core_courseaccess" ON ("core_examattempt"."course_access_id" = "core_courseaccess"."id") WHERE ("core_courseaccess"."user_id" = ? AND "core_examattempt"."id" = ?) LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at" FROM "core_courseaccess" WHERE "core_courseaccess"."id" = ? LIMIT ?
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_course" WHERE "core_course"."id" = ? LIMIT ?
+SELECT "core_courseexam"."id", "core_courseexam"."course_id", "core_courseexam"."title", "core_courseexam"."description", "core_courseexam"."duration_minutes", "core_courseexam"."passing_score", "core_courseexam"."max_attempts", "core_courseexam"."question_count", "core_courseexam"."is_active", "core_courseexam"."created_at", "core_courseexam"."updated_at" FROM "core_courseexam" WHERE "core_courseexam"."course_id" = ? LIMIT ?
+SELECT "core_examquestion"."id", "core_examquestion"."order", "core_examquestion"."question_text", "core_examquestion"."option_a", "core_examquestion"."option_b", "core_examquestion"."option_c", "core_examquestion"."option_d" FROM "core_examquestion" WHERE ("core_examquestion"."exam_id" = ? AND "core_examquestion"."id" IN (...) AND "core_examquestion"."is_active")
@@ -0,0 +1,4 @@
+SELECT "auth_user"."id", "auth_user"."password", "auth_user"."last_login", "auth_user"."is_superuser", "auth_user"."username", "auth_user"."first_name", "auth_user"."last_name", "auth_user"."email", "auth_user"."is_staff", "auth_user"."is_active", "auth_user"."date_joined" FROM "auth_user" WHERE "auth_user"."id" = ? LIMIT ?
+SELECT "core_examattempt"."id", "core_examattempt"."course_access_id", "core_examattempt"."attempt_number", "core_examattempt"."state", "core_examattempt"."question_seed", "core_examattempt"."question_ids", "core_examattempt"."answer_vector", "core_examattempt"."results_snapshot", "core_examattempt"."started_at", "core_examattempt"."submitted_at", "core_examattempt"."time_taken_seconds", "core_examattempt"."is_submitted", "core_examattempt"."is_passed", "core_examattempt"."score_percentage", "core_examattempt"."correct_answers", "core_examattempt"."total_questions", "core_examattempt"."has_violations", "core_examattempt"."violation_count", "core_examattempt"."duration_minutes", "core_examattempt"."created_at", "core_examattempt"."updated_at" FROM "core_examattempt" INNER JOIN "core_courseaccess" ON ("core_examattempt"."course_access_id" = "core_courseaccess"."id") WHERE ("core_courseaccess"."user_id" = ? AND "core_examattempt"."id" = ?) LIMIT ?
+UPDATE "core_examviolation" SET "violation_count" = ("core_examviolation"."violation_count" + ?), "description" = ? WHERE ("core_examviolation"."attempt_id" = ? AND "core_examviolation"."violation_type" = ?)
+UPDATE "core_examattempt" SET "has_violations" = ?, "violation_count" = ("core_examattempt"."violation_count" + ?), "updated_at" = ? WHERE "core_examattempt"."id" = ?
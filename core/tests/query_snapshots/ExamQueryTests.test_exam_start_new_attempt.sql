@@ -0,0 +1,12 @@
+SELECT "auth_user"."id", "auth_user"."password", "auth_user"."last_login", "auth_user"."is_superuser", "auth_user"."username", "auth_user"."first_name", "auth_user"."last_name", "auth_user"."email", "auth_user"."is_staff", "auth_user"."is_active", "auth_user"."date_joined" FROM "auth_user" WHERE "auth_user"."id" = ? LIMIT ?
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_course" WHERE "core_course"."id" = ? LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at" FROM "core_courseaccess" WHERE ("core_courseaccess"."course_id" = ? AND "core_courseaccess"."is_active" AND "core_courseaccess"."user_id" = ?) LIMIT ?
+SELECT "core_courseexam"."id", "core_courseexam"."course_id", "core_courseexam"."title", "core_courseexam"."description", "core_courseexam"."duration_minutes", "core_courseexam"."passing_score", "core_courseexam"."max_attempts", "core_courseexam"."question_count", "core_courseexam"."is_active", "core_courseexam"."created_at", "core_courseexam"."updated_at" FROM "core_courseexam" WHERE ("core_courseexam"."course_id" = ? AND "core_courseexam"."is_active") LIMIT ?
+SELECT ? AS "a" FROM "core_examattempt" WHERE ("core_examattempt"."course_access_id" = ? AND "core_examattempt"."is_passed") LIMIT ?
+SELECT "core_examattempt"."id", "core_examattempt"."course_access_id", "core_examattempt"."attempt_number", "core_examattempt"."state", "core_examattempt"."question_seed", "core_examattempt"."question_ids", "core_examattempt"."answer_vector", "core_examattempt"."results_snapshot", "core_examattempt"."started_at", "core_examattempt"."submitted_at", "core_examattempt"."time_taken_seconds", "core_examattempt"."is_submitted", "core_examattempt"."is_passed", "core_examattempt"."score_percentage", "core_examattempt"."correct_answers", "core_examattempt"."total_questions", "core_examattempt"."has_violations", "core_examattempt"."violation_count", "core_examattempt"."duration_minutes", "core_examattempt"."created_at", "core_examattempt"."updated_at" FROM "core_examattempt" WHERE ("core_examattempt"."course_access_id" = ? AND NOT "core_examattempt"."is_submitted") ORDER BY "core_examattempt"."attempt_number" DESC LIMIT ?
+SELECT COUNT(*) AS "__count" FROM "core_examattempt" WHERE ("core_examattempt"."course_access_id" = ? AND "core_examattempt"."is_submitted")
+SELECT "core_examquestion"."id", "core_examquestion"."correct_answer", "core_examquestion"."topic" FROM "core_examquestion" WHERE ("core_examquestion"."exam_id" = ? AND "core_examquestion"."is_active") ORDER BY "core_examquestion"."order" ASC, "core_examquestion"."id" ASC
+SELECT MAX("core_examattempt"."attempt_number") AS "last" FROM "core_examattempt" WHERE "core_examattempt"."course_access_id" = ?
+SAVEPOINT "savepoint"
+INSERT INTO "core_examattempt" ("course_access_id", "attempt_number", "state", "question_seed", "question_ids", "answer_vector", "results_snapshot", "started_at", "submitted_at", "time_taken_seconds", "is_submitted", "is_passed", "score_percentage", "correct_answers", "total_questions", "has_violations", "violation_count", "duration_minutes", "created_at", "updated_at") VALUES (?, ?, ?, NULL, ?, ?, NULL, ?, NULL, NULL, ?, NULL, NULL, ?, ?, ?, ?, ?, ?, ?) RETURNING "core_examattempt"."id"
+RELEASE SAVEPOINT "savepoint"
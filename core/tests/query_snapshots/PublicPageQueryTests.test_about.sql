@@ -0,0 +1,2 @@
+SELECT "core_aboutpage"."id", "core_aboutpage"."title", "core_aboutpage"."subtitle", "core_aboutpage"."main_image", "core_aboutpage"."background_color", "core_aboutpage"."text_color", "core_aboutpage"."text_font_size", "core_aboutpage"."is_active", "core_aboutpage"."created_at", "core_aboutpage"."updated_at" FROM "core_aboutpage" WHERE "core_aboutpage"."is_active" ORDER BY "core_aboutpage"."updated_at" DESC LIMIT ?
+SELECT "core_aboutsection"."id", "core_aboutsection"."title", "core_aboutsection"."content", "core_aboutsection"."section_type", "core_aboutsection"."image", "core_aboutsection"."background_color", "core_aboutsection"."text_color", "core_aboutsection"."text_font_size", "core_aboutsection"."order", "core_aboutsection"."is_active", "core_aboutsection"."created_at", "core_aboutsection"."updated_at" FROM "core_aboutsection" WHERE "core_aboutsection"."is_active" ORDER BY "core_aboutsection"."order" ASC
@@ -0,0 +1,102 @@
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_course" WHERE ("core_course"."is_active" AND "core_course"."slug" = ?) LIMIT ?
+SELECT "core_courseexam"."id", "core_courseexam"."course_id", "core_courseexam"."title", "core_courseexam"."description", "core_courseexam"."duration_minutes", "core_courseexam"."passing_score", "core_courseexam"."max_attempts", "core_courseexam"."question_count", "core_courseexam"."is_active", "core_courseexam"."created_at", "core_courseexam"."updated_at" FROM "core_courseexam" WHERE ("core_courseexam"."course_id" = ? AND "core_courseexam"."is_active") ORDER BY "core_courseexam"."id" ASC LIMIT ?
+SELECT COUNT(*) AS "__count" FROM "core_examquestion" WHERE ("core_examquestion"."exam_id" = ? AND "core_examquestion"."is_active")
+SELECT "core_coursebrochure"."id", "core_coursebrochure"."course_id", "core_coursebrochure"."title", "core_coursebrochure"."brochure_file", "core_coursebrochure"."is_active", "core_coursebrochure"."created_at", "core_coursebrochure"."updated_at" FROM "core_coursebrochure" WHERE ("core_coursebrochure"."course_id" = ? AND "core_coursebrochure"."is_active") ORDER BY "core_coursebrochure"."id" ASC LIMIT ?
+SELECT "core_coursescheduleday"."id", "core_coursescheduleday"."course_id", "core_coursescheduleday"."title", "core_coursescheduleday"."order", "core_coursescheduleday"."is_active", "core_coursescheduleday"."created_at", "core_coursescheduleday"."updated_at" FROM "core_coursescheduleday" WHERE ("core_coursescheduleday"."course_id" = ? AND "core_coursescheduleday"."is_active") ORDER BY "core_coursescheduleday"."order" ASC, "core_coursescheduleday"."id" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" INNER JOIN "core_coursescheduleday" ON ("core_coursescheduleitem"."day_id" = "core_coursescheduleday"."id") INNER JOIN "core_course" ON ("core_coursescheduleday"."course_id" = "core_course"."id") WHERE "core_coursescheduleitem"."day_id" IN (...) ORDER BY "core_course"."order" ASC, "core_coursescheduleday"."order" ASC, "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" WHERE ("core_coursescheduleitem"."day_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_coursescheduleitem"."order" ASC
+SELECT "core_courselocalinstructor"."id", "core_courselocalinstructor"."course_id", "core_courselocalinstructor"."name", "core_courselocalinstructor"."image", "core_courselocalinstructor"."order", "core_courselocalinstructor"."is_active", "core_courselocalinstructor"."is_primary", "core_courselocalinstructor"."created_at", "core_courselocalinstructor"."updated_at" FROM "core_courselocalinstructor" WHERE ("core_courselocalinstructor"."course_id" = ? AND "core_courselocalinstructor"."is_active") ORDER BY "core_courselocalinstructor"."order" ASC
+SELECT "core_courseinstructor"."id", "core_courseinstructor"."course_id", "core_courseinstructor"."instructor_id", "core_courseinstructor"."order", "core_courseinstructor"."is_primary", "core_courseinstructor"."created_at", "core_courseinstructor"."updated_at", "core_instructor"."id", "core_instructor"."name", "core_instructor"."role", "core_instructor"."image", "core_instructor"."order", "core_instructor"."is_active", "core_instructor"."created_at", "core_instructor"."updated_at" FROM "core_courseinstructor" INNER JOIN "core_instructor" ON ("core_courseinstructor"."instructor_id" = "core_instructor"."id") WHERE "core_courseinstructor"."course_id" = ? ORDER BY "core_courseinstructor"."order" ASC
+SELECT "core_coursefeature"."id", "core_coursefeature"."course_id", "core_coursefeature"."icon", "core_coursefeature"."title", "core_coursefeature"."description", "core_coursefeature"."order" FROM "core_coursefeature" WHERE "core_coursefeature"."course_id" = ? ORDER BY "core_coursefeature"."order" ASC
+SELECT "core_courseskill"."id", "core_courseskill"."course_id", "core_courseskill"."name", "core_courseskill"."order", "core_courseskill"."is_active", "core_courseskill"."created_at", "core_courseskill"."updated_at" FROM "core_courseskill" WHERE ("core_courseskill"."course_id" = ? AND "core_courseskill"."is_active") ORDER BY "core_courseskill"."order" ASC
+SELECT "core_coursetool"."id", "core_coursetool"."course_id", "core_coursetool"."name", "core_coursetool"."icon", "core_coursetool"."order", "core_coursetool"."is_active" FROM "core_coursetool" WHERE ("core_coursetool"."course_id" = ? AND "core_coursetool"."is_active") ORDER BY "core_coursetool"."order" ASC
+SELECT "core_courseoverview"."id", "core_courseoverview"."course_id", "core_courseoverview"."title", "core_courseoverview"."description", "core_courseoverview"."image", "core_courseoverview"."order", "core_courseoverview"."is_active", "core_courseoverview"."created_at", "core_courseoverview"."updated_at" FROM "core_courseoverview" WHERE ("core_courseoverview"."course_id" = ? AND "core_courseoverview"."is_active") ORDER BY "core_courseoverview"."order" ASC
@@ -0,0 +1 @@
+SELECT ? AS "a" FROM "core_course" LIMIT ?
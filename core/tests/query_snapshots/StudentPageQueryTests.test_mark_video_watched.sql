@@ -0,0 +1,12 @@
+SELECT "auth_user"."id", "auth_user"."password", "auth_user"."last_login", "auth_user"."is_superuser", "auth_user"."username", "auth_user"."first_name", "auth_user"."last_name", "auth_user"."email", "auth_user"."is_staff", "auth_user"."is_active", "auth_user"."date_joined" FROM "auth_user" WHERE "auth_user"."id" = ? LIMIT ?
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_course" WHERE ("core_course"."id" = ? AND "core_course"."is_active") LIMIT ?
+SELECT "core_coursescheduleitem"."id", "core_coursescheduleitem"."day_id", "core_coursescheduleitem"."title", "core_coursescheduleitem"."description", "core_coursescheduleitem"."icon", "core_coursescheduleitem"."video_url", "core_coursescheduleitem"."video_file", "core_coursescheduleitem"."thumbnail", "core_coursescheduleitem"."duration", "core_coursescheduleitem"."order", "core_coursescheduleitem"."is_active", "core_coursescheduleitem"."created_at", "core_coursescheduleitem"."updated_at" FROM "core_coursescheduleitem" INNER JOIN "core_coursescheduleday" ON ("core_coursescheduleitem"."day_id" = "core_coursescheduleday"."id") WHERE ("core_coursescheduleday"."course_id" = ? AND "core_coursescheduleitem"."id" = ? AND "core_coursescheduleitem"."is_active") LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at" FROM "core_courseaccess" WHERE ("core_courseaccess"."course_id" = ? AND "core_courseaccess"."is_active" AND "core_courseaccess"."user_id" = ?) ORDER BY "core_courseaccess"."created_at" DESC LIMIT ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_videoplay"."id", "core_videoplay"."user_id", "core_videoplay"."course_item_id", "core_videoplay"."played_at" FROM "core_videoplay" WHERE ("core_videoplay"."course_item_id" = ? AND "core_videoplay"."user_id" = ?) LIMIT ?
+SAVEPOINT "savepoint"
+INSERT INTO "core_videoplay" ("user_id", "course_item_id", "played_at") VALUES (?, ?, ?) RETURNING "core_videoplay"."id"
+RELEASE SAVEPOINT "savepoint"
+SELECT "core_coursescheduleitem"."id" FROM "core_coursescheduleitem" INNER JOIN "core_coursescheduleday" ON ("core_coursescheduleitem"."day_id" = "core_coursescheduleday"."id") INNER JOIN "core_course" ON ("core_coursescheduleday"."course_id" = "core_course"."id") WHERE ("core_coursescheduleday"."course_id" = ? AND "core_coursescheduleitem"."is_active") ORDER BY "core_course"."order" ASC, "core_coursescheduleday"."order" ASC, "core_coursescheduleitem"."order" ASC
+SELECT "core_videoplay"."course_item_id" FROM "core_videoplay" WHERE ("core_videoplay"."course_item_id" IN (...) AND "core_videoplay"."user_id" = ?)
+UPDATE "core_courseprogress" SET "course_access_id" = ?, "progress_percentage" = ?, "completed_lessons" = ?, "ready_for_exam" = ?, "ready_for_exam_date" = NULL, "is_completed" = ?, "completion_date" = NULL, "last_accessed" = ?, "created_at" = ? WHERE "core_courseprogress"."id" = ?
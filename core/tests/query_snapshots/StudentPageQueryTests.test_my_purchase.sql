@@ -0,0 +1,28 @@
+SELECT "auth_user"."id", "auth_user"."password", "auth_user"."last_login", "auth_user"."is_superuser", "auth_user"."username", "auth_user"."first_name", "auth_user"."last_name", "auth_user"."email", "auth_user"."is_staff", "auth_user"."is_active", "auth_user"."date_joined" FROM "auth_user" WHERE "auth_user"."id" = ? LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at", "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at", "core_coursepayment"."id", "core_coursepayment"."user_id", "core_coursepayment"."course_id", "core_coursepayment"."order_id", "core_coursepayment"."payment_id", "core_coursepayment"."amount", "core_coursepayment"."currency", "core_coursepayment"."first_name", "core_coursepayment"."last_name", "core_coursepayment"."email", "core_coursepayment"."phone", "core_coursepayment"."address", "core_coursepayment"."city", "core_coursepayment"."state", "core_coursepayment"."zip_code", "core_coursepayment"."status", "core_coursepayment"."notes", "core_coursepayment"."created_at", "core_coursepayment"."updated_at" FROM "core_courseaccess" INNER JOIN "core_course" ON ("core_courseaccess"."course_id" = "core_course"."id") LEFT OUTER JOIN "core_coursepayment" ON ("core_courseaccess"."payment_id" = "core_coursepayment"."id") WHERE ("core_courseaccess"."is_active" AND "core_courseaccess"."user_id" = ?) ORDER BY "core_courseaccess"."created_at" DESC
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at" FROM "core_courseaccess" WHERE "core_courseaccess"."id" = ? LIMIT ?
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_course" WHERE "core_course"."id" = ? LIMIT ?
+SELECT COUNT(*) AS "__count" FROM "core_coursescheduleitem" INNER JOIN "core_coursescheduleday" ON ("core_coursescheduleitem"."day_id" = "core_coursescheduleday"."id") WHERE ("core_coursescheduleday"."course_id" = ? AND "core_coursescheduleitem"."is_active")
+UPDATE "core_courseprogress" SET "course_access_id" = ?, "progress_percentage" = ?, "completed_lessons" = ?, "ready_for_exam" = ?, "ready_for_exam_date" = NULL, "is_completed" = ?, "completion_date" = NULL, "last_accessed" = ?, "created_at" = ? WHERE "core_courseprogress"."id" = ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at" FROM "core_courseaccess" WHERE "core_courseaccess"."id" = ? LIMIT ?
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_course" WHERE "core_course"."id" = ? LIMIT ?
+SELECT COUNT(*) AS "__count" FROM "core_coursescheduleitem" INNER JOIN "core_coursescheduleday" ON ("core_coursescheduleitem"."day_id" = "core_coursescheduleday"."id") WHERE ("core_coursescheduleday"."course_id" = ? AND "core_coursescheduleitem"."is_active")
+UPDATE "core_courseprogress" SET "course_access_id" = ?, "progress_percentage" = ?, "completed_lessons" = ?, "ready_for_exam" = ?, "ready_for_exam_date" = NULL, "is_completed" = ?, "completion_date" = NULL, "last_accessed" = ?, "created_at" = ? WHERE "core_courseprogress"."id" = ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at" FROM "core_courseaccess" WHERE "core_courseaccess"."id" = ? LIMIT ?
+SELECT "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_course" WHERE "core_course"."id" = ? LIMIT ?
+SELECT COUNT(*) AS "__count" FROM "core_coursescheduleitem" INNER JOIN "core_coursescheduleday" ON ("core_coursescheduleitem"."day_id" = "core_coursescheduleday"."id") WHERE ("core_coursescheduleday"."course_id" = ? AND "core_coursescheduleitem"."is_active")
+UPDATE "core_courseprogress" SET "course_access_id" = ?, "progress_percentage" = ?, "completed_lessons" = ?, "ready_for_exam" = ?, "ready_for_exam_date" = NULL, "is_completed" = ?, "completion_date" = NULL, "last_accessed" = ?, "created_at" = ? WHERE "core_courseprogress"."id" = ?
+SELECT "core_coursepurchasecard"."id", "core_coursepurchasecard"."course_id", "core_coursepurchasecard"."card_image", "core_coursepurchasecard"."title", "core_coursepurchasecard"."description", "core_coursepurchasecard"."button_text", "core_coursepurchasecard"."is_active", "core_coursepurchasecard"."created_at", "core_coursepurchasecard"."updated_at" FROM "core_coursepurchasecard" WHERE "core_coursepurchasecard"."course_id" = ? LIMIT ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_coursepurchasecard"."id", "core_coursepurchasecard"."course_id", "core_coursepurchasecard"."card_image", "core_coursepurchasecard"."title", "core_coursepurchasecard"."description", "core_coursepurchasecard"."button_text", "core_coursepurchasecard"."is_active", "core_coursepurchasecard"."created_at", "core_coursepurchasecard"."updated_at" FROM "core_coursepurchasecard" WHERE "core_coursepurchasecard"."course_id" = ? LIMIT ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_coursepurchasecard"."id", "core_coursepurchasecard"."course_id", "core_coursepurchasecard"."card_image", "core_coursepurchasecard"."title", "core_coursepurchasecard"."description", "core_coursepurchasecard"."button_text", "core_coursepurchasecard"."is_active", "core_coursepurchasecard"."created_at", "core_coursepurchasecard"."updated_at" FROM "core_coursepurchasecard" WHERE "core_coursepurchasecard"."course_id" = ? LIMIT ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at" FROM "core_courseprogress" WHERE "core_courseprogress"."course_access_id" = ? LIMIT ?
+SELECT "core_examcertificate"."id", "core_examcertificate"."exam_attempt_id", "core_examcertificate"."student_name", "core_examcertificate"."student_email", "core_examcertificate"."student_phone", "core_examcertificate"."course_name", "core_examcertificate"."course_duration_days", "core_examcertificate"."course_duration_months", "core_examcertificate"."purchased_date", "core_examcertificate"."joined_date", "core_examcertificate"."exam_score_percentage", "core_examcertificate"."correct_answers", "core_examcertificate"."total_questions", "core_examcertificate"."exam_duration_taken_minutes", "core_examcertificate"."exam_submitted_date", "core_examcertificate"."has_violations", "core_examcertificate"."violation_count", "core_examcertificate"."violation_details", "core_examcertificate"."certificate_file", "core_examcertificate"."certificate_uploaded_date", "core_examcertificate"."admin_notes", "core_examcertificate"."is_active", "core_examcertificate"."created_at", "core_examcertificate"."updated_at", "core_examattempt"."id", "core_examattempt"."course_access_id", "core_examattempt"."attempt_number", "core_examattempt"."state", "core_examattempt"."question_seed", "core_examattempt"."question_ids", "core_examattempt"."answer_vector", "core_examattempt"."results_snapshot", "core_examattempt"."started_at", "core_examattempt"."submitted_at", "core_examattempt"."time_taken_seconds", "core_examattempt"."is_submitted", "core_examattempt"."is_passed", "core_examattempt"."score_percentage", "core_examattempt"."correct_answers", "core_examattempt"."total_questions", "core_examattempt"."has_violations", "core_examattempt"."violation_count", "core_examattempt"."duration_minutes", "core_examattempt"."created_at", "core_examattempt"."updated_at", "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at", "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_examcertificate" INNER JOIN "core_examattempt" ON ("core_examcertificate"."exam_attempt_id" = "core_examattempt"."id") INNER JOIN "core_courseaccess" ON ("core_examattempt"."course_access_id" = "core_courseaccess"."id") INNER JOIN "core_course" ON ("core_courseaccess"."course_id" = "core_course"."id") WHERE ("core_courseaccess"."user_id" = ? AND "core_examcertificate"."is_active") ORDER BY "core_examcertificate"."exam_submitted_date" DESC
+SELECT "core_certificate"."id", "core_certificate"."course_progress_id", "core_certificate"."certificate_type", "core_certificate"."certificate_number", "core_certificate"."issue_date", "core_certificate"."pdf_file", "core_courseprogress"."id", "core_courseprogress"."course_access_id", "core_courseprogress"."progress_percentage", "core_courseprogress"."completed_lessons", "core_courseprogress"."ready_for_exam", "core_courseprogress"."ready_for_exam_date", "core_courseprogress"."is_completed", "core_courseprogress"."completion_date", "core_courseprogress"."last_accessed", "core_courseprogress"."created_at", "core_courseaccess"."id", "core_courseaccess"."user_id", "core_courseaccess"."course_id", "core_courseaccess"."payment_id", "core_courseaccess"."is_active", "core_courseaccess"."created_at", "core_courseaccess"."updated_at", "core_course"."id", "core_course"."name", "core_course"."slug", "core_course"."description", "core_course"."original_price", "core_course"."discounted_price", "core_course"."buy_url", "core_course"."category_id", "core_course"."order", "core_course"."is_active", "core_course"."created_at", "core_course"."updated_at" FROM "core_certificate" INNER JOIN "core_courseprogress" ON ("core_certificate"."course_progress_id" = "core_courseprogress"."id") INNER JOIN "core_courseaccess" ON ("core_courseprogress"."course_access_id" = "core_courseaccess"."id") INNER JOIN "core_course" ON ("core_courseaccess"."course_id" = "core_course"."id") WHERE "core_courseaccess"."user_id" = ?
@@ -0,0 +1,92 @@
+"""
+Answers stored as a per-attempt vector (core/answer_vector.py): saving
+splices one character, grading compares with the answer key and writes the
+ExamAnswer rows the admin and results page read, and attempts that only
+have rows keep working.
+"""
+
+import json
+from unittest import mock
+
+from django.urls import reverse
+
+from core.answer_vector import attempt_questions, grade_vector, load_vector, save_answer
+from core.attempt_state import finalize
+from core.exam_views import _finalize_and_grade_attempt
+from core.models import ExamAnswer, ExamAttempt
+
+from .base import StudentTestCase
+from .fixtures import start_attempt
+
+
+class AnswerVectorTests(StudentTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.attempt = start_attempt(self.data.access, self.data.exam)
+        self.ids = attempt_questions(self.attempt, self.data.exam)
+        key = {q.id: q.correct_answer for q in self.data.questions}
+        self.key = ''.join(key[qid] for qid in self.ids)
+
+    def _save(self, question_id, answer):
+        return self.client.post(reverse('exam_save_answer', args=[self.attempt.id]),
+                                json.dumps({'question_id': question_id, 'selected_answer': answer}),
+                                content_type='application/json')
+
+    def test_saves_splice_the_vector(self):
+        for index, answer in ((0, 'A'), (2, 'C'), (149, 'D'), (2, '')):
+            self.assertEqual(self._save(self.ids[index], answer).status_code, 200)
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.answer_vector, 'A' + '-' * 148 + 'D')
+        self.assertFalse(ExamAnswer.objects.filter(attempt=self.attempt).exists())
+
+    def test_invalid_saves_rejected(self):
+        self.assertEqual(self._save(self.ids[0], 'E').status_code, 400)
+        self.assertEqual(self._save('x', 'A').status_code, 400)
+        self.assertEqual(self._save(self.data.past_attempt.pk + 10 ** 6, 'A').status_code, 404)
+
+    def test_grading_writes_rows(self):
+        vector = self.key[:100] + 'A' * 50
+        ExamAttempt.objects.filter(pk=self.attempt.pk).update(answer_vector=vector)
+        self.attempt.refresh_from_db()
+        expected = 100 + sum(1 for k in self.key[100:] if k == 'A')
+
+        result = _finalize_and_grade_attempt(self.attempt)
+        self.assertEqual(result['correct_count'], expected)
+        rows = ExamAnswer.objects.filter(attempt=self.attempt)
+        self.assertEqual((rows.count(), rows.filter(is_correct=True).count()), (150, expected))
+        # Re-grading replaces the rows instead of adding to them
+        _finalize_and_grade_attempt(self.attempt)
+        self.assertEqual(rows.count(), 150)
+
+    def test_grading_reads_saves_made_after_the_attempt_was_loaded(self):
+        loaded = ExamAttempt.objects.get(pk=self.attempt.pk)
+        self._save(self.ids[0], self.key[0])
+        self.assertEqual(finalize(loaded)['correct_count'], 1)
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.answer_vector[0], self.key[0])
+        self.assertTrue(ExamAnswer.objects.filter(attempt=self.attempt, question_id=self.ids[0]).exists())
+
+    def test_late_save_leaves_graded_vector_alone(self):
+        loaded = ExamAttempt.objects.get(pk=self.attempt.pk)
+        finalize(self.attempt)
+        # The save request read the attempt before grading claimed it
+        self.assertFalse(save_answer(loaded, self.ids, self.ids[0], 'A'))
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.answer_vector, '-' * 150)
+        with mock.patch('core.exam_views.get_object_or_404', return_value=loaded):
+            self.assertEqual(self._save(self.ids[0], 'A').status_code, 400)
+
+    def test_attempt_with_rows_only(self):
+        ExamAttempt.objects.filter(pk=self.attempt.pk).update(answer_vector='')
+        self.attempt.refresh_from_db()
+        ExamAnswer.objects.create(attempt=self.attempt, question_id=self.ids[1], selected_answer='B')
+        self.assertEqual(load_vector(self.attempt, self.ids)[:3], '-B-')
+
+        save_answer(self.attempt, self.ids, self.ids[0], 'C')
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.answer_vector[:3], 'CB-')
+        self.assertEqual(len(self.attempt.answer_vector), 150)
+
+    def test_grade_vector(self):
+        self.assertEqual(grade_vector('AB-D', 'ABCC'), [True, True, False, False])
@@ -0,0 +1,72 @@
+"""
+The async poll endpoints in core/async_views.py must answer exactly like the
+sync views they replace under ASGI, in fewer queries.
+"""
+
+import json
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from django.test import AsyncRequestFactory, RequestFactory
+
+from core import async_views, exam_views, views
+
+from .base import QueryBudgetTestCase
+from .fixtures import build_catalog, start_attempt
+
+
+class AsyncPollViewTests(QueryBudgetTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = build_catalog()
+
+    def _sync(self, view, *args):
+        request = RequestFactory().get('/')
+        request.user = self.data.student
+        return json.loads(view(request, *args).content)
+
+    def _async(self, view, *args, method='get', user=None):
+        # async_to_sync runs the view's ORM calls back on this thread, so
+        # they share the test transaction and the query capture
+        request = getattr(AsyncRequestFactory(), method)('/')
+        request.user = user or self.data.student
+        return async_to_sync(view)(request, *args)
+
+    def test_exam_time_left(self):
+        attempt = start_attempt(self.data.access, self.data.exam)
+        with self.assertQueryBudget(2):
+            response = self._async(async_views.exam_time_left, attempt.id)
+        expected = self._sync(exam_views.exam_time_left, attempt.id)
+        actual = json.loads(response.content)
+        # Both read the clock; allow the second to tick over
+        self.assertAlmostEqual(actual.pop('remaining_seconds'), expected.pop('remaining_seconds'), delta=1)
+        self.assertEqual(actual, expected)
+
+    def test_exam_time_left_submitted(self):
+        with self.assertQueryBudget(2):
+            response = self._async(async_views.exam_time_left, self.data.past_attempt.id)
+        self.assertEqual(json.loads(response.content),
+                         self._sync(exam_views.exam_time_left, self.data.past_attempt.id))
+
+    def test_exam_time_left_rejects_post(self):
+        attempt = start_attempt(self.data.access, self.data.exam)
+        response = self._async(async_views.exam_time_left, attempt.id, method='post')
+        self.assertEqual(response.status_code, 405)
+
+    def test_exam_check_eligibility(self):
+        with self.assertQueryBudget(5):
+            response = self._async(async_views.exam_check_eligibility, self.data.flagship.id)
+        self.assertEqual(json.loads(response.content),
+                         self._sync(exam_views.exam_check_eligibility, self.data.flagship.id))
+
+    def test_check_course_completion(self):
+        with self.assertQueryBudget(5):
+            response = self._async(async_views.check_course_completion, self.data.flagship.id)
+        self.assertEqual(json.loads(response.content),
+                         self._sync(views.check_course_completion, self.data.flagship.id))
+
+    def test_anonymous_user_redirected_to_login(self):
+        response = self._async(async_views.exam_time_left, 1, user=AnonymousUser())
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/login/', response['Location'])
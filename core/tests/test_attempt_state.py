@@ -0,0 +1,92 @@
+"""
+The ExamAttempt state machine in core/attempt_state.py: conditional
+transitions, grading an attempt only once, and concurrent exam starts.
+"""
+
+import json
+from unittest import mock
+
+from django.db import IntegrityError
+from django.urls import reverse
+
+from core import attempt_state
+from core.models import ExamAttempt
+
+from .base import StudentTestCase
+from .fixtures import start_attempt
+
+
+class AttemptStateTests(StudentTestCase):
+
+    def test_transition_is_conditional(self):
+        attempt = start_attempt(self.data.access, self.data.exam)
+        self.assertFalse(attempt_state.transition(attempt, [ExamAttempt.STATE_CREATED], ExamAttempt.STATE_GRADED))
+        self.assertEqual(attempt.state, ExamAttempt.STATE_IN_PROGRESS)
+        self.assertTrue(attempt_state.transition(
+            attempt, attempt_state.OPEN_STATES, ExamAttempt.STATE_GRADED, is_submitted=True,
+        ))
+        self.assertTrue(attempt.is_submitted)
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.state, attempt.is_submitted), (ExamAttempt.STATE_GRADED, True))
+
+    def test_finalize_grades_once(self):
+        attempt = start_attempt(self.data.access, self.data.exam, answered=150)
+        stale = ExamAttempt.objects.get(pk=attempt.pk)
+
+        self.assertEqual(attempt_state.finalize(attempt)['total_questions'], 150)
+        with mock.patch('core.exam_views._finalize_and_grade_attempt') as grade:
+            self.assertIsNone(attempt_state.finalize(stale))
+        grade.assert_not_called()
+        # The loser sees the winner's result
+        self.assertEqual((stale.state, stale.correct_answers), (ExamAttempt.STATE_GRADED, attempt.correct_answers))
+
+    def test_failed_grading_leaves_attempt_open(self):
+        attempt = start_attempt(self.data.access, self.data.exam)
+        with mock.patch('core.exam_views._finalize_and_grade_attempt', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                attempt_state.finalize(attempt)
+        attempt.refresh_from_db()
+        self.assertEqual((attempt.state, attempt.is_submitted), (ExamAttempt.STATE_IN_PROGRESS, False))
+
+    def test_submit_after_auto_submit_reports_result(self):
+        attempt = start_attempt(self.data.access, self.data.exam, answered=150)
+        # A request that loaded the attempt before the timer graded it
+        with mock.patch('core.exam_views.get_object_or_404', return_value=ExamAttempt.objects.get(pk=attempt.pk)):
+            attempt_state.finalize(attempt)
+            response = self.client.post(reverse('exam_submit', args=[attempt.id]), '{}',
+                                        content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['correct_answers'], attempt.correct_answers)
+
+    def test_first_question_load_marks_in_progress(self):
+        self.client.get(reverse('exam_start', args=[self.data.flagship.id]))
+        attempt = ExamAttempt.objects.get(course_access=self.data.access, is_submitted=False)
+        self.assertEqual(attempt.state, ExamAttempt.STATE_CREATED)
+        self.client.get(reverse('exam_get_questions', args=[attempt.id]))
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.state, ExamAttempt.STATE_IN_PROGRESS)
+
+    def test_concurrent_start_returns_the_other_attempt(self):
+        other = start_attempt(self.data.access, self.data.exam)
+        # The other tab's INSERT landed between our MAX() and our INSERT
+        with mock.patch.object(ExamAttempt.objects, 'create', side_effect=IntegrityError):
+            attempt, created = attempt_state.create_attempt(self.data.access, total_questions=150)
+        self.assertEqual((attempt, created), (other, False))
+
+        attempt, created = attempt_state.create_attempt(self.data.access, total_questions=150)
+        self.assertTrue(created)
+        self.assertEqual(attempt.attempt_number, other.attempt_number + 1)
+
+    def test_violation_auto_submit_after_submit_is_noop(self):
+        attempt = start_attempt(self.data.access, self.data.exam)
+        stale = ExamAttempt.objects.get(pk=attempt.pk)
+        attempt_state.finalize(attempt)
+        with mock.patch('core.exam_views.get_object_or_404', return_value=stale), \
+                mock.patch('core.exam_views._finalize_and_grade_attempt') as grade:
+            response = self.client.post(
+                reverse('exam_record_violation', args=[attempt.id]),
+                json.dumps({'violation_type': 'exit_fullscreen', 'auto_submit': True}),
+                content_type='application/json',
+            )
+        self.assertTrue(response.json()['auto_submitted'])
+        grade.assert_not_called()
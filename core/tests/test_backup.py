@@ -0,0 +1,85 @@
+"""
+SQLite backups from core/backup.py: consistent gzipped snapshots, rotation,
+checksum/integrity verification and restore into a live file.
+"""
+
+import gzip
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from core.backup import (
+    SQLITE_SUFFIX, BackupError, backup_name, backup_sqlite, list_backups, prune_backups, restore_sqlite,
+)
+
+
+class SQLiteBackupTests(SimpleTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.db = self.dir / 'live.sqlite3'
+        with sqlite3.connect(self.db) as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE answer (id INTEGER PRIMARY KEY, choice TEXT)')
+            conn.executemany('INSERT INTO answer (choice) VALUES (?)', [('ABCD'[n % 4],) for n in range(5000)])
+        conn.close()
+
+    def _count(self, path):
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute('SELECT COUNT(*) FROM answer').fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_backup_is_compressed_snapshot_with_checksum(self):
+        steps = []
+        path = backup_sqlite(self.db, self.dir / 'backups', pages=4,
+                             progress=lambda status, remaining, total: steps.append(remaining))
+        self.assertTrue(path.name.endswith(SQLITE_SUFFIX))
+        self.assertTrue(Path(f'{path}.sha256').exists())
+        self.assertGreater(len(steps), 1, 'copied in several steps')
+
+        restored = self.dir / 'unpacked.sqlite3'
+        restored.write_bytes(gzip.decompress(path.read_bytes()))
+        self.assertEqual(self._count(restored), 5000)
+
+    def test_restore_replaces_live_data(self):
+        path = backup_sqlite(self.db, self.dir / 'backups')
+        with sqlite3.connect(self.db) as conn:
+            conn.execute('DELETE FROM answer')
+        conn.close()
+
+        restore_sqlite(path, self.db)
+        self.assertEqual(self._count(self.db), 5000)
+
+    def test_restore_rejects_corrupted_backup(self):
+        path = backup_sqlite(self.db, self.dir / 'backups')
+        data = bytearray(path.read_bytes())
+        data[len(data) // 2] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        with self.assertRaises(BackupError):
+            restore_sqlite(path, self.db)
+        self.assertEqual(self._count(self.db), 5000)
+
+    def test_prune_keeps_newest_generations(self):
+        backups = self.dir / 'backups'
+        backups.mkdir()
+        for day in range(1, 6):
+            name = backup_name(SQLITE_SUFFIX, now=datetime(2026, 1, day))
+            (backups / name).write_bytes(b'')
+            (backups / f'{name}.sha256').write_text('x')
+        legacy = backups / 'db_backup_20251121_133018.sqlite3'
+        legacy.write_bytes(b'')
+
+        removed = prune_backups(backups, SQLITE_SUFFIX, keep=2)
+        self.assertEqual(len(removed), 3)
+        remaining = [p.name for p in list_backups(backups, SQLITE_SUFFIX)]
+        self.assertEqual(remaining, ['db_backup_20260105_000000.sqlite3.gz', 'db_backup_20260104_000000.sqlite3.gz'])
+        self.assertFalse(Path(f'{removed[0]}.sha256').exists())
+        self.assertTrue(legacy.exists(), 'plain copies are not ours to rotate')
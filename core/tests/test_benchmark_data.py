@@ -0,0 +1,68 @@
+"""
+Synthetic data from core/benchmark_data.py: a tiny run creates the rows
+its config asks for, and the attempts it writes look like graded ones to
+the results page and item analysis.
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.urls import reverse
+from django.utils import timezone
+
+from core import item_analysis
+from core.benchmark_data import BenchmarkConfig, BenchmarkDataGenerator, delete_benchmark_data
+from core.models import CourseAccess, CourseExam, ExamAnswer, ExamAttempt
+
+from .base import QueryBudgetTestCase
+
+
+class BenchmarkDataTests(QueryBudgetTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = BenchmarkConfig(users=3, courses=2, days=2, items_per_day=2, questions=8,
+                                     enrollments_per_user=2, attempts_per_enrollment=2, chunk_users=2)
+        cls.counts = BenchmarkDataGenerator(cls.config).generate()
+
+    def test_row_counts(self):
+        enrollments = 3 * 2
+        self.assertEqual(self.counts['User'], 3)
+        self.assertEqual(self.counts['Course'], 2)
+        self.assertEqual(self.counts['CourseScheduleItem'], 2 * 2 * 2)
+        self.assertEqual(self.counts['ExamQuestion'], 2 * 8)
+        self.assertEqual(self.counts['CourseAccess'], enrollments)
+        self.assertEqual(self.counts['ExamAttempt'], enrollments * 2)
+        self.assertEqual(self.counts['ExamAnswer'], enrollments * 2 * 8)
+        self.assertEqual(ExamAnswer.objects.count(), self.counts['ExamAnswer'])
+
+    def test_attempts_are_numbered_per_enrollment(self):
+        for access in CourseAccess.objects.all():
+            attempts = list(ExamAttempt.objects.filter(course_access=access).order_by('attempt_number'))
+            self.assertEqual([a.attempt_number for a in attempts], [1, 2])
+            for attempt in attempts:
+                self.assertEqual(len(attempt.question_ids), attempt.total_questions)
+                self.assertEqual(len(attempt.answer_vector), attempt.total_questions)
+
+    def test_attempts_render_in_results(self):
+        attempt = ExamAttempt.objects.select_related('course_access__user').order_by('pk').first()
+        self.client.force_login(attempt.course_access.user)
+        response = self.client.get(reverse('exam_results', args=[attempt.id]))
+        self.assertContains(response, 'Question 1')
+        self.assertContains(response, 'Question 8')
+
+    def test_attempts_fold_into_item_analysis(self):
+        exam = CourseExam.objects.order_by('pk').first()
+        # The generated attempts were submitted just now; fold them in as settled
+        later = timezone.now() + item_analysis.SETTLE + timedelta(seconds=1)
+        with mock.patch.object(item_analysis.timezone, 'now', return_value=later):
+            stats = item_analysis.refresh(exam)
+        attempts = ExamAttempt.objects.filter(course_access__course_id=exam.course_id)
+        self.assertEqual(stats.attempts, attempts.count())
+        report = item_analysis.report(stats, list(exam.questions.order_by('order')))
+        self.assertEqual({item['answers'] for item in report['items']}, {attempts.count()})
+        self.assertIsNotNone(report['kr20'])
+
+    def test_delete(self):
+        self.assertGreater(delete_benchmark_data(), 0)
+        self.assertFalse(ExamAttempt.objects.exists())
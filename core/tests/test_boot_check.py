@@ -0,0 +1,65 @@
+"""
+`boot_check` must skip migrate/collectstatic when nothing changed and run
+them when something did.
+"""
+
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.migrations.recorder import MigrationRecorder
+from django.test import TestCase, override_settings
+
+from core.management.commands.boot_check import static_fingerprint, unapplied_migrations
+
+
+class BootCheckTests(TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = Path(tmp.name) / 'static'
+        self.source.mkdir()
+        (self.source / 'site.css').write_text('body {}')
+        settings = override_settings(
+            STATIC_ROOT=str(Path(tmp.name) / 'collected'),
+            STATICFILES_DIRS=[str(self.source)],
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+            STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage',
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def _boot(self, *args):
+        out = StringIO()
+        call_command('boot_check', '--skip-migrate', *args, stdout=out)
+        return out.getvalue()
+
+    def test_migrated_database_has_nothing_pending(self):
+        self.assertEqual(unapplied_migrations(), [])
+
+    def test_missing_migration_row_is_reported(self):
+        MigrationRecorder.Migration.objects.filter(app='core', name='0001_initial').delete()
+        self.assertIn(('core', '0001_initial'), unapplied_migrations())
+
+    def test_collectstatic_runs_once_until_sources_change(self):
+        self.assertIn('Static sources changed', self._boot())
+        self.assertIn('skipping collectstatic', self._boot())
+
+        css = self.source / 'site.css'
+        css.write_text('body { margin: 0 }')
+        os.utime(css, ns=(0, 0))
+        self.assertIn('Static sources changed', self._boot())
+
+    def test_fingerprint_changes_with_storage(self):
+        before = static_fingerprint()
+        with override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.ManifestStaticFilesStorage'):
+            self.assertNotEqual(static_fingerprint(), before)
+
+    def test_check_mode_fails_without_collecting(self):
+        with self.assertRaises(CommandError):
+            self._boot('--check')
+        self.assertIn('Static sources changed', self._boot())
@@ -0,0 +1,154 @@
+"""
+Tests for core/cache.py: the atomic file-cache `add()`, `get_or_compute` and
+`update_cached`.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase
+
+from core.cache import FileBasedCache, get_or_compute, invalidate, update_cached
+
+
+class FileBasedCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
+        self.cache = FileBasedCache(self.dir, {})
+
+    def test_add_only_succeeds_once(self):
+        self.assertTrue(self.cache.add('lock', 1, 10))
+        self.assertFalse(self.cache.add('lock', 2, 10))
+        self.assertEqual(self.cache.get('lock'), 1)
+
+    def test_add_replaces_expired_entry(self):
+        self.cache.set('lock', 1, 10)
+        with open(self.cache._key_to_file('lock'), 'r+b') as f:
+            # Rewrite the entry with an expiry in the past
+            self.cache._write_content(f, -1, 1)
+        self.assertTrue(self.cache.add('lock', 2, 10))
+        self.assertEqual(self.cache.get('lock'), 2)
+
+    def test_concurrent_add_has_one_winner(self):
+        results = []
+        barrier = threading.Barrier(8)
+
+        def contend():
+            barrier.wait()
+            results.append(self.cache.add('lock', threading.get_ident(), 10))
+
+        threads = [threading.Thread(target=contend) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results.count(True), 1)
+
+
+class GetOrComputeTests(SimpleTestCase):
+
+    def setUp(self):
+        self.cache = LocMemCache('get-or-compute-tests', {})
+        self.cache.clear()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return {'total': 150}
+
+    def test_computes_once_then_serves_cache(self):
+        for _ in range(3):
+            self.assertEqual(get_or_compute('k', self.compute, 60, cache=self.cache), {'total': 150})
+        self.assertEqual(self.calls, 1)
+
+    def test_caches_none(self):
+        get_or_compute('k', lambda: None, 60, cache=self.cache)
+        self.assertIsNone(get_or_compute('k', self.compute, 60, cache=self.cache))
+        self.assertEqual(self.calls, 0)
+
+    def test_invalidate_forces_recompute(self):
+        get_or_compute('k', self.compute, 60, cache=self.cache)
+        invalidate('k', cache=self.cache)
+        get_or_compute('k', self.compute, 60, cache=self.cache)
+        self.assertEqual(self.calls, 2)
+
+    def test_waits_for_lock_holder_instead_of_recomputing(self):
+        self.cache.add('k:lock', 1, 10)
+        # Another worker finishes computing shortly after we start waiting
+        timer = threading.Timer(0.1, lambda: self.cache.set('k', ('theirs', 0.0, time.time() + 60), 60))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertEqual(get_or_compute('k', self.compute, 60, cache=self.cache), 'theirs')
+        self.assertEqual(self.calls, 0)
+
+    def test_computes_after_lock_timeout(self):
+        self.cache.add('k:lock', 1, 10)
+        value = get_or_compute('k', self.compute, 60, lock_timeout=0.1, cache=self.cache)
+        self.assertEqual(value, {'total': 150})
+        # The stale lock belongs to someone else and is left alone
+        self.assertEqual(self.cache.get('k:lock'), 1)
+
+    def test_refreshes_early_near_expiry(self):
+        # Entry about to expire whose computation was slow: XFetch refreshes it
+        self.cache.set('k', ('old', 1000.0, time.time() + 0.001), 60)
+        self.assertEqual(get_or_compute('k', self.compute, 60, cache=self.cache), {'total': 150})
+        self.assertEqual(self.calls, 1)
+
+    def test_early_refresh_serves_current_value_while_locked(self):
+        self.cache.set('k', ('old', 1000.0, time.time() + 0.001), 60)
+        self.cache.add('k:lock', 1, 10)
+        self.assertEqual(get_or_compute('k', self.compute, 60, cache=self.cache), 'old')
+        self.assertEqual(self.calls, 0)
+
+    def test_update_cached_keeps_expiry(self):
+        get_or_compute('k', lambda: [1, 3], 60, cache=self.cache)
+        expires_at = self.cache.get('k')[2]
+        update_cached('k', lambda value: value + [5], cache=self.cache)
+        self.assertEqual(self.cache.get('k'), ([1, 3, 5], self.cache.get('k')[1], expires_at))
+        self.assertIsNone(self.cache.get('k:lock'))
+
+    def test_update_cached_without_entry_does_nothing(self):
+        update_cached('k', lambda value: value + [5], cache=self.cache)
+        self.assertIsNone(self.cache.get('k'))
+
+    def test_update_cached_drops_entry_while_locked(self):
+        get_or_compute('k', lambda: [1], 60, cache=self.cache)
+        self.cache.add('k:lock', 1, 10)
+        update_cached('k', lambda value: value + [5], cache=self.cache)
+        self.assertIsNone(self.cache.get('k'))
+
+    def test_update_during_recompute_is_not_overwritten(self):
+        # The recompute holds the lock and has read [1] when the update
+        # arrives; what it read must not be cached
+        def stale_read():
+            update_cached('k', lambda value: value + [5], cache=self.cache)
+            return [1]
+
+        self.assertEqual(get_or_compute('k', stale_read, 60, cache=self.cache), [1])
+        self.assertIsNone(self.cache.get('k'))
+        self.assertIsNone(self.cache.get('k:lock'))
+        self.assertEqual(get_or_compute('k', lambda: [1, 5], 60, cache=self.cache), [1, 5])
+
+    def test_update_during_unlocked_recompute_is_not_overwritten(self):
+        # A waiter gave up on the lock holder and computes without the lock
+        self.cache.add('k:lock', 1, 10)
+
+        def stale_read():
+            update_cached('k', lambda value: value + [5], cache=self.cache)
+            return [1]
+
+        get_or_compute('k', stale_read, 60, lock_timeout=0.1, cache=self.cache)
+        self.assertIsNone(self.cache.get('k'))
+
+    def test_invalidate_during_recompute_is_not_overwritten(self):
+        def stale_read():
+            invalidate('k', cache=self.cache)
+            return 'old'
+
+        get_or_compute('k', stale_read, 60, cache=self.cache)
+        self.assertIsNone(self.cache.get('k'))
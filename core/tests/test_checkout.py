@@ -0,0 +1,134 @@
+"""
+Checkout keeps the billing details on a pending CoursePayment instead of the
+session, and `purge_sessions` removes expired sessions in batches.
+"""
+
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import razorpay
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import CourseAccess, CoursePayment
+
+from .base import QueryBudgetTestCase
+from .fixtures import PASSWORD, build_catalog
+
+CHECKOUT_FORM = {
+    'first_name': 'Asha',
+    'last_name': 'Rao',
+    'email': 'asha@example.com',
+    'phone': '9876543210',
+    'address': '12 MG Road',
+    'city': 'Chennai',
+    'state': 'Tamil Nadu',
+    'zip': '6000011234567',  # longer than the column; trimmed
+}
+
+
+class CheckoutTests(QueryBudgetTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = build_catalog()
+        cls.buyer = User.objects.create_user(
+            username='buyer@example.com', email='buyer@example.com', password=PASSWORD,
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.buyer)
+        patcher = mock.patch.object(razorpay, 'Client')
+        self.gateway = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.gateway.order.create.return_value = {'id': 'order_TEST1', 'amount': 100, 'currency': 'INR'}
+        self.gateway.payment.fetch.return_value = {'status': 'captured'}
+
+    def _create_order(self):
+        return self.client.post(
+            reverse('create_order', args=[self.data.design.slug]),
+            data=json.dumps(CHECKOUT_FORM), content_type='application/json',
+        )
+
+    def test_create_order_records_pending_payment(self):
+        response = self._create_order()
+        self.assertEqual(response.status_code, 200, response.content)
+
+        payment = CoursePayment.objects.get(order_id='order_TEST1')
+        self.assertEqual(payment.status, 'pending')
+        self.assertEqual(payment.user, self.buyer)
+        self.assertEqual(payment.course, self.data.design)
+        self.assertEqual(payment.city, 'Chennai')
+        self.assertEqual(payment.zip_code, '6000011234')
+        self.assertFalse(any(key.startswith('checkout_') for key in self.client.session.keys()))
+
+    def _callback(self, slug):
+        return self.client.post(
+            reverse('payment_callback', args=[slug]),
+            data=json.dumps({
+                'razorpay_order_id': 'order_TEST1',
+                'razorpay_payment_id': 'pay_TEST1',
+                'razorpay_signature': 'sig',
+            }),
+            content_type='application/json',
+        )
+
+    def test_payment_callback_completes_pending_payment(self):
+        self._create_order()
+        response = self._callback(self.data.design.slug)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        payment = CoursePayment.objects.get(order_id='order_TEST1')
+        self.assertEqual(payment.status, 'successful')
+        self.assertEqual(payment.payment_id, 'pay_TEST1')
+        self.assertEqual(payment.email, 'asha@example.com')
+        access = CourseAccess.objects.get(user=self.buyer, course=self.data.design)
+        self.assertEqual(access.payment, payment)
+
+    def test_payment_callback_rejects_another_users_order(self):
+        self._create_order()
+        other = User.objects.create_user(username='other@example.com', email='other@example.com', password=PASSWORD)
+        self.client.force_login(other)
+        response = self._callback(self.data.design.slug)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(CoursePayment.objects.get(order_id='order_TEST1').status, 'pending')
+        self.assertFalse(CourseAccess.objects.filter(user=other, course=self.data.design).exists())
+
+    def test_payment_callback_rejects_order_for_another_course(self):
+        self._create_order()
+        response = self._callback(self.data.flagship.slug)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(CoursePayment.objects.get(order_id='order_TEST1').status, 'pending')
+        self.assertFalse(CourseAccess.objects.filter(user=self.buyer, course=self.data.flagship).exists())
+
+
+class PurgeSessionsTests(QueryBudgetTestCase):
+
+    def _session(self, key, expires_in):
+        Session.objects.create(
+            session_key=key, session_data='', expire_date=timezone.now() + expires_in,
+        )
+
+    def test_deletes_only_expired_sessions_in_batches(self):
+        for n in range(5):
+            self._session(f'expired{n}', timedelta(days=-1))
+        self._session('live', timedelta(days=1))
+
+        out = StringIO()
+        call_command('purge_sessions', batch_size=2, stdout=out)
+
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['live'])
+        self.assertIn('Purged 5 expired session(s)', out.getvalue())
+
+    def test_dry_run_keeps_sessions(self):
+        self._session('expired', timedelta(days=-1))
+        out = StringIO()
+        call_command('purge_sessions', dry_run=True, stdout=out)
+        self.assertTrue(Session.objects.filter(session_key='expired').exists())
+        self.assertIn('1 expired session(s) would be deleted', out.getvalue())
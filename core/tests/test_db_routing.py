@@ -0,0 +1,242 @@
+"""
+Tests for core/db_routing.py: opt-in replica reads, pinning to the primary
+after writes, and the router's fallbacks; event tables on a separate
+analytics database.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import DO_NOTHING
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils.functional import SimpleLazyObject
+
+from core.db_routing import (
+    PIN_COOKIE, AnalyticsRouter, ReplicaPinningMiddleware, ReplicaRouter, pk_values, read_only,
+    select_or_prefetch, use_primary, use_replica,
+)
+from core.models import ExamAnswer, ExamAttempt, ExamQuestion, VideoPlay
+from core.signals import EVENT_FOREIGN_KEYS
+from core.tests.fixtures import build_catalog
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTests(SimpleTestCase):
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_reads_use_default_unless_opted_in(self):
+        self.assertIsNone(self.router.db_for_read(User))
+        with use_replica():
+            self.assertEqual(self.router.db_for_read(User), 'replica')
+        self.assertIsNone(self.router.db_for_read(User))
+
+    def test_read_only_view(self):
+        @read_only
+        def view(request):
+            return self.router.db_for_read(User)
+
+        self.assertEqual(view(None), 'replica')
+
+    def test_pinned_reads_stay_on_default(self):
+        with use_replica(), use_primary():
+            self.assertIsNone(self.router.db_for_read(User))
+
+    def test_writes_and_migrations_go_to_default(self):
+        with use_replica():
+            self.assertEqual(self.router.db_for_write(User), 'default')
+        self.assertFalse(self.router.allow_migrate('replica', 'core'))
+        self.assertIsNone(self.router.allow_migrate('default', 'core'))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas_is_default_routing(self):
+        with use_replica():
+            self.assertIsNone(self.router.db_for_read(User))
+        self.assertIsNone(self.router.db_for_write(User))
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTransactionTests(TestCase):
+
+    def test_reads_inside_atomic_block_stay_on_default(self):
+        # TestCase wraps each test in a transaction
+        with use_replica():
+            self.assertIsNone(ReplicaRouter().db_for_read(User))
+
+
+@override_settings(DATABASE_REPLICAS=['replica'], REPLICA_PIN_SECONDS=5)
+class ReplicaPinningMiddlewareTests(SimpleTestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.seen = []
+
+        @read_only
+        def view(request):
+            self.seen.append(ReplicaRouter().db_for_read(User))
+            return HttpResponse()
+
+        self.middleware = ReplicaPinningMiddleware(view)
+
+    def test_get_reads_replica_without_cookie(self):
+        response = self.middleware(self.factory.get('/'))
+        self.assertEqual(self.seen, ['replica'])
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_post_pins_and_sets_cookie(self):
+        response = self.middleware(self.factory.post('/'))
+        self.assertEqual(self.seen, [None])
+        self.assertGreater(float(response.cookies[PIN_COOKIE].value), time.time())
+
+    def test_cookie_pins_following_reads(self):
+        request = self.factory.get('/')
+        request.COOKIES[PIN_COOKIE] = str(time.time() + 5)
+        self.middleware(request)
+        self.assertEqual(self.seen, [None])
+
+    def test_expired_or_bad_cookie_is_ignored(self):
+        for value in (str(time.time() - 1), 'junk'):
+            request = self.factory.get('/')
+            request.COOKIES[PIN_COOKIE] = value
+            self.middleware(request)
+        self.assertEqual(self.seen, ['replica', 'replica'])
+
+
+@override_settings(ANALYTICS_DATABASE='analytics', ANALYTICS_MODELS=['core.examanswer', 'core.videoplay'])
+class AnalyticsRouterTests(SimpleTestCase):
+
+    def setUp(self):
+        self.router = AnalyticsRouter()
+
+    def test_event_models_use_analytics(self):
+        self.assertEqual(self.router.db_for_read(ExamAnswer), 'analytics')
+        self.assertEqual(self.router.db_for_write(VideoPlay), 'analytics')
+        self.assertIsNone(self.router.db_for_read(ExamAttempt))
+
+    def test_related_rows_of_event_instances_come_from_default(self):
+        answer = ExamAnswer()
+        answer._state.db = 'analytics'
+        self.assertEqual(self.router.db_for_read(ExamQuestion, instance=answer), 'default')
+
+    def test_migrations_split_by_model(self):
+        self.assertTrue(self.router.allow_migrate('analytics', 'core', 'examanswer'))
+        self.assertFalse(self.router.allow_migrate('analytics', 'core', 'examattempt'))
+        self.assertFalse(self.router.allow_migrate('analytics', 'core'))
+        self.assertFalse(self.router.allow_migrate('default', 'core', 'examanswer'))
+        self.assertIsNone(self.router.allow_migrate('default', 'core', 'examattempt'))
+
+    def test_relations_across_databases_allowed(self):
+        self.assertTrue(self.router.allow_relation(ExamAttempt(), ExamAnswer()))
+        self.assertIsNone(self.router.allow_relation(ExamAttempt(), ExamQuestion()))
+        # request.user is a lazy wrapper around the instance
+        self.assertIsNone(self.router.allow_relation(SimpleLazyObject(User), ExamAttempt()))
+
+    def test_select_or_prefetch(self):
+        queryset = select_or_prefetch(ExamAnswer.objects.all(), 'question')
+        self.assertFalse(queryset.query.select_related)
+        self.assertEqual(queryset._prefetch_related_lookups, ('question',))
+
+    @override_settings(ANALYTICS_DATABASE=None)
+    def test_unconfigured_is_default_routing(self):
+        self.assertIsNone(self.router.db_for_read(ExamAnswer))
+        self.assertIsNone(self.router.allow_migrate('default', 'core', 'examanswer'))
+        queryset = select_or_prefetch(ExamAnswer.objects.all(), 'question')
+        self.assertEqual(queryset.query.select_related, {'question': {}})
+
+
+class EventRowCleanupTests(TestCase):
+
+    databases = '__all__'
+
+    def setUp(self):
+        self.catalog = build_catalog()
+
+    def test_deleting_parents_deletes_event_rows(self):
+        attempt = ExamAttempt.objects.get(course_access__user=self.catalog.student)
+        self.assertTrue(ExamAnswer.objects.filter(attempt=attempt).exists())
+        # The rows go once the parent's delete commits
+        with self.captureOnCommitCallbacks(execute=True):
+            attempt.delete()
+        self.assertFalse(ExamAnswer.objects.filter(attempt_id=attempt.pk).exists())
+
+        self.assertTrue(VideoPlay.objects.filter(user=self.catalog.student).exists())
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.catalog.student.pk).delete()
+        self.assertFalse(VideoPlay.objects.exists())
+
+    def test_event_foreign_keys_are_the_same_on_every_install(self):
+        # Decided in code, not by ANALYTICS_DATABASE, so every machine migrates to one schema
+        for model, name in EVENT_FOREIGN_KEYS:
+            field = model._meta.get_field(name)
+            self.assertIs(field.remote_field.on_delete, DO_NOTHING, field)
+            self.assertFalse(field.db_constraint, field)
+
+    def test_pk_values_is_a_subquery_on_one_database(self):
+        attempts = ExamAttempt.objects.filter(course_access__user=self.catalog.student)
+        with self.settings(ANALYTICS_DATABASE=None):
+            self.assertNotIsInstance(pk_values(attempts, ExamAnswer), list)
+        with self.settings(ANALYTICS_DATABASE='analytics', ANALYTICS_MODELS=['core.examanswer']):
+            self.assertEqual(pk_values(attempts, ExamAnswer), list(attempts.values_list('pk', flat=True)))
+
+
+# Runs against a primary and an analytics SQLite file: event rows land on the
+# analytics one, cross-database reads work and deletes reach them
+_SPLIT_SCRIPT = r'''
+import django
+django.setup()
+import sqlite3, sys
+from django.contrib.auth.models import User
+from core.db_routing import select_or_prefetch
+from core.models import ExamAnswer, VideoPlay
+from core.tests.fixtures import build_catalog
+
+catalog = build_catalog()
+answers = list(select_or_prefetch(ExamAnswer.objects.all(), 'question'))
+assert answers and all(a.question.question_text for a in answers)
+assert VideoPlay.objects.filter(user=catalog.student).exists()
+primary, analytics = sys.argv[1:3]
+tables = lambda path: {r[0] for r in sqlite3.connect(path).execute("SELECT name FROM sqlite_master")}
+assert 'core_examanswer' not in tables(primary) and 'core_examanswer' in tables(analytics)
+assert 'core_examattempt' not in tables(analytics)
+User.objects.all().delete()
+assert not ExamAnswer.objects.exists() and not VideoPlay.objects.exists()
+
+# Hundreds of lessons go with the courses; their plays go in one DELETE per
+# batch, not one per lesson
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from core.models import Course, CourseScheduleItem
+from core.signals import EVENT_FOREIGN_KEYS
+viewer = User.objects.create_user('viewer@example.com')
+VideoPlay.objects.bulk_create([VideoPlay(user=viewer, course_item=item) for item in CourseScheduleItem.objects.all()])
+assert VideoPlay.objects.count() > 200
+with CaptureQueriesContext(connections['analytics']) as queries:
+    Course.objects.all().delete()
+assert not ExamAnswer.objects.exists() and not VideoPlay.objects.exists()
+deletes = [q for q in queries.captured_queries if q['sql'].startswith('DELETE')]
+assert len(deletes) <= len(EVENT_FOREIGN_KEYS), len(deletes)
+print('ok')
+'''
+
+
+class AnalyticsDatabaseSplitTests(SimpleTestCase):
+
+    def test_event_tables_on_second_sqlite_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            primary, analytics = os.path.join(tmp, 'primary.sqlite3'), os.path.join(tmp, 'analytics.sqlite3')
+            env = dict(os.environ, SQLITE_PATH=primary, ANALYTICS_DATABASE_URL=f'sqlite:///{analytics}', DEBUG='true')
+            env.pop('DATABASE_URL', None)
+            env.pop('ANALYTICS_MODELS', None)
+            run = dict(cwd=settings.BASE_DIR, env=env, capture_output=True, text=True)
+            for command in ([sys.executable, 'manage.py', 'boot_check', '--skip-static'],
+                            [sys.executable, '-c', _SPLIT_SCRIPT, primary, analytics]):
+                proc = subprocess.run(command, **run)
+                self.assertEqual(proc.returncode, 0, proc.stderr[-2000:])
+            self.assertEqual(proc.stdout.strip().splitlines()[-1], 'ok')
@@ -0,0 +1,53 @@
+"""
+The exam portal page embeds its bootstrap (questions, saved answers and
+remaining time), so opening an exam is a single request.
+"""
+
+import json
+import re
+from datetime import timedelta
+
+from django.urls import reverse
+
+from core.models import ExamAttempt
+
+from .base import StudentTestCase
+from .fixtures import start_attempt
+
+
+class ExamPortalBootstrapTests(StudentTestCase):
+
+    def _bootstrap(self, response):
+        match = re.search(r'<script id="examBootstrap" type="application/json">(.*?)</script>',
+                          response.content.decode(), re.S)
+        return json.loads(match.group(1))
+
+    def test_page_embeds_questions_answers_and_time(self):
+        attempt = start_attempt(self.data.access, self.data.exam, answered=3)
+        response = self.client.get(reverse('exam_portal', args=[attempt.id]))
+        bootstrap = self._bootstrap(response)
+
+        self.assertEqual(len(bootstrap['questions']), 150)
+        self.assertEqual([q['selected_answer'] for q in bootstrap['questions'][:4]], ['B', 'B', 'B', ''])
+        self.assertNotIn('correct_answer', bootstrap['questions'][0])
+        self.assertGreater(bootstrap['remaining_seconds'], 0)
+        # Same shape as get-questions, which the page still uses after admin edits
+        api = self.client.get(reverse('exam_get_questions', args=[attempt.id])).json()
+        self.assertEqual(api['questions'], bootstrap['questions'])
+
+    def test_opening_marks_attempt_in_progress(self):
+        self.client.get(reverse('exam_start', args=[self.data.flagship.id]))
+        attempt = ExamAttempt.objects.get(course_access=self.data.access, is_submitted=False)
+        self.client.get(reverse('exam_portal', args=[attempt.id]))
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.state, ExamAttempt.STATE_IN_PROGRESS)
+
+    def test_resuming_after_time_ran_out_grades_the_attempt(self):
+        attempt = start_attempt(self.data.access, self.data.exam)
+        ExamAttempt.objects.filter(pk=attempt.pk).update(
+            started_at=attempt.started_at - timedelta(minutes=attempt.duration_minutes + 1),
+        )
+        response = self.client.get(reverse('exam_portal', args=[attempt.id]))
+        self.assertRedirects(response, reverse('exam_results', args=[attempt.id]), fetch_redirect_response=False)
+        attempt.refresh_from_db()
+        self.assertEqual(attempt.state, ExamAttempt.STATE_GRADED)
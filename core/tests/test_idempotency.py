@@ -0,0 +1,93 @@
+"""
+`Idempotency-Key` handling from core/idempotency.py: a retried POST is
+answered from the cache without running the view (or the payment gateway)
+again.
+"""
+
+import json
+from unittest import mock
+
+import razorpay
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+
+from core.idempotency import _cache_key
+from core.models import ExamAttempt
+
+from .base import StudentTestCase
+from .fixtures import PASSWORD, start_attempt
+
+
+class IdempotencyTests(StudentTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.attempt = start_attempt(self.data.access, self.data.exam)
+
+    def _post(self, name, payload, key='key-1'):
+        headers = {'HTTP_IDEMPOTENCY_KEY': key} if key else {}
+        return self.client.post(reverse(name, args=[self.attempt.id]), json.dumps(payload),
+                                content_type='application/json', **headers)
+
+    def test_retried_submit_is_replayed_without_queries(self):
+        first = self._post('exam_submit', {})
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn('Idempotent-Replayed', first)
+
+        with self.assertNumQueries(1):  # the user; the session comes from the cache
+            retry = self._post('exam_submit', {})
+        self.assertEqual((retry.status_code, retry.content), (200, first.content))
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+
+    def test_new_key_runs_the_view(self):
+        self._post('exam_submit', {})
+        response = self._post('exam_submit', {}, key='key-2')
+        self.assertEqual(response.json(), {'error': 'Already submitted'})
+
+    def test_errors_are_not_stored(self):
+        ExamAttempt.objects.filter(pk=self.attempt.pk).update(is_submitted=True)
+        self.assertEqual(self._post('exam_submit', {}).status_code, 400)
+        ExamAttempt.objects.filter(pk=self.attempt.pk).update(is_submitted=False)
+        self.assertEqual(self._post('exam_submit', {}).status_code, 200)
+
+    def test_key_reused_with_other_body(self):
+        question = self.data.questions[0]
+        self._post('exam_save_answer', {'question_id': question.id, 'selected_answer': 'A'})
+        response = self._post('exam_save_answer', {'question_id': question.id, 'selected_answer': 'C'})
+        self.assertEqual(response.status_code, 422)
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.answer_vector[0], 'A')
+
+    def test_request_in_progress_conflicts(self):
+        request = mock.Mock(path=reverse('exam_submit', args=[self.attempt.id]), user=self.data.student)
+        cache.add(_cache_key(request, 'key-1') + ':lock', 1)
+        response = self._post('exam_submit', {})
+        self.assertEqual(response.status_code, 409)
+        self.attempt.refresh_from_db()
+        self.assertFalse(self.attempt.is_submitted)
+
+    def test_keys_are_per_user(self):
+        self._post('exam_record_violation', {'violation_type': 'tab_switch'})
+        other = User.objects.create_user('other@example.com', 'other@example.com', PASSWORD)
+        self.client.force_login(other)
+        # Not replayed from the student's entry: the view runs and 404s
+        self.assertEqual(self._post('exam_record_violation', {'violation_type': 'tab_switch'}).status_code, 404)
+
+    def test_without_header_every_request_runs(self):
+        for _ in range(2):
+            self._post('exam_record_violation', {'violation_type': 'tab_switch'}, key=None)
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.violation_count, 2)
+
+    def test_payment_callback_retry_skips_gateway(self):
+        buyer = User.objects.create_user('buyer@example.com', 'buyer@example.com', PASSWORD)
+        self.client.force_login(buyer)
+        url = reverse('payment_callback', args=[self.data.design.slug])
+        body = json.dumps({'razorpay_order_id': 'order_1', 'razorpay_payment_id': 'pay_1', 'razorpay_signature': 's'})
+        with mock.patch.object(razorpay, 'Client') as client:
+            client.return_value.payment.fetch.return_value = {'status': 'captured'}
+            for _ in range(3):
+                response = self.client.post(url, body, content_type='application/json', HTTP_IDEMPOTENCY_KEY='pay_1')
+                self.assertEqual(response.json()['status'], 'success')
+        client.return_value.payment.fetch.assert_called_once()
@@ -0,0 +1,115 @@
+"""
+Item analysis from core/item_analysis.py: the folded-forward sums give the
+same difficulty, discrimination and KR-20 as computing them from the full
+response matrix, and the exam admin page shows them.
+"""
+
+import random
+from datetime import timedelta
+from unittest import mock
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+
+from core import item_analysis
+from core.models import ExamAnswer, ExamAttempt, ExamItemStats
+
+from .base import QueryBudgetTestCase
+from .fixtures import PASSWORD, _enroll, _make_course, _make_exam
+
+
+class ItemAnalysisTests(QueryBudgetTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        course = _make_course('Statistics', days=1, items_per_day=1)
+        cls.exam = _make_exam(course, questions=6)
+        cls.questions = list(cls.exam.questions.order_by('order'))
+        student = User.objects.create_user('stats@example.com', 'stats@example.com', PASSWORD)
+        cls.access = _enroll(student, course)
+
+    def _grade(self, answers, minutes_ago=10):
+        """A graded attempt with `answers` ('' = skipped) for the exam's questions."""
+        attempt = ExamAttempt.objects.create(
+            course_access=self.access,
+            attempt_number=ExamAttempt.objects.filter(course_access=self.access).count() + 1,
+            total_questions=len(self.questions),
+        )
+        rows = [
+            ExamAnswer(attempt=attempt, question=q, selected_answer=a, is_correct=a == q.correct_answer)
+            for q, a in zip(self.questions, answers) if a
+        ]
+        ExamAnswer.objects.bulk_create(rows)
+        ExamAttempt.objects.filter(pk=attempt.pk).update(
+            state=ExamAttempt.STATE_GRADED, is_submitted=True,
+            submitted_at=timezone.now() - timedelta(minutes=minutes_ago),
+            correct_answers=sum(row.is_correct for row in rows),
+        )
+        return attempt
+
+    def _responses(self, count, seed=7):
+        rng = random.Random(seed)
+        responses = []
+        for _ in range(count):
+            ability = rng.random()
+            responses.append([
+                q.correct_answer if rng.random() < ability else rng.choice('ABCD')
+                for q in self.questions
+            ])
+        return responses
+
+    def test_matches_full_matrix(self):
+        responses = self._responses(40)
+        for answers in responses:
+            self._grade(answers)
+        stats = item_analysis.refresh(self.exam)
+        result = item_analysis.report(stats, self.questions)
+
+        matrix = np.array([[a == q.correct_answer for q, a in zip(self.questions, answers)]
+                           for answers in responses], dtype=float)
+        totals = matrix.sum(axis=1)
+        self.assertEqual(result['attempts'], 40)
+        for j, item in enumerate(result['items']):
+            self.assertAlmostEqual(item['p_value'], matrix[:, j].mean())
+            self.assertAlmostEqual(item['discrimination'], np.corrcoef(matrix[:, j], totals - matrix[:, j])[0, 1])
+            chosen = [answers[j] for answers in responses]
+            self.assertAlmostEqual(item['rates']['A'], chosen.count('A') / 40)
+        k = len(self.questions)
+        expected = k / (k - 1) * (1 - (matrix.mean(axis=0) * (1 - matrix.mean(axis=0))).sum() / totals.var())
+        self.assertAlmostEqual(result['kr20'], expected)
+
+    def test_incremental_equals_rebuild(self):
+        responses = self._responses(30, seed=3)
+        for answers in responses[:20]:
+            self._grade(answers, minutes_ago=20)
+        with mock.patch.object(item_analysis.timezone, 'now', return_value=timezone.now() - timedelta(minutes=15)):
+            item_analysis.refresh(self.exam)
+        for answers in responses[20:]:
+            self._grade(answers[:4] + ['', ''])
+        # Not settled yet, so left for the next refresh
+        self._grade(responses[0], minutes_ago=0)
+
+        stats = item_analysis.refresh(self.exam)
+        self.assertEqual(stats.attempts, 30)
+        folded = (stats.items, stats.score_sum, stats.score_sq_sum, stats.length_sum)
+        stats = item_analysis.refresh(self.exam, rebuild=True)
+        self.assertEqual((stats.items, stats.score_sum, stats.score_sq_sum, stats.length_sum), folded)
+        self.assertEqual(stats.items[str(self.questions[5].id)][0], 20)
+        self.assertEqual(ExamItemStats.objects.count(), 1)
+
+    def test_flags(self):
+        self.assertEqual(item_analysis._flag(5, 0.5, 0.5), 'Too few answers')
+        self.assertEqual(item_analysis._flag(50, 0.95, 0.3), 'Too easy')
+        self.assertIn('answer key', item_analysis._flag(50, 0.5, -0.2))
+        self.assertEqual(item_analysis._flag(50, 0.5, 0.4), '')
+
+    def test_admin_change_page(self):
+        for answers in self._responses(5):
+            self._grade(answers)
+        admin = User.objects.create_superuser('admin@example.com', 'admin@example.com', PASSWORD)
+        self.client.force_login(admin)
+        response = self.client.get(reverse('admin:core_courseexam_change', args=[self.exam.pk]))
+        self.assertContains(response, 'Item analysis')
+        self.assertContains(response, '5 graded attempts')
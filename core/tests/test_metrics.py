@@ -0,0 +1,117 @@
+"""
+Request metrics from core/metrics.py and core/middleware.py: histogram
+buckets, per-request query timing, the Prometheus text format and who may
+read /metrics/.
+"""
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from core.metrics import Histogram, MetricsRegistry, registry
+
+from .base import QueryBudgetTestCase
+
+
+class HistogramTests(SimpleTestCase):
+
+    def test_observations_land_in_upper_bound_buckets(self):
+        hist = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            hist.observe(value)
+        # A value equal to a bound counts towards that bound (le)
+        self.assertEqual(hist.counts, [2, 1, 1])
+        self.assertEqual(list(hist.cumulative()), [('0.1', 2), ('1.0', 3), ('+Inf', 4)])
+        self.assertEqual((hist.count, hist.sum), (4, 2.65))
+
+
+class RenderTests(SimpleTestCase):
+
+    def test_prometheus_text_format(self):
+        metrics = MetricsRegistry()
+        metrics.record('exam_portal', 'GET', 200, 0.02, 3, 0.004)
+        metrics.record('exam_portal', 'GET', 200, 0.3, 5, 0.01)
+        metrics.record('weird"view', 'POST', 500, 0.01, 0, 0.0)
+        lines = metrics.render().splitlines()
+
+        self.assertIn('# TYPE django_request_duration_seconds histogram', lines)
+        self.assertIn('# TYPE django_requests_total counter', lines)
+        labels = [line for line in lines if line.startswith('django_request_db_queries_bucket{view="exam_portal"')]
+        self.assertIn('le="2.0"} 0', labels[2])
+        self.assertIn('le="5.0"} 2', labels[3])
+        self.assertTrue(labels[-1].endswith('le="+Inf"} 2'))
+        self.assertTrue(any(line.startswith('django_request_duration_seconds_count{view="exam_portal",method="GET",pid=')
+                            and line.endswith(' 2') for line in lines))
+        self.assertTrue(any(line.startswith('django_requests_total{view="weird\\"view",method="POST",status="500"')
+                            for line in lines))
+
+    def test_reset(self):
+        metrics = MetricsRegistry()
+        metrics.record('home', 'GET', 200, 0.01, 0, 0.0)
+        metrics.reset()
+        self.assertNotIn('view="home"', metrics.render())
+
+
+@override_settings(METRICS_TOKEN='s3cret')
+class MetricsMiddlewareTests(QueryBudgetTestCase):
+
+    def setUp(self):
+        super().setUp()
+        registry.reset()
+        self.addCleanup(registry.reset)
+
+    def _metric(self, name, **labels):
+        prefix = name + '{' + ','.join(f'{k}="{v}"' for k, v in labels.items()) + ','
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer s3cret')
+        for line in response.content.decode().splitlines():
+            if line.startswith(prefix):
+                return float(line.rsplit(' ', 1)[1])
+        return None
+
+    def test_counts_the_queries_of_each_request(self):
+        self.client.get('/healthz/')
+        self.client.get('/healthz/')
+        # The health check runs one query; unnamed routes are labelled by pattern
+        self.assertEqual(self._metric('django_request_db_queries_sum', view='healthz/', method='GET'), 2)
+        self.assertEqual(self._metric('django_request_db_queries_count', view='healthz/', method='GET'), 2)
+        self.assertGreater(self._metric('django_request_db_seconds_sum', view='healthz/', method='GET'), 0)
+        self.assertEqual(self._metric('django_requests_total', view='healthz/', method='GET', status='200'), 2)
+
+    def test_unresolved_paths_share_one_series(self):
+        self.client.get('/no-such-page/')
+        self.client.get('/nor-this-one/')
+        self.assertEqual(self._metric('django_requests_total', view='<unresolved>', method='GET', status='404'), 2)
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled(self):
+        self.client.get('/healthz/')
+        self.assertIsNone(self._metric('django_requests_total', view='healthz/', method='GET', status='200'))
+
+
+class MetricsAccessTests(QueryBudgetTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('metrics')
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_bearer_token(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION='Bearer s3cret')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        for auth in ('Bearer wrong', 's3cret', ''):
+            self.assertEqual(self.client.get(self.url, HTTP_AUTHORIZATION=auth).status_code, 403)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_no_token_configured_rejects_bearer(self):
+        self.assertEqual(self.client.get(self.url, HTTP_AUTHORIZATION='Bearer ').status_code, 403)
+
+    def test_staff_session(self):
+        user = User.objects.create_user('ops@example.com', password='x')
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        User.objects.filter(pk=user.pk).update(is_staff=True)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_anonymous(self):
+        self.assertEqual(self.client.get(self.url).status_code, 403)
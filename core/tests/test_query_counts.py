@@ -0,0 +1,199 @@
+"""
+Query-count regression tests for the views in core/views.py and
+core/exam_views.py.
+
+Each test pins the number of queries a view may run against the seed data in
+`fixtures.build_catalog()` (90-day course, 150-question exam, three
+enrollments). Lower a budget when a view gets cheaper; never raise one
+without understanding the new queries.
+"""
+
+import json
+from django.urls import reverse
+
+from core import results_snapshot, score_distribution
+from core.models import ExamAttempt
+from core.question_pool import question_pool
+
+from .base import QueryBudgetTestCase, StudentTestCase
+from .fixtures import build_catalog, start_attempt
+
+
+class PublicPageQueryTests(QueryBudgetTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = build_catalog()
+
+    def test_health(self):
+        with self.assertQueryBudget(1):
+            self.assertEqual(self.client.get('/healthz/').status_code, 200)
+
+    def test_home(self):
+        with self.assertQueryBudget(0):
+            self.assertEqual(self.client.get(reverse('home')).status_code, 200)
+
+    def test_about(self):
+        with self.assertQueryBudget(2):
+            self.assertEqual(self.client.get(reverse('about')).status_code, 200)
+
+    def test_course_detail_anonymous(self):
+        url = reverse('course_detail', args=[self.data.flagship.slug])
+        with self.assertQueryBudget(102):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_course_detail_by_id(self):
+        url = reverse('course_detail_by_id', args=[self.data.flagship.id])
+        with self.assertQueryBudget(1):
+            self.assertEqual(self.client.get(url).status_code, 302)
+
+    def test_login_page(self):
+        with self.assertQueryBudget(0):
+            self.assertEqual(self.client.get(reverse('login')).status_code, 200)
+
+
+class StudentPageQueryTests(StudentTestCase):
+
+    def test_course_detail_enrolled(self):
+        url = reverse('course_detail', args=[self.data.flagship.slug])
+        with self.assertQueryBudget(110):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_course_checkout(self):
+        url = reverse('course_checkout', args=[self.data.design.slug])
+        with self.assertQueryBudget(2):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_my_purchase(self):
+        with self.assertQueryBudget(28):
+            self.assertEqual(self.client.get(reverse('my-purchase')).status_code, 200)
+
+    def test_my_results(self):
+        # Score distributions are cached and shared by everyone who took the exam
+        score_distribution.scores(self.data.exam.id, self.data.flagship.id)
+        with self.assertQueryBudget(2):
+            self.assertEqual(self.client.get(reverse('my-results')).status_code, 200)
+
+    def test_mark_video_watched(self):
+        item = self.data.items[-1]
+        url = reverse('mark_video_watched', args=[self.data.flagship.id, item.id])
+        with self.assertQueryBudget(12):
+            response = self.client.post(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+
+    def test_check_course_completion(self):
+        url = reverse('check_course_completion', args=[self.data.flagship.id])
+        with self.assertQueryBudget(6):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total'], len(self.data.items))
+
+
+class ExamQueryTests(StudentTestCase):
+
+    def _attempt(self, answered=0):
+        # The question pool is cached and shared by everyone sitting the exam
+        question_pool(self.data.exam)
+        return start_attempt(self.data.access, self.data.exam, answered=answered)
+
+    def test_exam_check_eligibility(self):
+        url = reverse('exam_check_eligibility', args=[self.data.flagship.id])
+        with self.assertQueryBudget(9):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_exam_start_new_attempt(self):
+        url = reverse('exam_start', args=[self.data.flagship.id])
+        with self.assertQueryBudget(12):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(ExamAttempt.objects.filter(course_access=self.data.access).count(), 2)
+
+    def test_exam_start_resume(self):
+        attempt = self._attempt()
+        url = reverse('exam_start', args=[self.data.flagship.id])
+        with self.assertQueryBudget(6):
+            response = self.client.get(url)
+        self.assertRedirects(response, reverse('exam_portal', args=[attempt.id]), fetch_redirect_response=False)
+
+    def test_exam_portal(self):
+        attempt = self._attempt(answered=40)
+        # Includes the questions the page used to fetch via get-questions
+        with self.assertQueryBudget(6):
+            self.assertEqual(self.client.get(reverse('exam_portal', args=[attempt.id])).status_code, 200)
+
+    def test_exam_get_questions(self):
+        attempt = self._attempt(answered=40)
+        with self.assertQueryBudget(6):
+            response = self.client.get(reverse('exam_get_questions', args=[attempt.id]))
+        self.assertEqual(response.json()['total'], 150)
+
+    def test_exam_time_left(self):
+        attempt = self._attempt()
+        with self.assertQueryBudget(6):
+            response = self.client.get(reverse('exam_time_left', args=[attempt.id]))
+        self.assertFalse(response.json()['is_submitted'])
+
+    def test_exam_time_left_cached(self):
+        # Every later poll during the exam reads the question metadata from the shared cache
+        attempt = self._attempt()
+        url = reverse('exam_time_left', args=[attempt.id])
+        self.client.get(url)
+        with self.assertQueryBudget(5):
+            response = self.client.get(url)
+        self.assertEqual(response.json()['questions_count'], 150)
+
+    def test_exam_save_answer(self):
+        attempt = self._attempt()
+        question = self.data.questions[10]
+        payload = json.dumps({'question_id': question.id, 'selected_answer': 'C'})
+        with self.assertQueryBudget(6):
+            response = self.client.post(reverse('exam_save_answer', args=[attempt.id]), payload,
+                                        content_type='application/json')
+        self.assertEqual(response.json(), {'success': True})
+
+    def test_exam_record_violation(self):
+        attempt = self._attempt()
+        payload = json.dumps({'violation_type': 'tab_switch', 'description': 'blur'})
+        with self.assertQueryBudget(7):
+            response = self.client.post(reverse('exam_record_violation', args=[attempt.id]), payload,
+                                        content_type='application/json')
+        self.assertTrue(response.json()['violation_recorded'])
+
+    def test_exam_record_violation_repeat(self):
+        attempt = self._attempt()
+        url = reverse('exam_record_violation', args=[attempt.id])
+        payload = json.dumps({'violation_type': 'tab_switch', 'description': 'blur'})
+        self.client.post(url, payload, content_type='application/json')
+        with self.assertQueryBudget(4):
+            response = self.client.post(url, payload, content_type='application/json')
+        self.assertTrue(response.json()['violation_recorded'])
+
+    def test_exam_record_violations_batch(self):
+        attempt = self._attempt()
+        events = [{'violation_type': 'window_blur', 'description': f'blur {n}'} for n in range(20)]
+        events.append({'violation_type': 'tab_switch', 'description': 'hidden'})
+        with self.assertQueryBudget(11):
+            response = self.client.post(reverse('exam_record_violations', args=[attempt.id]),
+                                        json.dumps({'events': events}), content_type='application/json')
+        self.assertEqual(response.json()['violations_recorded'], 21)
+
+    def test_exam_submit(self):
+        attempt = self._attempt(answered=150)
+        # Includes reading the answer vector again once the attempt is claimed
+        with self.assertQueryBudget(13):
+            response = self.client.post(reverse('exam_submit', args=[attempt.id]), '{}',
+                                        content_type='application/json')
+        self.assertTrue(response.json()['success'])
+
+    def test_exam_results(self):
+        results_snapshot.ensure(self.data.past_attempt)  # normally written at grading
+        score_distribution.scores(self.data.exam.id, self.data.flagship.id)
+        url = reverse('exam_results', args=[self.data.past_attempt.id])
+        with self.assertQueryBudget(2):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_exam_remind_later(self):
+        url = reverse('exam_remind_later', args=[self.data.flagship.id])
+        with self.assertQueryBudget(2):
+            self.assertEqual(self.client.get(url).status_code, 302)
@@ -0,0 +1,168 @@
+"""
+Per-attempt question sampling from core/question_pool.py: reproducible
+draws from a seed, proportional topic strata, the draw stored on the
+attempt, and the exam views using the attempt's own subset even when the
+exam is edited mid-attempt.
+"""
+
+import json
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from core import signals
+from core.answer_vector import attempt_questions
+from core.models import CourseExam, ExamAttempt, ExamQuestion
+from core.question_pool import _allocate, attempt_pool, question_pool, sample
+
+from .base import QueryBudgetTestCase, StudentTestCase
+from .fixtures import PASSWORD, _make_course, _make_exam
+
+
+def _pool(size, topics=('',)):
+    return [(n, 'A', topics[n % len(topics)]) for n in range(1, size + 1)]
+
+
+class SampleTests(QueryBudgetTestCase):
+
+    def test_same_seed_same_subset(self):
+        pool = _pool(200)
+        first = sample(pool, 50, 42)
+        self.assertEqual(first, sample(pool, 50, 42))
+        self.assertNotEqual(first, sample(pool, 50, 43))
+        self.assertEqual(len(set(first)), 50)
+        self.assertEqual(first, sorted(first))  # pool order
+
+    def test_no_seed_or_whole_pool_keeps_order(self):
+        pool = _pool(20)
+        self.assertEqual(sample(pool, 5, None), pool[:5])
+        self.assertEqual(sample(pool, 20, 7), pool)
+
+    def test_topics_get_proportional_shares(self):
+        pool = _pool(100, topics=('sql', 'sql', 'sql', 'html'))
+        drawn = sample(pool, 20, 5)
+        self.assertEqual(sum(1 for _, _, topic in drawn if topic == 'sql'), 15)
+        self.assertEqual(_allocate([5, 3, 2], 4), [2, 1, 1])
+
+    def test_removing_an_undrawn_question_keeps_the_subset(self):
+        pool = _pool(100)
+        drawn = sample(pool, 30, 9)
+        undrawn = next(entry for entry in pool if entry not in drawn)
+        self.assertEqual(sample([e for e in pool if e != undrawn], 30, 9), drawn)
+
+    def test_adding_questions_or_shifting_quotas_changes_the_subset(self):
+        # Why exam_start stores the draw on the attempt instead of redrawing
+        pool = _pool(100)
+        drawn = sample(pool, 30, 9)
+        grown = pool + [(n, 'A', '') for n in range(101, 201)]
+        self.assertNotEqual([e for e in sample(grown, 30, 9) if e[0] <= 100], drawn)
+
+        pool = _pool(100, topics=('sql', 'html'))
+        drawn = sample(pool, 30, 9)
+        shifted = pool + [(n, 'A', 'sql') for n in range(101, 121)]
+        self.assertNotEqual([e for e in sample(shifted, 30, 9) if e[0] <= 100], drawn)
+
+
+class AttemptSamplingTests(StudentTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        CourseExam.objects.filter(pk=cls.data.exam.pk).update(question_count=40)
+
+    def setUp(self):
+        super().setUp()
+        self.client.get(reverse('exam_start', args=[self.data.flagship.id]))
+        self.attempt = ExamAttempt.objects.get(course_access=self.data.access, is_submitted=False)
+
+    def _questions(self):
+        return self.client.get(reverse('exam_get_questions', args=[self.attempt.id])).json()['questions']
+
+    def _save(self, question_id, answer):
+        return self.client.post(reverse('exam_save_answer', args=[self.attempt.id]),
+                                json.dumps({'question_id': question_id, 'selected_answer': answer}),
+                                content_type='application/json')
+
+    def test_start_stores_a_seeded_subset(self):
+        self.assertIsNotNone(self.attempt.question_seed)
+        self.assertEqual((self.attempt.total_questions, len(self.attempt.answer_vector)), (40, 40))
+        self.assertEqual(self.attempt.question_ids, [qid for qid, _, _ in attempt_pool(self.attempt, self.data.exam)])
+        self.assertEqual([q['id'] for q in self._questions()], self.attempt.question_ids)
+        self.assertNotEqual(self.attempt.question_ids, [q.id for q in self.data.questions[:40]])
+
+    def test_views_read_the_stored_subset(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(attempt_questions(self.attempt, self.data.exam), self.attempt.question_ids)
+
+    def test_answers_and_grading_follow_the_subset(self):
+        ids = self.attempt.question_ids
+        key = {q.id: q.correct_answer for q in self.data.questions}
+        for qid in ids[:10]:
+            self._save(qid, key[qid])
+        outside = next(q.id for q in self.data.questions if q.id not in ids)
+        self.assertEqual(self._save(outside, 'A').status_code, 404)
+
+        result = self.client.post(reverse('exam_submit', args=[self.attempt.id]), '{}',
+                                  content_type='application/json').json()
+        self.assertEqual((result['correct_answers'], result['total_questions']), (10, 40))
+
+    def test_editing_questions_refreshes_the_pool(self):
+        question = ExamQuestion.objects.filter(exam=self.data.exam).order_by('order').first()
+        self.assertIn(question.id, [qid for qid, _, _ in question_pool(self.data.exam)])
+        question.is_active = False
+        question.save()
+        self.assertNotIn(question.id, [qid for qid, _, _ in question_pool(self.data.exam)])
+
+    def test_editing_the_exam_mid_attempt_keeps_answers_in_place(self):
+        ids = self.attempt.question_ids
+        key = {q.id: q.correct_answer for q in self.data.questions}
+        self._save(ids[5], key[ids[5]])
+        self._save(ids[6], 'D' if key[ids[6]] != 'D' else 'C')
+
+        # An earlier question of the attempt is deactivated and a new one is
+        # added ahead of everything; both would shift positions in a redrawn list
+        dropped = ExamQuestion.objects.get(pk=ids[0])
+        dropped.is_active = False
+        dropped.save()
+        added = ExamQuestion.objects.create(exam=self.data.exam, order=0, question_text='New', option_a='a',
+                                    option_b='b', option_c='c', option_d='d', correct_answer='A')
+        self.assertEqual(question_pool(self.data.exam)[0][0], added.id)
+
+        shown = self._questions()
+        self.assertEqual([q['id'] for q in shown], ids[1:])  # no new question, the deactivated one hidden
+        selected = {q['id']: q['selected_answer'] for q in shown}
+        self.assertEqual(selected[ids[5]], key[ids[5]])
+        self.assertNotEqual(selected[ids[6]], '')
+        self.assertEqual(sum(1 for answer in selected.values() if answer), 2)
+
+        self._save(ids[7], key[ids[7]])
+        result = self.client.post(reverse('exam_submit', args=[self.attempt.id]), '{}',
+                                  content_type='application/json').json()
+        self.assertEqual((result['correct_answers'], result['total_questions']), (2, 40))
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.question_ids, ids)
+        self.assertEqual(
+            set(self.attempt.answers.values_list('question_id', flat=True)), {ids[5], ids[6], ids[7]},
+        )
+
+
+class QuestionImportTests(QueryBudgetTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.exam = _make_exam(_make_course('Import', days=1, items_per_day=1), questions=2)
+        cls.admin = User.objects.create_superuser('admin@example.com', 'admin@example.com', PASSWORD)
+
+    def test_csv_import_invalidates_the_pool_once(self):
+        question_pool(self.exam)
+        rows = ['order,question_text,option_a,option_b,option_c,option_d,correct_answer']
+        rows += [f'{n},Imported {n}?,a,b,c,d,B' for n in range(3, 13)]
+        self.client.force_login(self.admin)
+        with mock.patch('core.signals.invalidate', wraps=signals.invalidate) as invalidate:
+            self.client.post(reverse('admin:core_courseexam_bulk_questions_upload', args=[self.exam.pk]), {
+                'csv_file': SimpleUploadedFile('questions.csv', '\n'.join(rows).encode(), content_type='text/csv'),
+            })
+        self.assertEqual(invalidate.call_count, 1)
+        self.assertEqual(len(question_pool(self.exam)), 12)
@@ -0,0 +1,76 @@
+"""
+Results documents from core/results_snapshot.py: written when an attempt
+is graded, built on first view for attempts graded before they existed,
+and what `exam_results` renders from.
+"""
+
+import json
+
+from django.urls import reverse
+
+from core import results_snapshot
+from core.answer_vector import attempt_questions
+from core.attempt_state import finalize
+from core.models import ExamAttempt, ExamViolation
+
+from .base import StudentTestCase
+from .fixtures import start_attempt
+
+
+class ResultsSnapshotTests(StudentTestCase):
+
+    def _graded(self, answered=10, violation=False):
+        attempt = start_attempt(self.data.access, self.data.exam, answered=answered)
+        if violation:
+            ExamViolation.objects.create(attempt=attempt, violation_type='tab_switch', violation_count=3)
+            ExamAttempt.objects.filter(pk=attempt.pk).update(has_violations=True, violation_count=3)
+            attempt.refresh_from_db()
+        finalize(attempt)
+        attempt.refresh_from_db()
+        return attempt
+
+    def test_written_at_grading(self):
+        attempt = self._graded(answered=10)
+        document = results_snapshot.load(attempt)
+        ids = attempt_questions(attempt, self.data.exam)
+        key = {q.id: q.correct_answer for q in self.data.questions}
+        self.assertEqual(document['display_attempt']['id'], attempt.id)
+        self.assertEqual(len(document['answers']), 10)
+        self.assertEqual([a['correct'] for a in document['answers']], [key[qid] for qid in ids[:10]])
+        self.assertEqual(sum(a['is_correct'] for a in document['answers']), attempt.correct_answers)
+        self.assertFalse(document['has_violations'])
+
+    def test_violations_show_last_valid_attempt(self):
+        valid = self._graded(answered=5)
+        flagged = self._graded(answered=20, violation=True)
+        document = results_snapshot.load(flagged)
+        self.assertTrue(document['has_violations'])
+        self.assertEqual(document['violations'], [{'label': 'Tab/Window Switch', 'count': 3, 'description': ''}])
+        self.assertEqual(document['display_attempt']['id'], valid.id)
+        self.assertEqual(document['answers'], results_snapshot.load(valid)['answers'])
+
+    def test_legacy_attempt_built_on_first_view(self):
+        attempt = self.data.past_attempt
+        self.assertIsNone(results_snapshot.load(attempt))
+        url = reverse('exam_results', args=[attempt.id])
+        self.assertContains(self.client.get(url), 'Question 1')
+        attempt.refresh_from_db()
+        self.assertEqual(len(results_snapshot.load(attempt)['answers']), 150)
+
+        with self.assertNumQueries(2):  # user, attempt; the session comes from the cache
+            response = self.client.get(url)
+        self.assertContains(response, reverse('course_detail', args=[self.data.flagship.slug]))
+
+    def test_outdated_version_is_rebuilt(self):
+        attempt = self._graded()
+        document = results_snapshot.load(attempt)
+        document['version'] = results_snapshot.VERSION - 1
+        ExamAttempt.objects.filter(pk=attempt.pk).update(results_snapshot=results_snapshot.encode(document))
+        attempt.refresh_from_db()
+        self.assertIsNone(results_snapshot.load(attempt))
+        self.assertEqual(results_snapshot.ensure(attempt)['version'], results_snapshot.VERSION)
+
+    def test_compressed(self):
+        attempt = self._graded(answered=150)
+        raw = json.dumps(results_snapshot.load(attempt), separators=(',', ':')).encode()
+        self.assertLess(len(attempt.results_snapshot), len(raw) / 2)
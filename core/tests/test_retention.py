@@ -0,0 +1,105 @@
+"""
+Retention policies from core/retention.py: expired rows are archived into
+date partitions and deleted in chunks, state rules hold back rows still in
+use, and restoring a range brings the rows back.
+"""
+
+import gzip
+import json
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import CourseAccess, ExamAnswer, ExamAttempt, VideoPlay
+from core.retention import _partition, archive_policy, get_policies, restore_partitions
+from core.tests.fixtures import build_catalog
+
+
+class RetentionTests(TestCase):
+
+    databases = '__all__'
+
+    def setUp(self):
+        self.catalog = build_catalog()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.policies = get_policies()
+        self.old = timezone.now() - timedelta(days=800)
+        self.attempt = ExamAttempt.objects.get(course_access__user=self.catalog.student)
+
+    def test_expired_answers_are_archived_by_date_and_restored(self):
+        ExamAnswer.objects.update(created_at=self.old)
+        counts = archive_policy(self.policies['core.examanswer'], self.root, chunk_size=40)
+
+        self.assertEqual(counts, {'core.examanswer': 150})
+        self.assertFalse(ExamAnswer.objects.exists())
+        partition = self.root / 'core.examanswer' / f'date={_partition(self.old)}'
+        parts = sorted(partition.glob('*.jsonl.gz'))
+        self.assertEqual(len(parts), 4)  # one file per chunk
+        with gzip.open(parts[0], 'rt') as f:
+            self.assertEqual(json.loads(f.readline())['model'], 'core.examanswer')
+
+        restored = restore_partitions('core.examanswer', self.root)
+        self.assertEqual(restored, 150)
+        self.assertEqual(ExamAnswer.objects.filter(attempt=self.attempt).count(), 150)
+        # Restoring again skips rows that are back already
+        restore_partitions('core.examanswer', self.root)
+        self.assertEqual(ExamAnswer.objects.count(), 150)
+
+    def test_recent_answers_stay(self):
+        self.assertEqual(archive_policy(self.policies['core.examanswer'], self.root), {'core.examanswer': 0})
+        self.assertEqual(ExamAnswer.objects.count(), 150)
+
+    def test_attempts_archive_only_once_enrollment_closed(self):
+        ExamAttempt.objects.update(submitted_at=self.old)
+        policy = self.policies['core.examattempt']
+        self.assertEqual(archive_policy(policy, self.root)['core.examattempt'], 0)
+
+        CourseAccess.objects.update(is_active=False)
+        counts = archive_policy(policy, self.root)
+        self.assertEqual(counts, {'core.examattempt': 1, 'core.examanswer': 150, 'core.examviolation': 0})
+        self.assertFalse(ExamAttempt.objects.exists())
+        self.assertTrue((self.root / 'core.examanswer').is_dir())
+
+        restore_partitions('core.examattempt', self.root)
+        restore_partitions('core.examanswer', self.root)
+        self.assertEqual(ExamAttempt.objects.get().answers.count(), 150)
+
+    def test_plays_kept_while_any_access_is_active(self):
+        VideoPlay.objects.update(played_at=self.old)
+        policy = self.policies['core.videoplay']
+        self.assertEqual(archive_policy(policy, self.root)['core.videoplay'], 0)
+        CourseAccess.objects.update(is_active=False)
+        self.assertEqual(archive_policy(policy, self.root)['core.videoplay'], 135)
+
+    def test_restore_range_selects_partitions(self):
+        ExamAnswer.objects.update(created_at=self.old)
+        archive_policy(self.policies['core.examanswer'], self.root)
+        day = date.fromisoformat(_partition(self.old))
+        self.assertEqual(restore_partitions('core.examanswer', self.root, start=day + timedelta(days=1)), 0)
+        self.assertEqual(restore_partitions('core.examanswer', self.root, start=day, end=day), 150)
+
+    def test_commands(self):
+        ExamAnswer.objects.update(created_at=self.old)
+        out = StringIO()
+        call_command('archive_expired', model=['core.examanswer'], dry_run=True, stdout=out)
+        self.assertIn('150 row(s)', out.getvalue())
+        self.assertEqual(ExamAnswer.objects.count(), 150)
+
+        call_command('archive_expired', model=['core.examanswer'], archive_dir=str(self.root), stdout=out)
+        self.assertFalse(ExamAnswer.objects.exists())
+        call_command('restore_archive', 'core.examanswer', '--from', '2000-01-01', '--to', str(date.today()),
+                     archive_dir=str(self.root), stdout=out)
+        self.assertEqual(ExamAnswer.objects.count(), 150)
+
+    def test_retention_days_override(self):
+        with self.settings(RETENTION_DAYS={'core.examanswer': 0}):
+            out = StringIO()
+            call_command('archive_expired', model=['core.examanswer'], archive_dir=str(self.root), stdout=out)
+        self.assertIn('retention disabled', out.getvalue())
@@ -0,0 +1,65 @@
+"""
+Percentile ranks from the cached score distribution in
+core/score_distribution.py: built on a miss, kept up to date by grading and
+shown on the results pages.
+"""
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from core import score_distribution
+from core.attempt_state import finalize
+from core.models import ExamAttempt
+
+from .base import StudentTestCase
+from .fixtures import start_attempt
+
+
+class ScoreDistributionTests(StudentTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.key = score_distribution.score_distribution_key(self.data.exam.id)
+
+    def _scores(self):
+        return score_distribution.scores(self.data.exam.id, self.data.flagship.id)
+
+    def test_percentile(self):
+        distribution = [10.0, 20.0, 20.0, 40.0]
+        self.assertEqual(score_distribution.percentile(distribution, 20), 50.0)
+        self.assertEqual(score_distribution.percentile(distribution, 5), 0.0)
+        self.assertEqual(score_distribution.percentile(distribution, 40), 87.5)
+        self.assertEqual(score_distribution.percentile(distribution, 30), 75.0)
+        self.assertIsNone(score_distribution.percentile([], 20))
+
+    def test_built_from_graded_attempts(self):
+        start_attempt(self.data.access, self.data.exam)  # not graded, not counted
+        self.assertEqual(self._scores(), [float(self.data.past_attempt.score_percentage)])
+
+    def test_grading_inserts_in_order(self):
+        self._scores()
+        for answered in (150, 0):
+            attempt = start_attempt(self.data.access, self.data.exam, answered=answered)
+            with self.captureOnCommitCallbacks(execute=True):
+                finalize(attempt)
+        expected = sorted(float(score) for score in ExamAttempt.objects.filter(
+            is_submitted=True).values_list('score_percentage', flat=True))
+        self.assertEqual(len(expected), 3)
+        self.assertEqual(self._scores(), expected)
+
+    def test_grading_leaves_missing_distribution_alone(self):
+        attempt = start_attempt(self.data.access, self.data.exam, answered=150)
+        with self.captureOnCommitCallbacks(execute=True):
+            finalize(attempt)
+        self.assertIsNone(cache.get(self.key))
+
+    def test_results_pages_show_percentile(self):
+        attempt = start_attempt(self.data.access, self.data.exam, answered=150)
+        finalize(attempt)
+        response = self.client.get(reverse('exam_results', args=[attempt.id]))
+        self.assertEqual(response.context['percentile'], 75.0)
+        self.assertContains(response, 'Percentile Among All Attempts')
+
+        response = self.client.get(reverse('my-results'))
+        percentiles = {a.id: a.percentile for a in response.context['attempts']}
+        self.assertEqual(percentiles, {attempt.id: 75.0, self.data.past_attempt.id: 25.0})
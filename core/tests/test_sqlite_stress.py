@@ -0,0 +1,30 @@
+"""
+Concurrent answer saves from several processes must not fail with
+"database is locked" on the tuned SQLite backend (core/db_backends/sqlite3),
+while the stock backend does, so the workload still exercises what the
+tuned backend fixes.
+"""
+
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+
+class SQLiteStressTests(SimpleTestCase):
+
+    def _stress(self, **options):
+        out = StringIO()
+        call_command('stress_sqlite', workers=4, saves=100, json=True, stdout=out, **options)
+        return json.loads(out.getvalue())
+
+    def test_concurrent_answer_saves_do_not_lock(self):
+        result = self._stress()
+        self.assertEqual(result['errors'], 0, result['sample_error'])
+        self.assertEqual(result['saves'], 400)
+
+    def test_stock_backend_locks(self):
+        result = self._stress(stock_backend=True)
+        self.assertGreater(result['errors'], 0)
+        self.assertIn('database is locked', result['sample_error'])
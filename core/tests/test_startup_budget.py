@@ -0,0 +1,28 @@
+"""
+A booting worker must stay within the startup budget in
+core/startup_profile.py and must not import optional heavy packages
+(razorpay, pandas, ...) before a feature needs them.
+"""
+
+from django.test import SimpleTestCase
+
+from core.startup_profile import (
+    LAZY_MODULES, STARTUP_BUDGET_MB, STARTUP_BUDGET_SECONDS, profile_startup,
+)
+
+
+class StartupBudgetTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.profile = profile_startup()
+
+    def test_boot_time_within_budget(self):
+        self.assertLessEqual(self.profile['seconds'], STARTUP_BUDGET_SECONDS)
+
+    def test_worker_rss_within_budget(self):
+        self.assertLessEqual(self.profile['rss_mb'], STARTUP_BUDGET_MB)
+
+    def test_optional_packages_not_imported_at_boot(self):
+        self.assertEqual(self.profile['lazy_modules_loaded'], [], f'expected lazy: {", ".join(LAZY_MODULES)}')
@@ -0,0 +1,84 @@
+"""
+Violation recording in core/exam_views.py: F()-incremented counters, the
+batch endpoint the exam portal sends coalesced events to, and auto-submit.
+"""
+
+import json
+
+from django.urls import reverse
+
+from core.exam_views import MAX_VIOLATION_EVENTS, _coalesce_violation_events
+from core.attempt_state import finalize
+from core.models import ExamAttempt, ExamViolation
+
+from .base import StudentTestCase
+from .fixtures import start_attempt
+
+
+class ViolationTests(StudentTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.attempt = start_attempt(self.data.access, self.data.exam)
+
+    def _post(self, name, payload):
+        return self.client.post(reverse(name, args=[self.attempt.id]), json.dumps(payload),
+                                content_type='application/json')
+
+    def test_repeated_violation_increments_counter(self):
+        for n in range(3):
+            response = self._post('exam_record_violation', {'violation_type': 'tab_switch', 'description': f'#{n}'})
+            self.assertEqual(response.status_code, 200)
+        violation = ExamViolation.objects.get(attempt=self.attempt)
+        self.assertEqual((violation.violation_count, violation.description), (3, '#2'))
+        self.attempt.refresh_from_db()
+        self.assertTrue(self.attempt.has_violations)
+        self.assertEqual(self.attempt.violation_count, 3)
+
+    def test_batch_is_coalesced_per_type(self):
+        events = [{'violation_type': 'window_blur'}] * 5 + [{'violation_type': 'tab_switch', 'count': 2}]
+        response = self._post('exam_record_violations', {'events': events})
+        self.assertEqual(response.json(), {'success': True, 'violations_recorded': 7})
+        counts = dict(ExamViolation.objects.filter(attempt=self.attempt).values_list('violation_type', 'violation_count'))
+        self.assertEqual(counts, {'window_blur': 5, 'tab_switch': 2})
+
+        self._post('exam_record_violations', {'events': [{'violation_type': 'window_blur'}]})
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.violation_count, 8)
+
+    def test_batch_auto_submit(self):
+        response = self._post('exam_record_violations', {'events': [
+            {'violation_type': 'window_blur'}, {'violation_type': 'exit_fullscreen', 'auto_submit': True},
+        ]})
+        self.assertTrue(response.json()['auto_submitted'])
+        self.attempt.refresh_from_db()
+        self.assertTrue(self.attempt.is_submitted)
+        self.assertEqual(self.attempt.violation_count, 2)
+        self.assertTrue(ExamViolation.objects.get(attempt=self.attempt, violation_type='exit_fullscreen').auto_submitted)
+
+    def test_grading_keeps_violations_recorded_meanwhile(self):
+        loaded = ExamAttempt.objects.get(pk=self.attempt.pk)
+        self._post('exam_record_violation', {'violation_type': 'tab_switch'})
+        finalize(loaded)
+        self.attempt.refresh_from_db()
+        self.assertTrue(self.attempt.is_submitted)
+        self.assertEqual((self.attempt.has_violations, self.attempt.violation_count), (True, 1))
+
+    def test_invalid_batches_rejected(self):
+        too_many = [{'violation_type': 'window_blur'}] * (MAX_VIOLATION_EVENTS + 1)
+        for payload in ({'events': []}, {'events': 'x'}, {'events': too_many}, {'events': [1]},
+                        {'events': [{'count': 'many'}]}, []):
+            self.assertEqual(self._post('exam_record_violations', payload).status_code, 400, payload)
+        # 1e999 parses to inf, which int() can't convert
+        for name, body in (('exam_record_violations', '{"events": [{"count": 1e999}]}'),
+                           ('exam_record_violation', '{"violation_type": "tab_switch", "count": 1e999}')):
+            response = self.client.post(reverse(name, args=[self.attempt.id]), body, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+        self.assertFalse(ExamViolation.objects.exists())
+
+    def test_coalesce_keeps_auto_submit_and_clamps_counts(self):
+        merged = _coalesce_violation_events([
+            {'violation_type': 'x' * 50, 'auto_submit': True, 'count': 10 ** 9},
+            {'violation_type': 'x' * 50, 'description': 'later', 'count': -5},
+        ])
+        self.assertEqual(merged, {'x' * 20: [1001, 'later', True]})
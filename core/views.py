@@ -9,10 +9,6 @@ from django.views.decorators.csrf import csrf_exempt
 from django.core.exceptions import ImproperlyConfigured
 from django.urls import reverse
 from django.db.models import Count
-try:
-    import razorpay
-except Exception:
-    razorpay = None
 import json
 import logging
 
@@ -29,10 +25,26 @@ from .models import VideoPlay
 # Brochure downloads are stored in a separate module
 from .models_brochure import BrochureDownload
 
+from .db_routing import read_only
+from .idempotency import idempotent
+
 # Module logger
 logger = logging.getLogger(__name__)
 
 
+def _razorpay():
+    """Import the Razorpay SDK on first use; None when it is not installed.
+
+    The SDK pulls in `requests` and friends, which only the two payment
+    views need, so workers don't pay for it at boot.
+    """
+    try:
+        import razorpay
+    except Exception:
+        return None
+    return razorpay
+
+
 def health(request):
     """Simple health endpoint used by Render and post-deploy checks.
 
@@ -52,6 +64,26 @@ def health(request):
     return JsonResponse(status)
 
 
+def metrics(request):
+    """Prometheus scrape endpoint for the per-view request metrics.
+
+    Readable by staff sessions or with `Authorization: Bearer <METRICS_TOKEN>`.
+    Metrics are collected by `core.middleware.RequestMetricsMiddleware`.
+    """
+    import hmac
+    from django.http import HttpResponse
+    from .metrics import registry
+
+    token = getattr(django_settings, 'METRICS_TOKEN', '')
+    auth = request.headers.get('Authorization', '')
+    provided = auth[7:] if auth.startswith('Bearer ') else ''
+    token_ok = bool(token) and hmac.compare_digest(provided.encode(), token.encode())
+    if not token_ok and not (request.user.is_authenticated and request.user.is_staff):
+        return JsonResponse({'error': 'forbidden'}, status=403)
+
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 def static_check(request):
     """Diagnostic endpoint to list files in STATIC_ROOT and show manifest contents.
 
@@ -110,6 +142,7 @@ def static_check(request):
 def settings(request):
     return render(request, 'settings.html')
 
+@read_only
 def about(request):
     """Render the about page with dynamic AboutPage and AboutSection content."""
     about_page = AboutPage.objects.filter(is_active=True).order_by('-updated_at').first()
@@ -135,6 +168,7 @@ def team(request):
     return render(request, 'team.html')
 
 
+@read_only
 def home(request):
     """Render the home page."""
     return render(request, 'home.html')
@@ -278,6 +312,7 @@ def my_purchase(request):
 
 
 @login_required
+@read_only
 def my_results(request):
     """Show a user's submitted exam attempts and links to detailed results.
 
@@ -285,16 +320,23 @@ def my_results(request):
     a friendly prompt asking them to watch course videos and take the exam.
     """
     from .models import ExamAttempt
+    from .score_distribution import percentile, scores
 
-    attempts = ExamAttempt.objects.filter(course_access__user=request.user, is_submitted=True).select_related('course_access__course').order_by('-submitted_at')
+    attempts = list(ExamAttempt.objects.filter(course_access__user=request.user, is_submitted=True).select_related('course_access__course__exam').defer('results_snapshot', 'answer_vector').order_by('-submitted_at'))
 
-    if not attempts.exists():
+    if not attempts:
         # Friendly prompt when no submitted attempts are found
         return render(request, 'my_results.html', {
             'attempts': [],
             'no_attempts_message': 'Kindly see all videos and attend exam to view results.'
         })
 
+    # Percentile within each exam's cohort, from the cached score distributions
+    for attempt in attempts:
+        course = attempt.course_access.course
+        exam = getattr(course, 'exam', None)
+        attempt.percentile = exam and percentile(scores(exam.id, course.id), attempt.score_percentage)
+
     return render(request, 'my_results.html', {
         'attempts': attempts,
         'no_attempts_message': None,
@@ -440,6 +482,7 @@ def course_detail(request, slug):
     return render(request, 'course_detail.html', context)
 
 
+@read_only
 def course_detail_by_id(request, course_id):
     """
     Backwards-compatibility helper: if a numeric course URL is used (e.g. /course/3/)
@@ -491,7 +534,7 @@ def mark_video_watched(request, course_id, item_id):
         course_video_set = set(all_course_videos)
 
         # Watched IDs come from VideoPlay rows
-        watched_ids_qs = VideoPlay.objects.filter(user=request.user, course_item__day__course=course).values_list('course_item', flat=True)
+        watched_ids_qs = VideoPlay.objects.filter(user=request.user, course_item__in=course_video_set).values_list('course_item', flat=True)
         try:
             watched_set = set(int(x) for x in watched_ids_qs)
         except Exception:
@@ -595,7 +638,7 @@ def check_course_completion(request, course_id):
         all_course_videos = list(CourseScheduleItem.objects.filter(day__course=course, is_active=True).values_list('id', flat=True))
         course_video_set = set(all_course_videos)
 
-        watched_ids_qs = VideoPlay.objects.filter(user=request.user, course_item__day__course=course).values_list('course_item', flat=True)
+        watched_ids_qs = VideoPlay.objects.filter(user=request.user, course_item__in=course_video_set).values_list('course_item', flat=True)
         try:
             watched_set = set(int(x) for x in watched_ids_qs)
         except Exception:
@@ -669,6 +712,29 @@ def course_checkout(request, slug):
     }
     return render(request, 'checkout/checkout.html', context)
 
+# Checkout form field -> CoursePayment field
+CHECKOUT_FIELDS = {
+    'first_name': 'first_name',
+    'last_name': 'last_name',
+    'email': 'email',
+    'phone': 'phone',
+    'address': 'address',
+    'city': 'city',
+    'state': 'state',
+    'zip': 'zip_code',
+}
+
+
+def _checkout_fields(data):
+    """Billing details from the checkout form, trimmed to the CoursePayment columns."""
+    fields = {}
+    for form_field, model_field in CHECKOUT_FIELDS.items():
+        value = str(data.get(form_field) or '').strip()
+        max_length = CoursePayment._meta.get_field(model_field).max_length
+        fields[model_field] = value[:max_length] if max_length else value
+    return fields
+
+
 @login_required
 def create_order(request, slug):
     """
@@ -683,19 +749,7 @@ def create_order(request, slug):
         # Parse JSON data from request
         data = json.loads(request.body)
 
-        # Save form data in session
-        form_fields = {
-            'first_name': 'checkout_first_name',
-            'last_name': 'checkout_last_name',
-            'email': 'checkout_email',
-            'phone': 'checkout_phone',
-            'address': 'checkout_address',
-            'city': 'checkout_city',
-            'state': 'checkout_state',
-            'zip': 'checkout_zip'
-        }
-        for field, session_key in form_fields.items():
-            request.session[session_key] = data.get(field)
+        razorpay = _razorpay()
 
         # Get configuration from settings - use direct references
         # Get configuration from settings using getattr for safety
@@ -782,7 +836,7 @@ def create_order(request, slug):
 
         # Initialize Razorpay client
         try:
-            if 'razorpay' not in globals() or razorpay is None:
+            if razorpay is None:
                 logger.error('Razorpay package not installed')
                 return JsonResponse({'error': 'Payment gateway not available'}, status=500)
 
@@ -834,6 +888,17 @@ def create_order(request, slug):
             }
             order = client.order.create(data=order_data)
             logger.info(f'Razorpay order created: {order}')
+            # Keep the billing details on a pending payment rather than in the
+            # session; payment_callback completes it by order id
+            CoursePayment.objects.create(
+                user=request.user,
+                course=course,
+                order_id=order['id'],
+                amount=course.discounted_price,
+                currency=currency,
+                status='pending',
+                **_checkout_fields(data),
+            )
             return JsonResponse({
                 'id': order['id'],
                 'amount': order['amount'],
@@ -865,6 +930,7 @@ def create_order(request, slug):
 
 @csrf_exempt
 @login_required
+@idempotent
 def payment_callback(request, slug):
     """
     Handle Razorpay payment callback.
@@ -875,6 +941,8 @@ def payment_callback(request, slug):
     course = get_object_or_404(Course, slug=slug, is_active=True)
     
     try:
+        razorpay = _razorpay()
+
         # Get configuration from settings using getattr for safety
         enabled = getattr(django_settings, 'RAZORPAY_ENABLED', False)
         key_id = getattr(django_settings, 'RAZORPAY_KEY_ID', '')
@@ -960,9 +1028,24 @@ def payment_callback(request, slug):
                     status=400
                 )
             
-            # Get or create payment record
+            # Complete the pending payment created by create_order
             payment = CoursePayment.objects.filter(order_id=params_dict['razorpay_order_id']).first()
-            if not payment:
+            if payment and (payment.user_id != request.user.id or payment.course_id != course.id):
+                # A valid signature only proves the order was paid, not that
+                # it was this user's order for this course
+                logger.warning(f'Order {payment.order_id} does not belong to user {request.user.id} and course {course.id}')
+                return JsonResponse(
+                    {'error': 'Payment verification failed', 'detail': 'order does not match this checkout'},
+                    status=400
+                )
+            if payment:
+                if payment.status != 'successful':
+                    payment.payment_id = params_dict['razorpay_payment_id']
+                    payment.status = 'successful'
+                    payment.save(update_fields=['payment_id', 'status', 'updated_at'])
+            else:
+                # Orders created before checkout details moved out of the
+                # session have no pending record
                 payment = CoursePayment(
                     user=request.user,
                     course=course,
@@ -992,7 +1075,7 @@ def payment_callback(request, slug):
                 }
             )
             
-            # Clear checkout session data
+            # Clear checkout data left in the session by older orders
             checkout_fields = [
                 'checkout_first_name', 'checkout_last_name', 'checkout_email',
                 'checkout_phone', 'checkout_address', 'checkout_city',
@@ -1044,7 +1127,7 @@ def payment_debug(request):
         'KEY_ID_present': bool(getattr(django_settings, 'RAZORPAY_KEY_ID', '')),
         'KEY_SECRET_present': bool(getattr(django_settings, 'RAZORPAY_KEY_SECRET', '')),
         'CURRENCY': getattr(django_settings, 'RAZORPAY_CURRENCY', 'INR'),
-        'razorpay_package_importable': (razorpay is not None),
+        'razorpay_package_importable': getattr(django_settings, 'RAZORPAY_PACKAGE_AVAILABLE', False),
     }
     # Also report any local razorpay_config.py values for clarity
     try:
@@ -0,0 +1,129 @@
+"""
+Gunicorn configuration, loaded by `start.sh` with `gunicorn -c gunicorn.conf.py`.
+
+Workers and threads are sized from the CPUs and memory the container can
+actually use (cgroup limits, not the host's), and every setting can be
+overridden from the environment:
+
+  WEB_CONCURRENCY            worker processes
+  GUNICORN_WORKER_CLASS      sync | gthread | uvicorn.workers.UvicornWorker
+  GUNICORN_THREADS           threads per gthread worker (default 4)
+  GUNICORN_WORKER_MEMORY_MB  expected RSS per worker, caps the worker count (default 160)
+  GUNICORN_PRELOAD           load the app once in the master (default true)
+  GUNICORN_MAX_REQUESTS      recycle a worker after N requests (default 1000, 0 = never)
+  GUNICORN_MAX_REQUESTS_JITTER  random extra requests per worker (default 100)
+  GUNICORN_KEEPALIVE         seconds to hold an idle keep-alive connection (default 5)
+  GUNICORN_TIMEOUT           worker timeout in seconds (default 120)
+
+`scripts/bench_workers.py` compares the worker classes on our own views;
+rerun it before changing the defaults.
+"""
+
+import os
+
+ASGI_ENABLED = os.environ.get('ASGI_ENABLED', 'false').lower() == 'true'
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_count():
+    """CPUs available to this process, honouring a cgroup CPU quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    quota = _read('/sys/fs/cgroup/cpu.max')  # cgroup v2: "<quota> <period>" or "max <period>"
+    if quota and not quota.startswith('max'):
+        limit, period = (int(x) for x in quota.split())
+        cpus = min(cpus, max(1, limit // period))
+    return max(1, cpus)
+
+
+def memory_mb():
+    """Memory available to this process in MB (cgroup limit, else physical RAM)."""
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        value = _read(path)
+        # v1 reports "no limit" as a huge number
+        if value and value.isdigit() and int(value) < 1 << 50:
+            return int(value) // (1024 * 1024)
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+def _default_workers(klass, cpus):
+    # sync workers block on every query, so oversubscribe the CPUs; gthread
+    # and uvicorn workers already overlap I/O inside a process
+    if klass == 'sync':
+        return 2 * cpus + 1
+    if klass == 'gthread':
+        return cpus + 1
+    return cpus
+
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS') or (
+    'uvicorn.workers.UvicornWorker' if ASGI_ENABLED else 'gthread'
+)
+wsgi_app = 'Online_Course.asgi:application' if ASGI_ENABLED else 'Online_Course.wsgi:application'
+
+CPUS = cpu_count()
+MEMORY_MB = memory_mb()
+WORKER_MEMORY_MB = _env_int('GUNICORN_WORKER_MEMORY_MB', 160)
+
+workers = _default_workers(worker_class, CPUS)
+if MEMORY_MB:
+    # Leave a fifth of the memory for the master, page cache and spikes
+    workers = min(workers, int(MEMORY_MB * 0.8) // WORKER_MEMORY_MB)
+workers = max(1, _env_int('WEB_CONCURRENCY', workers))
+threads = _env_int('GUNICORN_THREADS', 4) if worker_class == 'gthread' else 1
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Import Django once in the master; forked workers share those pages
+# copy-on-write, which keeps per-worker RSS and boot time down. A HUP then
+# reloads config but not code: deploys restart the master.
+preload_app = (os.environ.get('GUNICORN_PRELOAD') or 'true').lower() == 'true'
+
+# Recycle workers to bound slow leaks; the jitter keeps them from all
+# restarting in the same second
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', 100) if max_requests else 0
+
+# Render's proxy reuses upstream connections; a short keep-alive saves a TCP
+# handshake per request without parking sync workers on idle sockets
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+timeout = _env_int('GUNICORN_TIMEOUT', 120)
+graceful_timeout = 30
+
+# Heartbeat files on tmpfs: a slow container disk can't stall workers into timeouts
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = '-'
+errorlog = '-'
+
+
+def on_starting(server):
+    server.log.info(
+        'Sizing: %s CPU(s), %s MB memory -> %d %s worker(s) x %d thread(s), preload=%s',
+        CPUS, MEMORY_MB or 'unknown', workers, worker_class, threads, preload_app,
+    )
+
+
+def post_fork(server, worker):
+    # Never share a database socket opened in the master before forking
+    if preload_app:
+        from django.db import connections
+        connections.close_all()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Compare gunicorn worker models on our own views.
+
+For each worker model this starts gunicorn with `gunicorn.conf.py` (sizing
+overridden from the command line), drives it with the session classes from
+`loadtest_exam.py`, records latency, throughput, errors and the total RSS of
+the worker processes, then stops it. Models:
+
+  sync      one request per process (2 x CPU + 1 processes by default)
+  gthread   a thread pool per process (--threads)
+  uvicorn   Online_Course.asgi with uvicorn workers (async poll endpoints)
+
+Scenarios:
+
+  browse    each user logs in, then repeatedly loads My Purchases, My
+            Results and the course completion / exam eligibility polls.
+            Read-mostly, so runs are repeatable.
+  exam      the full cohort from loadtest_exam.py (start, answer, submit).
+            Exam attempts are deleted for the synthetic users before each
+            model so every run starts from the same state.
+
+Usage (against the local dev database):
+  python manage.py generate_benchmark_data --users 200 --courses 1
+  DEBUG=true python scripts/bench_workers.py --course-id 1 --users 200 \\
+      --concurrency 50 --models sync gthread uvicorn --json workers.json
+
+DEBUG=true is only there so the server accepts plain HTTP; it costs every
+model the same. Compare models from runs on the same machine and database.
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from loadtest_exam import ExamSession, Stats, aiohttp, print_report  # noqa: E402
+
+MODELS = {
+    'sync': {'GUNICORN_WORKER_CLASS': 'sync', 'ASGI_ENABLED': 'false'},
+    'gthread': {'GUNICORN_WORKER_CLASS': 'gthread', 'ASGI_ENABLED': 'false'},
+    'uvicorn': {'GUNICORN_WORKER_CLASS': 'uvicorn.workers.UvicornWorker', 'ASGI_ENABLED': 'true'},
+}
+
+
+class BrowseSession(ExamSession):
+    """A logged-in student moving between the dashboard pages and polls."""
+
+    async def run(self):
+        timeout = aiohttp.ClientTimeout(total=self.args.timeout)
+        jar = aiohttp.CookieJar(unsafe=True)
+        async with aiohttp.ClientSession(cookie_jar=jar, timeout=timeout) as session:
+            await self._request(session, 'login_page', 'GET', '/login/')
+            csrf = session.cookie_jar.filter_cookies(self.base_url).get('csrftoken')
+            form = {'email': self.email, 'password': self.args.password}
+            if csrf is not None:
+                form['csrfmiddlewaretoken'] = csrf.value
+            resp, _ = await self._request(session, 'login', 'POST', '/login/', data=form)
+            if resp is None or resp.status != 302:
+                return
+
+            course = self.args.course_id
+            pages = [
+                ('my_purchase', '/my-purchase/'),
+                ('my_results', '/my-results/'),
+                ('check_course_completion', f'/course/{course}/check-completion/'),
+                ('exam_check_eligibility', f'/course/{course}/exam/check-eligibility/'),
+            ]
+            for _ in range(self.args.iterations):
+                for endpoint, path in pages:
+                    await self._request(session, endpoint, 'GET', path)
+                    await self.think()
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _wait_until_up(port, proc, deadline=60.0):
+    end = time.monotonic() + deadline
+    while time.monotonic() < end:
+        if proc.poll() is not None:
+            raise RuntimeError(f'gunicorn exited with status {proc.returncode}')
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('gunicorn did not start listening in time')
+
+
+def _children(pid):
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            return [int(p) for p in f.read().split()]
+    except OSError:
+        return []
+
+
+def _rss_mb(pid):
+    """Resident set size from /proc (Linux only; None elsewhere)."""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def _reset_exam_attempts(args):
+    """Delete exam attempts of the synthetic users so the exam scenario can rerun."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Online_Course.settings')
+    sys.path.insert(0, str(ROOT))
+    import django
+    django.setup()
+    from core.models import ExamAttempt
+
+    prefix = args.user_template.split('{', 1)[0]
+    ExamAttempt.objects.filter(
+        course_access__user__email__startswith=prefix,
+        course_access__course_id=args.course_id,
+    ).delete()
+
+
+async def _drive(args, base_url):
+    stats = Stats()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    session_class = BrowseSession if args.scenario == 'browse' else ExamSession
+    args.base_url = base_url
+
+    async def run_one(index):
+        async with semaphore:
+            await session_class(args, stats, index).run()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(i) for i in range(args.users)))
+    return stats.report(time.perf_counter() - start)
+
+
+def bench_model(name, args):
+    port = _free_port()
+    env = dict(os.environ, PORT=str(port), **MODELS[name])
+    if args.workers:
+        env['WEB_CONCURRENCY'] = str(args.workers)
+    if args.threads:
+        env['GUNICORN_THREADS'] = str(args.threads)
+    env['GUNICORN_PRELOAD'] = 'true' if args.preload else 'false'
+    env.setdefault('METRICS_ENABLED', 'false')
+
+    if args.scenario == 'exam':
+        _reset_exam_attempts(args)
+
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{port}',
+         '--access-logfile', '/dev/null'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=None if args.verbose else subprocess.DEVNULL,
+    )
+    try:
+        _wait_until_up(port, proc)
+        report = asyncio.run(_drive(args, f'http://127.0.0.1:{port}'))
+        workers = _children(proc.pid)
+        rss = [_rss_mb(pid) for pid in workers]
+        report['model'] = name
+        report['workers'] = len(workers)
+        report['worker_rss_mb'] = round(sum(r for r in rss if r), 1) if any(rss) else None
+        return report
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def print_summary(reports):
+    header = f"{'model':<10}{'workers':>8}{'reqs':>8}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>9}{'RSS MB':>9}"
+    print(header)
+    print('-' * len(header))
+    for report in reports:
+        samples = report['endpoints']
+        total = report['requests'] or 1
+        # Request-weighted percentiles across endpoints
+        p = {k: sum(r[k] * r['requests'] for r in samples) / total for k in ('p50_ms', 'p95_ms', 'p99_ms')}
+        rps = report['requests'] / report['wall_seconds'] if report['wall_seconds'] else 0.0
+        rss = report['worker_rss_mb'] if report['worker_rss_mb'] is not None else '-'
+        print(f"{report['model']:<10}{report['workers']:>8}{report['requests']:>8}{rps:>9.1f}"
+              f"{p['p50_ms']:>9.1f}{p['p95_ms']:>9.1f}{p['p99_ms']:>9.1f}{report['error_rate']:>9.2%}{rss:>9}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark gunicorn worker models on the app views.')
+    parser.add_argument('--models', nargs='+', choices=sorted(MODELS), default=['sync', 'gthread', 'uvicorn'])
+    parser.add_argument('--scenario', choices=['browse', 'exam'], default='browse')
+    parser.add_argument('--course-id', type=int, required=True)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--iterations', type=int, default=5, help='Page rounds per user (browse)')
+    parser.add_argument('--workers', type=int, default=None, help='Override WEB_CONCURRENCY for every model')
+    parser.add_argument('--threads', type=int, default=None, help='Threads per gthread worker')
+    parser.add_argument('--no-preload', dest='preload', action='store_false')
+    parser.add_argument('--user-template', default='bench{n}@example.com')
+    parser.add_argument('--password', default='bench-password')
+    parser.add_argument('--answers', type=int, default=20, help='Questions answered per user (exam)')
+    parser.add_argument('--think-time', type=float, default=0.0)
+    parser.add_argument('--poll-interval', type=float, default=10.0)
+    parser.add_argument('--violation-rate', type=float, default=0.0)
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', dest='json_path', help='Write all reports as JSON to this path')
+    parser.add_argument('--verbose', action='store_true', help='Show gunicorn logs')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    reports = []
+    for name in args.models:
+        print(f'== {name} ==')
+        report = bench_model(name, args)
+        print_report(report)
+        print()
+        reports.append(report)
+    print_summary(reports)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
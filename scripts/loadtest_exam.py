@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Exam-cohort load generator.
+
+Replays the request mix of a scheduled exam against a running server: many
+students log in, start the exam, open the portal, load questions, answer
+them one by one while the portal polls the timer, and submit.
+
+Usage:
+  python scripts/loadtest_exam.py --base-url http://127.0.0.1:8000 \\
+      --course-id 1 --users 300 --concurrency 100
+
+Prerequisites:
+  - Synthetic users `bench{n}@example.com` (n = 0..users-1) sharing one
+    password, each enrolled in the course, with exam attempts remaining.
+    Reset consumed attempts between runs with
+    `python manage.py reset_exam_attempts --email bench0@example.com`.
+  - A server that does not force HTTPS, e.g. `DEBUG=true` locally or a
+    gunicorn started with SECURE_SSL_REDIRECT disabled behind a proxy.
+
+Reports p50/p95/p99 latency, throughput and error rate per endpoint.
+Exits non-zero when the overall error rate exceeds --max-error-rate.
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover - dependency hint for operators
+    print('aiohttp is required: pip install aiohttp')
+    sys.exit(2)
+
+
+ATTEMPT_RE = re.compile(r'/exam/(\d+)/')
+
+
+class Stats:
+    """Latency samples and error counts keyed by endpoint name."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.status_codes = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint, seconds, status):
+        self.latencies[endpoint].append(seconds)
+        self.status_codes[endpoint][status] += 1
+        if status == 'exc' or status >= 400:
+            self.errors[endpoint] += 1
+
+    def report(self, wall_seconds):
+        rows = []
+        total = total_errors = 0
+        for endpoint in sorted(self.latencies):
+            samples = sorted(self.latencies[endpoint])
+            n = len(samples)
+            errors = self.errors[endpoint]
+            total += n
+            total_errors += errors
+            rows.append({
+                'endpoint': endpoint,
+                'requests': n,
+                'rps': round(n / wall_seconds, 2) if wall_seconds else 0.0,
+                'p50_ms': round(_percentile(samples, 50) * 1000, 1),
+                'p95_ms': round(_percentile(samples, 95) * 1000, 1),
+                'p99_ms': round(_percentile(samples, 99) * 1000, 1),
+                'max_ms': round(samples[-1] * 1000, 1),
+                'error_rate': round(errors / n, 4) if n else 0.0,
+                'status_codes': {str(k): v for k, v in self.status_codes[endpoint].items()},
+            })
+        return {
+            'wall_seconds': round(wall_seconds, 2),
+            'requests': total,
+            'errors': total_errors,
+            'error_rate': round(total_errors / total, 4) if total else 0.0,
+            'endpoints': rows,
+        }
+
+
+def _percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_samples))))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class ExamSession:
+    """One synthetic student taking the exam from login to submit."""
+
+    def __init__(self, args, stats, index):
+        self.args = args
+        self.stats = stats
+        self.email = args.user_template.format(n=index)
+        self.rng = random.Random(args.seed + index)
+        self.base = args.base_url.rstrip('/')
+        self.base_url = URL(self.base)
+
+    async def _request(self, session, endpoint, method, path, **kwargs):
+        headers = kwargs.pop('headers', {})
+        csrf = session.cookie_jar.filter_cookies(self.base_url).get('csrftoken')
+        if method == 'POST' and csrf is not None:
+            headers['X-CSRFToken'] = csrf.value
+            headers.setdefault('Referer', self.base + '/')
+        start = time.perf_counter()
+        try:
+            async with session.request(method, self.base + path, headers=headers,
+                                       allow_redirects=False, **kwargs) as resp:
+                body = await resp.read()
+                self.stats.record(endpoint, time.perf_counter() - start, resp.status)
+                return resp, body
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.stats.record(endpoint, time.perf_counter() - start, 'exc')
+            return None, b''
+
+    async def think(self):
+        if self.args.think_time > 0:
+            await asyncio.sleep(self.rng.uniform(0.5, 1.5) * self.args.think_time)
+
+    async def run(self):
+        timeout = aiohttp.ClientTimeout(total=self.args.timeout)
+        jar = aiohttp.CookieJar(unsafe=True)  # allow cookies for IP hosts
+        async with aiohttp.ClientSession(cookie_jar=jar, timeout=timeout) as session:
+            await self._request(session, 'login_page', 'GET', '/login/')
+            csrf = session.cookie_jar.filter_cookies(self.base_url).get('csrftoken')
+            form = {'email': self.email, 'password': self.args.password}
+            if csrf is not None:
+                form['csrfmiddlewaretoken'] = csrf.value
+            resp, _ = await self._request(session, 'login', 'POST', '/login/', data=form)
+            if resp is None or resp.status != 302:
+                return
+
+            course = self.args.course_id
+            await self._request(session, 'exam_check_eligibility', 'GET',
+                                f'/course/{course}/exam/check-eligibility/')
+            resp, _ = await self._request(session, 'exam_start', 'GET', f'/course/{course}/exam/start/')
+            match = ATTEMPT_RE.search(resp.headers.get('Location', '')) if resp is not None else None
+            if match is None:
+                return
+            attempt = match.group(1)
+
+            await self._request(session, 'exam_portal', 'GET', f'/exam/{attempt}/')
+            resp, body = await self._request(session, 'exam_get_questions', 'GET',
+                                             f'/exam/{attempt}/get-questions/')
+            if resp is None or resp.status != 200:
+                return
+            questions = json.loads(body).get('questions', [])
+            if self.args.answers is not None:
+                questions = questions[:self.args.answers]
+
+            last_poll = time.monotonic()
+            for question in questions:
+                await self.think()
+                payload = {'question_id': question['id'], 'selected_answer': self.rng.choice('ABCD')}
+                await self._request(session, 'exam_save_answer', 'POST', f'/exam/{attempt}/save-answer/',
+                                    json=payload)
+                if self.rng.random() < self.args.violation_rate:
+                    await self._request(session, 'exam_record_violation', 'POST',
+                                        f'/exam/{attempt}/record-violation/',
+                                        json={'violation_type': 'tab_switch', 'description': 'loadtest'})
+                # The portal re-syncs its timer every poll interval
+                if time.monotonic() - last_poll >= self.args.poll_interval:
+                    last_poll = time.monotonic()
+                    await self._request(session, 'exam_time_left', 'GET', f'/exam/{attempt}/time-left/')
+
+            await self._request(session, 'exam_submit', 'POST', f'/exam/{attempt}/submit/', json={})
+
+
+async def main_async(args):
+    stats = Stats()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run_one(index):
+        # Spread session starts over the ramp-up window
+        if args.ramp_up > 0:
+            await asyncio.sleep(args.ramp_up * index / max(1, args.users))
+        async with semaphore:
+            await ExamSession(args, stats, index).run()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(i) for i in range(args.users)))
+    return stats.report(time.perf_counter() - start)
+
+
+def print_report(report):
+    header = f"{'endpoint':<24}{'reqs':>7}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>9}"
+    print(header)
+    print('-' * len(header))
+    for row in report['endpoints']:
+        print(f"{row['endpoint']:<24}{row['requests']:>7}{row['rps']:>9}{row['p50_ms']:>10}"
+              f"{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}{row['error_rate']:>9.2%}")
+    print('-' * len(header))
+    print(f"{report['requests']} requests in {report['wall_seconds']}s, "
+          f"error rate {report['error_rate']:.2%}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Replay an exam cohort against a running server.')
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--course-id', type=int, required=True, help='Course whose exam is taken')
+    parser.add_argument('--users', type=int, default=100, help='Number of synthetic students')
+    parser.add_argument('--concurrency', type=int, default=50, help='Sessions in flight at once')
+    parser.add_argument('--user-template', default='bench{n}@example.com', help='Login email, {n} = user index')
+    parser.add_argument('--password', default='bench-password')
+    parser.add_argument('--answers', type=int, default=None, help='Answer only the first N questions')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Mean seconds between answers')
+    parser.add_argument('--poll-interval', type=float, default=10.0, help='Seconds between time-left polls')
+    parser.add_argument('--violation-rate', type=float, default=0.02, help='Chance of a violation per answer')
+    parser.add_argument('--ramp-up', type=float, default=0.0, help='Seconds over which sessions start')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', dest='json_path', help='Also write the report as JSON to this path')
+    parser.add_argument('--max-error-rate', type=float, default=0.01)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if report['error_rate'] > args.max_error_rate:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Measure time-to-first-request of the start.sh boot sequence.
+
+Runs the pre-boot step, starts gunicorn with gunicorn.conf.py and polls
+/healthz/ until it answers 200. Modes:
+
+  legacy    `manage.py migrate` + `manage.py collectstatic` (the old start.sh)
+  fast      `manage.py boot_check` (skips both when nothing changed)
+  none      gunicorn only, the floor for comparison
+
+Usage:
+  DEBUG=true python scripts/measure_boot.py --modes legacy fast none --runs 3
+
+Run `python manage.py boot_check` once first so both modes start from an
+up-to-date database and STATIC_ROOT; the numbers then show the cost of a
+plain restart, which is what every deploy and crash recovery pays.
+"""
+import argparse
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PRE_BOOT = {
+    'legacy': [['manage.py', 'migrate', '--no-input'], ['manage.py', 'collectstatic', '--no-input']],
+    'fast': [['manage.py', 'boot_check']],
+    'none': [],
+}
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def measure(mode, timeout=120.0):
+    """Seconds from launch to the first 200 from /healthz/, and the pre-boot share."""
+    port = _free_port()
+    env = dict(os.environ, PORT=str(port))
+    start = time.perf_counter()
+    for command in PRE_BOOT[mode]:
+        subprocess.run([sys.executable, *command], cwd=ROOT, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+    pre_boot = time.perf_counter() - start
+
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{port}'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        url = f'http://127.0.0.1:{port}/healthz/'
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f'gunicorn exited with status {proc.returncode}')
+            try:
+                with urllib.request.urlopen(url, timeout=1) as resp:
+                    if resp.status == 200:
+                        return time.perf_counter() - start, pre_boot
+            except (urllib.error.URLError, ConnectionError, OSError):
+                pass
+            time.sleep(0.05)
+        raise RuntimeError('no 200 from /healthz/ before the timeout')
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure time-to-first-request per boot mode.')
+    parser.add_argument('--modes', nargs='+', choices=sorted(PRE_BOOT), default=['legacy', 'fast'])
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<10}{'first request s':>18}{'pre-boot s':>13}")
+    for mode in args.modes:
+        samples = [measure(mode) for _ in range(args.runs)]
+        total = statistics.median(s[0] for s in samples)
+        pre = statistics.median(s[1] for s in samples)
+        print(f'{mode:<10}{total:>18.2f}{pre:>13.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """
 Reset development data script
-- Backs up the SQLite database (timestamped copy)
+- Backs up the SQLite database (`manage.py backup_db` snapshot)
 - Deletes all non-superuser users and related user-generated records
-- Produces a restore PowerShell script to roll back by copying the backup file back
+- Prints the `manage.py restore_db` command that rolls it back
 
 USAGE: run from project root where `manage.py` lives:
     venv\Scripts\Activate
@@ -14,7 +14,6 @@ if the default database is not SQLite (to avoid accidental production runs).
 """
 import os
 import sys
-import shutil
 import datetime
 import csv
 from pathlib import Path
@@ -34,6 +33,8 @@ except Exception as e:
 
 from django.conf import settings
 from django.db import transaction
+from core.backup import backup_sqlite
+from core.db_routing import pk_values
 from django.contrib.auth import get_user_model
 
 # Import models we'll clean
@@ -52,10 +53,8 @@ if not DB_PATH.is_absolute():
 TIMESTAMP = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
 BACKUP_DIR = PROJECT_ROOT / 'db_backups'
 BACKUP_DIR.mkdir(parents=True, exist_ok=True)
-BACKUP_FILE = BACKUP_DIR / f'db_backup_{TIMESTAMP}.sqlite3'
 DELETED_USERS_CSV = BACKUP_DIR / f'deleted_users_{TIMESTAMP}.csv'
 SUMMARY_FILE = BACKUP_DIR / f'delete_summary_{TIMESTAMP}.txt'
-RESTORE_SCRIPT = BACKUP_DIR / f'restore_db_from_backup_{TIMESTAMP}.ps1'
 
 # Safety checks
 if not settings.DEBUG:
@@ -74,7 +73,7 @@ if not DB_PATH.exists():
 # Backup
 print('Creating backup of database...')
 try:
-    shutil.copy2(str(DB_PATH), str(BACKUP_FILE))
+    BACKUP_FILE = backup_sqlite(DB_PATH, BACKUP_DIR)
     print('Backup created at:', BACKUP_FILE)
 except Exception as e:
     print('Failed to create backup:', e)
@@ -121,7 +120,8 @@ from django.db import connection
 with transaction.atomic():
     # Video plays
     try:
-        vp_qs = core_models.VideoPlay.objects.filter(user__isnull=False, user__is_superuser=False)
+        vp_qs = core_models.VideoPlay.objects.filter(
+            user__in=pk_values(User.objects.filter(is_superuser=False), core_models.VideoPlay))
         c = count_and_delete(vp_qs)
         summary_lines.append(f'VideoPlay rows deleted: {c}')
     except Exception as e:
@@ -129,14 +129,16 @@ with transaction.atomic():
 
     # Exam answers and violations and attempts (cascade via CourseAccess but explicit for clarity)
     try:
-        ea_qs = core_models.ExamAnswer.objects.filter(attempt__course_access__user__is_superuser=False)
+        ea_qs = core_models.ExamAnswer.objects.filter(attempt__in=pk_values(
+            core_models.ExamAttempt.objects.filter(course_access__user__is_superuser=False), core_models.ExamAnswer))
         c = count_and_delete(ea_qs)
         summary_lines.append(f'ExamAnswer rows deleted: {c}')
     except Exception as e:
         summary_lines.append(f'ExamAnswer deletion error: {e}')
 
     try:
-        ev_qs = core_models.ExamViolation.objects.filter(attempt__course_access__user__is_superuser=False)
+        ev_qs = core_models.ExamViolation.objects.filter(attempt__in=pk_values(
+            core_models.ExamAttempt.objects.filter(course_access__user__is_superuser=False), core_models.ExamViolation))
         c = count_and_delete(ev_qs)
         summary_lines.append(f'ExamViolation rows deleted: {c}')
     except Exception as e:
@@ -195,14 +197,8 @@ print('\nDeletion summary:')
 for line in summary_lines:
     print(line)
 
-# Create restore PowerShell script
-restore_cmd = f"Copy-Item -Path \"{BACKUP_FILE}\" -Destination \"{DB_PATH}\" -Force\nWrite-Host 'Database restored from {BACKUP_FILE} to {DB_PATH}. Restart your Django server if running.'\n"
-with open(RESTORE_SCRIPT, 'w', encoding='utf-8') as f:
-    f.write(restore_cmd)
-
-print('\nA restore script was written to:', RESTORE_SCRIPT)
-print('To roll back, run this PowerShell script (from project root):')
-print(f'  powershell -ExecutionPolicy Bypass -File "{RESTORE_SCRIPT}"')
+print('\nTo roll back, run (from project root):')
+print(f'  python manage.py restore_db "{BACKUP_FILE}"')
 print('\nOperation complete.')
 print(f'Backup file: {BACKUP_FILE}')
 print(f'Deleted users CSV: {DELETED_USERS_CSV}')
@@ -1,10 +1,12 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-# Run migrations and collectstatic, then exec gunicorn. Using exec so signals
-# are forwarded correctly.
-python manage.py migrate --no-input
-python manage.py collectstatic --no-input
+# The build already migrates and collects static files; boot_check only runs
+# either step when migration files are unapplied or the static sources changed,
+# so a plain restart goes straight to gunicorn.
+python manage.py boot_check
 
-# Exec gunicorn so it becomes PID 1 in the container/process and receives signals
-exec gunicorn --bind 0.0.0.0:$PORT Online_Course.wsgi:application --timeout 120 --workers 4 --access-logfile - --error-logfile -
+# Exec gunicorn so it becomes PID 1 in the container/process and receives signals.
+# Worker count, class, threads, preload and recycling live in gunicorn.conf.py;
+# ASGI_ENABLED=true switches it to Online_Course.asgi with uvicorn workers.
+exec gunicorn -c gunicorn.conf.py